@@ -85,6 +85,10 @@ def build_controls(maker: "WayfairFlatMaker") -> None:
         disabled=True,
     )
     maker.suggest_progress_ring = ft.ProgressRing(visible=False, width=24, height=24)
+    maker.fresh_ai_switch = ft.Switch(
+        label=maker._("Skip cached AI results"),
+        on_change=cast(Any, maker.speculate_marketing_texts),
+    )
     maker.main_image_note = ft.Text(
         maker._(MAIN_IMAGE_WARNING),
         color=ft.Colors.ORANGE_700,
@@ -114,6 +118,22 @@ def build_controls(maker: "WayfairFlatMaker") -> None:
         controls=[maker.submit_button, maker.progress_ring, maker.success_icon],
         alignment=ft.MainAxisAlignment.CENTER,
     )
+    maker.price_age_text = ft.Text("", size=12, color=ft.Colors.GREY_600)
+    maker.refresh_prices_button = ft.IconButton(
+        ft.Icons.REFRESH,
+        icon_size=16,
+        tooltip=maker._("Refresh prices"),
+        on_click=cast(Any, maker.on_refresh_prices_click),
+    )
+    maker.price_age_row = ft.Row(
+        controls=[maker.price_age_text, maker.refresh_prices_button],
+        alignment=ft.MainAxisAlignment.CENTER,
+        visible=False,
+    )
+    maker.jobs_column = ft.Column(
+        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+        spacing=4,
+    )
     maker.sizes_label = ft.Text(maker._("Sizes"), size=20)
     maker.print_type_dd = ft.Dropdown(
         label=maker._("Print Type"),
@@ -130,6 +150,7 @@ def build_controls(maker: "WayfairFlatMaker") -> None:
         width=500,
         expand=True,
         max_length=255,
+        on_change=cast(Any, maker.speculate_marketing_texts),
     )
     maker.sku_field = ft.TextField(
         label="SKU",
@@ -143,6 +164,7 @@ def build_controls(maker: "WayfairFlatMaker") -> None:
         width=500,
         hint_text=maker._("e.g. (in plural): Dog Wall Stickers"),
         expand=True,
+        on_change=cast(Any, maker.speculate_marketing_texts),
     )
 
     maker.sizes_column.controls.append(maker.make_size_row(0))
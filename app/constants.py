@@ -18,6 +18,9 @@ URL_PATTERN: Pattern[str] = re.compile(r"(?i)(https?://|www\.|dropbox\.com)")
 ERROR_HIGHLIGHT_DURATION_SECONDS: int = 5
 ERROR_SNACKBAR_DURATION_MS: int = 7000
 SUCCESS_SNACKBAR_DURATION_MS: int = 4500
+PRICE_AGE_REFRESH_SECONDS: int = 30
+MARKETING_PREFETCH_DEBOUNCE_SECONDS: float = 1.5
+IMAGE_PREFETCH_DEBOUNCE_SECONDS: float = 0.5
 
 WALLPAPER_SIZE_PRESETS: tuple[SizePreset, ...] = (
     (8, 10),
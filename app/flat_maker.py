@@ -8,20 +8,38 @@ from typing import cast
 import flet as ft
 
 from app.builder import build_controls
+from app.constants import (
+    ERROR_SNACKBAR_DURATION_MS,
+    IMAGE_PREFETCH_DEBOUNCE_SECONDS,
+    MARKETING_PREFETCH_DEBOUNCE_SECONDS,
+    PRICE_AGE_REFRESH_SECONDS,
+)
 from app.controls import build_counter_buttons, build_image_link_row, build_size_row
 from app.helpers import contains_link, extract_hint_value, get_hint_sets, is_valid_url
 from app.gemini import GeminiClient, GeminiUserError
-from app.submission import clear_errors, submit_form, validate_fields
+from app.jobs import ExportJobQueue, ExportJobRecord
+from app.prefetch import ImagePrefetcher, MarketingTextPrefetcher
+from app.settings import settings
+from app.submission import (
+    clear_errors,
+    describe_export_error,
+    run_export_job,
+    submit_form,
+    validate_fields,
+)
 from app.ui_ops import (
     add_image_link,
     add_size,
     apply_i18n,
     handle_print_type_change,
     init_ui,
+    remove_export_job_entry,
     remove_image_link,
     remove_size,
+    render_export_job,
     reset_dynamic_controls,
     reset_form,
+    update_price_age,
 )
 from app.validation import (
     require_dropdown,
@@ -31,7 +49,13 @@ from app.validation import (
     validation_summary_message,
 )
 from app.version import get_page_title
-from data.pricing import PriceProvider
+from data.price_sources import (
+    FilePriceSource,
+    PriceProviderFactory,
+    UnavailablePriceSource,
+)
+from data.price_watcher import PriceFileWatcher
+from data.pricing import PriceProvider, PriceSourceError
 from i18n import get_translator
 
 Translator = Callable[[str], str]
@@ -66,6 +90,7 @@ class WayfairFlatMaker:
     suggest_button_text: ft.Text
     suggest_button: ft.ElevatedButton
     suggest_progress_ring: ft.ProgressRing
+    fresh_ai_switch: ft.Switch
     main_image_note: ft.Text
     image_buttons_row: ft.Row
     folder_picker: ft.FilePicker
@@ -74,13 +99,22 @@ class WayfairFlatMaker:
     progress_ring: ft.ProgressRing
     success_icon: ft.Icon
     submit_row: ft.Row
+    price_age_text: ft.Text
+    refresh_prices_button: ft.IconButton
+    price_age_row: ft.Row
+    jobs_column: ft.Column
+    job_entries: dict[int, ft.Row]
+    job_queue: ExportJobQueue
     sizes_label: ft.Text
     print_type_dd: ft.Dropdown
     title_field: ft.TextField
     sku_field: ft.TextField
     keyword_field: ft.TextField
     price_provider: PriceProvider
+    price_watcher: PriceFileWatcher | None
     gemini_client: GeminiClient
+    marketing_prefetcher: MarketingTextPrefetcher
+    image_prefetcher: ImagePrefetcher
 
     def __init__(self, page: ft.Page, lang: str, prefs: ft.SharedPreferences) -> None:
         """Initialize the page, translator, and top-level controls."""
@@ -91,20 +125,115 @@ class WayfairFlatMaker:
         self.prefs = prefs
         self._ = get_translator(lang=self.lang)
         self.validation_error_kinds: set[str] = set()
-        self.price_provider = PriceProvider()
+        try:
+            self.price_provider = PriceProviderFactory.create_provider(
+                settings.price_source,
+                settings.price_source_location,
+                ttl_seconds=settings.price_ttl_seconds,
+            )
+        except PriceSourceError as exc:
+            self.price_provider = PriceProvider(source=UnavailablePriceSource(exc))
+        self.price_watcher = None
+        if isinstance(self.price_provider.source, FilePriceSource):
+            self.price_watcher = PriceFileWatcher(
+                self.price_provider, self.price_provider.source.path
+            )
+            self.price_watcher.start()
+            self.page.on_connect = self.start_price_watcher
+            self.page.on_disconnect = self.stop_price_watcher
+            self.page.on_close = self.stop_price_watcher
         self.gemini_client = GeminiClient()
+        self.marketing_prefetcher = MarketingTextPrefetcher(
+            self.gemini_client.generate_marketing_texts,
+            debounce_seconds=MARKETING_PREFETCH_DEBOUNCE_SECONDS,
+        )
+        self.image_prefetcher = ImagePrefetcher(
+            self.gemini_client.download_image,
+            debounce_seconds=IMAGE_PREFETCH_DEBOUNCE_SECONDS,
+        )
+        self.job_entries = {}
+        self.job_queue = ExportJobQueue(
+            runner=self.run_export_job,
+            on_update=self.render_export_job,
+            max_workers=settings.export_workers,
+            format_error=self.describe_export_error,
+            on_evict=self.remove_export_job,
+        )
 
         self.build_controls()
         self.init_ui()
         self.page.run_task(self._prefetch_prices)
+        self.page.run_task(self._watch_price_age)
 
     async def _prefetch_prices(self) -> None:
-        """Warm the price cache in the background so the first submit is instant."""
+        """Warm the price cache in the background so the first submit is instant.
+
+        A table loaded from disk is usable right away and is then revalidated
+        against the sheet with a conditional request. A missing or invalid
+        table is reported right away instead of on the first submit.
+        """
 
         try:
-            await asyncio.to_thread(self.price_provider.get_points_by_category)
-        except Exception:
-            pass
+            await asyncio.to_thread(self.price_provider.get_price_table)
+            if self.price_provider.loaded_from_disk:
+                self.price_provider.schedule_refresh()
+        except PriceSourceError as exc:
+            self.show_price_error(exc)
+        self.update_price_age()
+        self.page.update()
+
+    async def _watch_price_age(self) -> None:
+        """Keep the price table age current and refresh tables past their TTL."""
+
+        while True:
+            await asyncio.sleep(PRICE_AGE_REFRESH_SECONDS)
+            if self.price_provider.is_stale():
+                self.price_provider.schedule_refresh()
+            self.update_price_age()
+            self.page.update()
+
+    async def on_refresh_prices_click(self, e: ft.Event[ft.IconButton]) -> None:
+        """Force a price table refresh and show its result."""
+
+        self.refresh_prices_button.disabled = True
+        self.page.update()
+        try:
+            await asyncio.to_thread(self.price_provider.refresh)
+        except PriceSourceError as exc:
+            self.show_price_error(exc)
+        finally:
+            self.refresh_prices_button.disabled = False
+            self.update_price_age()
+            self.page.update()
+
+    def show_price_error(self, exc: PriceSourceError) -> None:
+        """Show why the price table could not be loaded."""
+
+        self.page.show_dialog(
+            ft.SnackBar(
+                ft.Text(self._("Price data is unavailable: %(err)s") % {"err": exc}),
+                duration=ERROR_SNACKBAR_DURATION_MS,
+                show_close_icon=True,
+                bgcolor=ft.Colors.RED_100,
+            )
+        )
+
+    def update_price_age(self) -> None:
+        """Refresh the price table age label."""
+
+        update_price_age(self)
+
+    def start_price_watcher(self, e: ft.Event[ft.Page]) -> None:
+        """Resume price file hot reload when the client reconnects."""
+
+        if self.price_watcher is not None:
+            self.price_watcher.start()
+
+    def stop_price_watcher(self, e: ft.Event[ft.Page]) -> None:
+        """Stop watching the price file when the window or session closes."""
+
+        if self.price_watcher is not None:
+            self.price_watcher.stop()
 
     def configure_page(self) -> None:
         """Apply static window and page settings."""
@@ -229,8 +358,17 @@ class WayfairFlatMaker:
         self.main_image_note.visible = not has_url
         self.suggest_button.disabled = not has_url or not has_print_type
         if e is not None:
+            if self.gemini_client.is_configured:
+                self.page.run_task(self.prefetch_main_image, first_link_value)
             self.page.update()
 
+    async def prefetch_main_image(self, image_url: str) -> None:
+        """Start downloading a valid main image URL before Suggest is clicked."""
+
+        self.image_prefetcher.schedule(
+            image_url if self.is_valid_url(image_url) else ""
+        )
+
     async def on_suggest_title_keywords_click(
         self,
         e: ft.Event[ft.Button],
@@ -263,14 +401,26 @@ class WayfairFlatMaker:
         self.suggest_progress_ring.visible = True
         self.suggest_button_text.value = self._("Generating...")
         self.page.update()
+        print_type = self.print_type_dd.value
+        fresh = bool(self.fresh_ai_switch.value)
         try:
-            suggestion = await asyncio.to_thread(
-                self.gemini_client.suggest_title_keywords,
-                first_image_url,
-                self.print_type_dd.value,
-            )
-            self.title_field.value = suggestion.title
-            self.keyword_field.value = suggestion.keyword
+            if settings.gemini_combined_suggestions:
+                content = await self.gemini_client.suggest_listing_content(
+                    first_image_url, print_type, fresh
+                )
+                title, keyword = content.title, content.keyword
+                if content.marketing_texts is not None:
+                    self.marketing_prefetcher.remember(
+                        title, keyword, print_type or "", fresh, content.marketing_texts
+                    )
+            else:
+                suggestion = await self.gemini_client.suggest_title_keywords(
+                    first_image_url, print_type, fresh
+                )
+                title, keyword = suggestion.title, suggestion.keyword
+            self.title_field.value = title
+            self.keyword_field.value = keyword
+            await self.speculate_marketing_texts()
             self.page.show_dialog(
                 ft.SnackBar(
                     ft.Text(self._("Title and keywords generated")),
@@ -366,6 +516,21 @@ class WayfairFlatMaker:
         """Handle print-type dropdown changes."""
 
         handle_print_type_change(self)
+        self.page.run_task(self.speculate_marketing_texts)
+
+    async def speculate_marketing_texts(
+        self, e: ft.Event[ft.Control] | None = None
+    ) -> None:
+        """Start generating marketing texts for the current inputs in advance."""
+
+        if not self.gemini_client.is_configured:
+            return
+        self.marketing_prefetcher.schedule(
+            self.title_field.value or "",
+            self.keyword_field.value or "",
+            self.print_type_dd.value or "",
+            bool(self.fresh_ai_switch.value),
+        )
 
     async def on_lang_change(self, e: ft.Event[ft.Dropdown]) -> None:
         """Persist language selection and refresh translated UI labels."""
@@ -484,10 +649,30 @@ class WayfairFlatMaker:
         await clear_errors(self)
 
     async def submit_form(self, folder: str | os.PathLike[str]) -> None:
-        """Generate the spreadsheet into the selected folder."""
+        """Queue spreadsheet generation into the selected folder."""
 
         await submit_form(self, folder)
 
+    async def run_export_job(self, record: ExportJobRecord) -> None:
+        """Generate the spreadsheet of one queued job."""
+
+        await run_export_job(self, record)
+
+    def render_export_job(self, record: ExportJobRecord) -> None:
+        """Show the latest status of one queued job."""
+
+        render_export_job(self, record)
+
+    def remove_export_job(self, record: ExportJobRecord) -> None:
+        """Drop the entry of a finished job evicted from the queue."""
+
+        remove_export_job_entry(self, record)
+
+    def describe_export_error(self, exc: Exception) -> str:
+        """Return a user-facing message for a failed job."""
+
+        return describe_export_error(self, exc)
+
     def init_ui(self) -> None:
         """Render the top-level application layout."""
 
@@ -2,26 +2,43 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
+import hashlib
 import json
 import mimetypes
 from pathlib import Path
 import re
 from typing import Any
-from urllib.error import URLError
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
-from urllib.request import Request, urlopen
 
 from google import genai
 from google.genai import errors, types
-
+import httpx
+
+from app.image_cache import ImageCache, ImageCacheStats
+from app.image_prep import prepare_image
+from app.rate_limit import RetryPolicy, TokenBucket
+from app.response_cache import (
+    GeminiResponseCache,
+    default_response_cache_dir,
+    response_cache_key,
+)
 from app.settings import settings
+from app.single_flight import SingleFlight
 from data.models import MarketingTexts
 
 MAX_INLINE_IMAGE_BYTES = 18 * 1024 * 1024
+IMAGE_DOWNLOAD_TIMEOUT_SECONDS = 30
 MAX_MARKETING_COPY_CHARS = 700
 MAX_FEATURE_BULLET_WORDS = 15
 
+gemini_rate_limiter = TokenBucket(
+    settings.gemini_requests_per_minute,
+    burst=settings.gemini_rate_burst,
+)
+
 
 @dataclass(frozen=True)
 class TitleKeywordSuggestion:
@@ -31,6 +48,18 @@ class TitleKeywordSuggestion:
     keyword: str
 
 
+@dataclass(frozen=True)
+class ListingContentSuggestion:
+    """Suggested title, keyword and marketing texts from one request.
+
+    ``marketing_texts`` is ``None`` when the answer left any of them out.
+    """
+
+    title: str
+    keyword: str
+    marketing_texts: MarketingTexts | None
+
+
 class GeminiUserError(RuntimeError):
     """Gemini failure with a message safe to show to operators."""
 
@@ -48,13 +77,47 @@ class GeminiClient:
         self,
         api_key: str | None = None,
         model: str | None = None,
+        response_cache: GeminiResponseCache | None = None,
+        rate_limiter: TokenBucket | None = None,
+        retry_policy: RetryPolicy | None = None,
+        base_url: str | None = None,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
     ) -> None:
-        """Initialize the API key and model name."""
+        """Initialize the API key, model name, caches and request limits.
+
+        Every client shares the process-wide rate limiter unless one is given.
+        ``base_url`` points the SDK at another endpoint, such as a local fake,
+        and ``sleep`` waits out the retry backoff.
+        """
 
         self.api_key = api_key or settings.gemini_api_key
         self.model = model or settings.gemini_model
-        self.client = genai.Client(api_key=self.api_key) if self.api_key else None
-        self._image_cache: dict[str, tuple[bytes, str]] = {}
+        base_url = base_url or settings.gemini_base_url
+        http_options = types.HttpOptions(base_url=base_url) if base_url else None
+        self.client = (
+            genai.Client(api_key=self.api_key, http_options=http_options)
+            if self.api_key
+            else None
+        )
+        self.rate_limiter = rate_limiter or gemini_rate_limiter
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_attempts=settings.gemini_max_attempts
+        )
+        self.deadline_seconds: float = settings.gemini_deadline_seconds
+        self.sleep = sleep
+        self.inflight_responses: SingleFlight[dict[str, Any]] = SingleFlight()
+        self.inflight_images: SingleFlight[tuple[bytes, str]] = SingleFlight()
+        self._image_cache = ImageCache(
+            max_bytes=settings.gemini_image_cache_mb * 1024 * 1024,
+            max_entries=settings.gemini_image_cache_entries,
+        )
+        if response_cache is None and settings.gemini_response_cache_days > 0:
+            response_cache = GeminiResponseCache(
+                default_response_cache_dir(),
+                ttl_seconds=settings.gemini_response_cache_days * 24 * 60 * 60,
+                max_bytes=settings.gemini_response_cache_mb * 1024 * 1024,
+            )
+        self.response_cache = response_cache
 
     @property
     def is_configured(self) -> bool:
@@ -62,12 +125,22 @@ class GeminiClient:
 
         return bool(self.api_key)
 
-    def suggest_title_keywords(
+    def image_cache_stats(self) -> ImageCacheStats:
+        """Return hit, miss and eviction counters of the image cache."""
+
+        return self._image_cache.stats()
+
+    async def suggest_title_keywords(
         self,
         image_url: str,
         print_type: str | None,
+        fresh: bool = False,
     ) -> TitleKeywordSuggestion:
-        """Generate a title and keyword phrase from the main product image."""
+        """Generate a title and keyword phrase from the main product image.
+
+        With ``fresh`` the response cache is skipped and a new variant is
+        requested, which then replaces the cached answer.
+        """
 
         if not self.api_key:
             raise GeminiUserError(
@@ -75,53 +148,88 @@ class GeminiClient:
                 "AI generation is not configured. Please contact the administrator.",
             )
 
-        image_bytes, mime_type = self.download_image(image_url)
-        product_name = product_label(print_type)
-        title_requirements = title_requirements_for_print_type(print_type)
-        keyword_suffix = keyword_suffix_for_print_type(print_type)
+        image_bytes, mime_type = await self.download_image(image_url)
         prompt = (
             "You are a senior Wayfair SEO marketplace copywriter for wall decor. "
             "Analyze the main product image and infer the visible subject, style, "
             "room/use case, and buyer search intent. Return JSON only with keys "
-            "title and keyword. Title rules: natural American English, optimized "
-            "for Wayfair search, target 120-170 characters, absolute maximum 245 "
-            "characters, no SKU, no brand name, no URL, no quotation marks, no ALL "
-            "CAPS, no keyword stuffing, no unsupported claims. The title must not "
-            "be abstract: it must include the visible subject/theme plus clear "
-            f"product-category wording required here: {title_requirements}. "
-            "Do not mention packaging, shipping tubes, installation steps, ink "
-            "technology, country of printing, certifications, or material claims "
-            "in the title unless they are visibly part of the product image. "
-            "Prefer specific searchable descriptors such as room, style, color, "
-            "theme, nursery, kids room, bedroom, living room, ocean, floral, animal, "
-            "boho, tropical, vintage, modern, or watercolor when visible. "
-            "Keyword rules: one concise plural SEO phrase, 2-5 words before the "
-            "required product suffix, no commas, no adjectives that are not visible, "
-            f"must end exactly with '{keyword_suffix}', e.g. 'Dog {keyword_suffix}'. "
-            f"Product category: {product_name}."
+            f"title and keyword. {title_keyword_rules(print_type)}"
+            f"Product category: {product_label(print_type)}."
         )
-        response = self.generate_json(
+        response = await self.generate_json(
             [
                 types.Part.from_bytes(data=image_bytes, mime_type=mime_type),
                 {"text": prompt},
-            ]
+            ],
+            fresh=fresh,
         )
-        title = clean_text_value(response.get("title"))
-        keyword = clean_text_value(response.get("keyword"))
-        if not title or not keyword:
+        return title_keyword_from_response(response)
+
+    async def suggest_listing_content(
+        self,
+        image_url: str,
+        print_type: str | None,
+        fresh: bool = False,
+    ) -> ListingContentSuggestion:
+        """Generate title, keyword, marketing copy and bullets in one request.
+
+        The image-grounded answer follows the same rules and cleanup as
+        ``suggest_title_keywords`` plus ``generate_marketing_texts``. Incomplete
+        marketing texts do not discard a valid title and keyword; they are
+        left for ``generate_marketing_texts`` to write later.
+        """
+
+        if not self.api_key:
             raise GeminiUserError(
-                "Gemini did not return title and keyword.",
-                "AI could not create a title and keywords from this image. Try again or fill them manually.",
+                "Gemini API key is not configured.",
+                "AI generation is not configured. Please contact the administrator.",
+            )
+
+        image_bytes, mime_type = await self.download_image(image_url)
+        prompt = (
+            "You are a senior Wayfair SEO marketplace copywriter for wall decor. "
+            "Analyze the main product image and infer the visible subject, style, "
+            "room/use case, and buyer search intent. First write the listing title "
+            "and keyword, then write high-converting, search-friendly ecommerce "
+            "copy for that title and keyword in natural American English. Return "
+            "JSON only with keys title, keyword, marketing_copy, feature_bullet_1, "
+            "feature_bullet_2, feature_bullet_3, feature_bullet_4, "
+            f"feature_bullet_5. {title_keyword_rules(print_type)}"
+            f"{marketing_text_rules(print_type)}"
+            f"Product category: {product_label(print_type)}."
+        )
+        response = await self.generate_json(
+            [
+                types.Part.from_bytes(data=image_bytes, mime_type=mime_type),
+                {"text": prompt},
+            ],
+            fresh=fresh,
+        )
+        suggestion = title_keyword_from_response(response)
+        try:
+            marketing_texts: MarketingTexts | None = marketing_texts_from_response(
+                response
             )
-        return TitleKeywordSuggestion(title=title, keyword=keyword)
+        except GeminiUserError:
+            marketing_texts = None
+        return ListingContentSuggestion(
+            title=suggestion.title,
+            keyword=suggestion.keyword,
+            marketing_texts=marketing_texts,
+        )
 
-    def generate_marketing_texts(
+    async def generate_marketing_texts(
         self,
         title: str,
         keyword: str,
         print_type: str,
+        fresh: bool = False,
     ) -> MarketingTexts:
-        """Generate marketing copy and feature bullets for a listing."""
+        """Generate marketing copy and feature bullets for a listing.
+
+        With ``fresh`` the response cache is skipped, as in
+        ``suggest_title_keywords``.
+        """
 
         if not self.api_key:
             raise GeminiUserError(
@@ -129,113 +237,157 @@ class GeminiClient:
                 "AI text generation is not configured. Standard template text was used.",
             )
 
-        product_name = product_label(print_type)
-        benefit_guidance = benefit_guidance_for_print_type(print_type)
         prompt = (
             "You are a senior Wayfair SEO marketplace copywriter for wall decor. "
             "Write high-converting, search-friendly ecommerce copy in natural "
             "American English for a Wayfair product upload. Return JSON only with "
             "keys marketing_copy, feature_bullet_1, feature_bullet_2, "
             "feature_bullet_3, feature_bullet_4, feature_bullet_5. "
-            "SEO goals: use the keyword phrase naturally, include relevant buyer "
-            "intent terms such as wall decor, nursery, bedroom, living room, office, "
-            "peel and stick, removable, mural, decal, wallpaper only when they fit "
-            "the product category. Avoid keyword stuffing. "
-            "Compliance rules: no brand names, no SKU, no price, no discounts, no "
-            "shipping or delivery promises, no guarantees, no medical/safety claims, "
-            "no claims not implied by the product category. Do not mention Wayfair. "
-            "Use only approved product facts from the product-specific guidance; "
-            "do not invent certifications, guarantees, child-safety claims, or "
-            "environmental claims beyond that guidance. "
-            "Style: warm, clear, specific, practical, and ready for a product page. "
-            "Marketing copy rules: one short single paragraph, complete sentences, "
-            "180-450 characters, no line breaks, no bullet formatting, no trademark "
-            "symbols, no copyright symbols, no registered symbols, no emoji, no "
-            "extra spacing. "
-            "Feature bullet rules: each bullet must be 15 words or less, one short "
-            "sentence fragment or sentence, one product aspect only, no line breaks, "
-            "no special symbols, no punctuation-heavy formatting. Provide all five "
-            "bullets. Bullets should cover distinct facts: visual impact, material "
-            "or print quality, installation, size/fit, room use case, surface "
-            "compatibility, or packaging when relevant. "
-            f"Product-specific benefit guidance: {benefit_guidance}. "
+            f"{marketing_text_rules(print_type)}"
             f"Listing title: {title}. Keyword phrase: {keyword}. "
-            f"Product category: {product_name}."
-        )
-        response = self.generate_json([{"text": prompt}])
-        return MarketingTexts(
-            marketing_copy=clean_marketing_copy(
-                required_text(response, "marketing_copy")
-            ),
-            feature_bullet_1=clean_feature_bullet(
-                required_text(response, "feature_bullet_1")
-            ),
-            feature_bullet_2=clean_feature_bullet(
-                required_text(response, "feature_bullet_2")
-            ),
-            feature_bullet_3=clean_feature_bullet(
-                required_text(response, "feature_bullet_3")
-            ),
-            feature_bullet_4=clean_feature_bullet(
-                required_text(response, "feature_bullet_4")
-            ),
-            feature_bullet_5=clean_feature_bullet(
-                required_text(response, "feature_bullet_5")
-            ),
+            f"Product category: {product_label(print_type)}."
         )
+        response = await self.generate_json([{"text": prompt}], fresh=fresh)
+        return marketing_texts_from_response(response)
 
-    def generate_json(self, parts: list[types.Part | dict[str, str]]) -> dict[str, Any]:
-        """Call Gemini and parse the JSON object from response text."""
+    async def generate_json(
+        self,
+        parts: list[types.Part | dict[str, str]],
+        fresh: bool = False,
+    ) -> dict[str, Any]:
+        """Call Gemini through the SDK's async client and parse the JSON object.
+
+        Parsed responses are cached on disk by a hash of the model, prompt,
+        image digests and generation config; ``fresh`` skips the lookup.
+        Cache reads and writes run in a worker thread to keep the event loop
+        free. Concurrent calls with the same hash share one request.
+        """
 
-        if self.client is None:
+        client = self.client
+        if client is None:
             raise GeminiUserError(
                 "Gemini API key is not configured.",
                 "AI generation is not configured. Please contact the administrator.",
             )
 
+        config = types.GenerateContentConfig(
+            temperature=0.7,
+            response_mime_type="application/json",
+        )
+        cache_key = response_cache_key(
+            {
+                "model": self.model,
+                "parts": [describe_part(part) for part in parts],
+                "config": config.model_dump(mode="json", exclude_none=True),
+            }
+        )
+        if self.response_cache is not None and not fresh:
+            cached_response = await asyncio.to_thread(
+                self.response_cache.get, cache_key
+            )
+            if cached_response is not None:
+                return cached_response
+
         contents: Any = [
             part.get("text", "") if isinstance(part, dict) else part for part in parts
         ]
+        return await self.inflight_responses.run(
+            cache_key,
+            lambda: self.request_json(client, contents, config, cache_key),
+        )
+
+    async def request_json(
+        self,
+        client: genai.Client,
+        contents: Any,
+        config: types.GenerateContentConfig,
+        cache_key: str,
+    ) -> dict[str, Any]:
+        """Send one request, parse its JSON answer and cache it.
+
+        Retries and rate-limit waits all count against one deadline.
+        """
+
         try:
-            response = self.client.models.generate_content(
-                model=self.model,
-                contents=contents,
-                config=types.GenerateContentConfig(
-                    temperature=0.7,
-                    response_mime_type="application/json",
-                ),
-            )
+            async with asyncio.timeout(self.deadline_seconds):
+                response = await self.generate_with_retries(client, contents, config)
+        except TimeoutError as exc:
+            raise GeminiUserError(
+                "Gemini request exceeded its deadline.",
+                "AI took too long to respond. Try again later.",
+            ) from exc
         except errors.APIError as exc:
             raise gemini_api_error(exc) from exc
-        except (OSError, URLError) as exc:
+        except (OSError, httpx.HTTPError) as exc:
             raise GeminiUserError(
                 "Gemini API request failed.",
                 "AI service is temporarily unavailable. Try again later.",
             ) from exc
 
-        return parse_json_object(extract_response_text(response))
+        data = parse_json_object(extract_response_text(response))
+        if self.response_cache is not None:
+            await asyncio.to_thread(self.response_cache.put, cache_key, data)
+        return data
 
-    def download_image(self, image_url: str) -> tuple[bytes, str]:
+    async def generate_with_retries(
+        self,
+        client: genai.Client,
+        contents: Any,
+        config: types.GenerateContentConfig,
+    ) -> types.GenerateContentResponse:
+        """Send the request through the rate limiter, retrying transient errors."""
+
+        attempt = 1
+        while True:
+            await self.rate_limiter.acquire()
+            try:
+                return await client.aio.models.generate_content(
+                    model=self.model,
+                    contents=contents,
+                    config=config,
+                )
+            except (errors.APIError, OSError, httpx.TransportError) as exc:
+                if attempt >= self.retry_policy.max_attempts or not (
+                    self.retry_policy.is_retryable(exc)
+                ):
+                    raise
+                await self.sleep(self.retry_policy.backoff_delay(attempt))
+                attempt += 1
+
+    async def download_image(self, image_url: str) -> tuple[bytes, str]:
         """Download an image URL and return bytes plus a Gemini-compatible MIME type.
 
-        Results are cached by normalized URL for the lifetime of the client instance
-        so repeated "Suggest" clicks on the same image skip the network round-trip.
+        The image is fetched with an async HTTP client, then downscaled and
+        re-encoded in a worker thread when possible. The prepared copy is kept
+        in a size-bounded LRU keyed by normalized URL so repeated "Suggest"
+        clicks on the same image skip the network round-trip and the resize.
+        Concurrent downloads of the same URL share one request.
         """
 
         normalized_url = normalize_public_image_url(image_url)
-        if normalized_url in self._image_cache:
-            return self._image_cache[normalized_url]
-
-        request = Request(
-            normalized_url,
-            headers={"User-Agent": "WayfairFlatMaker/1.0"},
-            method="GET",
+        cached = self._image_cache.get(normalized_url)
+        if cached is not None:
+            return cached
+        return await self.inflight_images.run(
+            normalized_url, lambda: self.fetch_image(normalized_url)
         )
+
+    async def fetch_image(self, normalized_url: str) -> tuple[bytes, str]:
+        """Fetch, check and prepare one image, then add it to the image cache."""
+
         try:
-            with urlopen(request, timeout=30) as response:
-                image_bytes = response.read(MAX_INLINE_IMAGE_BYTES + 1)
-                content_type = response.headers.get("Content-Type", "")
-        except (OSError, URLError) as exc:
+            async with httpx.AsyncClient(
+                headers={"User-Agent": "WayfairFlatMaker/1.0"},
+                timeout=IMAGE_DOWNLOAD_TIMEOUT_SECONDS,
+                follow_redirects=True,
+            ) as http_client:
+                async with http_client.stream("GET", normalized_url) as response:
+                    response.raise_for_status()
+                    content_type = response.headers.get("Content-Type", "")
+                    image_bytes = await read_limited(
+                        response, MAX_INLINE_IMAGE_BYTES + 1
+                    )
+        except (OSError, httpx.HTTPError) as exc:
             raise GeminiUserError(
                 "Could not download the image for Gemini.",
                 "AI could not download the main image. Check that the image link opens publicly.",
@@ -251,11 +403,31 @@ class GeminiClient:
                 "Image is too large for inline Gemini analysis.",
                 "The main image is too large for AI analysis. Please use a smaller image.",
             )
-        result = image_bytes, guess_image_mime_type(normalized_url, content_type)
-        self._image_cache[normalized_url] = result
+        result = await asyncio.to_thread(
+            prepare_image,
+            image_bytes,
+            guess_image_mime_type(normalized_url, content_type),
+            max_edge=settings.gemini_image_max_edge,
+            image_format=settings.gemini_image_format,
+            quality=settings.gemini_image_quality,
+        )
+        self._image_cache.put(normalized_url, result)
         return result
 
 
+async def read_limited(response: httpx.Response, limit: int) -> bytes:
+    """Read a streamed response body, stopping once ``limit`` bytes arrived."""
+
+    chunks: list[bytes] = []
+    size = 0
+    async for chunk in response.aiter_bytes():
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= limit:
+            break
+    return b"".join(chunks)[:limit]
+
+
 def normalize_public_image_url(url: str) -> str:
     """Normalize Dropbox preview links to raw downloadable links."""
 
@@ -271,6 +443,19 @@ def normalize_public_image_url(url: str) -> str:
     )
 
 
+def describe_part(part: types.Part | dict[str, str]) -> dict[str, str]:
+    """Return a cache-key description of a prompt part, hashing inline data."""
+
+    if isinstance(part, dict):
+        return {"text": part.get("text", "")}
+    if part.inline_data is not None:
+        return {
+            "mime_type": part.inline_data.mime_type or "",
+            "sha256": hashlib.sha256(part.inline_data.data or b"").hexdigest(),
+        }
+    return {"text": part.text or ""}
+
+
 def guess_image_mime_type(url: str, content_type: str) -> str:
     """Return a safe image MIME type for Gemini inline_data."""
 
@@ -371,6 +556,32 @@ def clean_feature_bullet(value: str) -> str:
     return cleaned
 
 
+def title_keyword_from_response(data: dict[str, Any]) -> TitleKeywordSuggestion:
+    """Return the cleaned title and keyword from a Gemini JSON object."""
+
+    title = clean_text_value(data.get("title"))
+    keyword = clean_text_value(data.get("keyword"))
+    if not title or not keyword:
+        raise GeminiUserError(
+            "Gemini did not return title and keyword.",
+            "AI could not create a title and keywords from this image. Try again or fill them manually.",
+        )
+    return TitleKeywordSuggestion(title=title, keyword=keyword)
+
+
+def marketing_texts_from_response(data: dict[str, Any]) -> MarketingTexts:
+    """Return cleaned marketing copy and feature bullets from a Gemini JSON object."""
+
+    return MarketingTexts(
+        marketing_copy=clean_marketing_copy(required_text(data, "marketing_copy")),
+        feature_bullet_1=clean_feature_bullet(required_text(data, "feature_bullet_1")),
+        feature_bullet_2=clean_feature_bullet(required_text(data, "feature_bullet_2")),
+        feature_bullet_3=clean_feature_bullet(required_text(data, "feature_bullet_3")),
+        feature_bullet_4=clean_feature_bullet(required_text(data, "feature_bullet_4")),
+        feature_bullet_5=clean_feature_bullet(required_text(data, "feature_bullet_5")),
+    )
+
+
 def required_text(data: dict[str, Any], key: str) -> str:
     """Return a required non-empty text field from a Gemini JSON object."""
 
@@ -418,6 +629,60 @@ def product_label(print_type: str | None) -> str:
     return "wall decal and wall sticker"
 
 
+def title_keyword_rules(print_type: str | None) -> str:
+    """Return the prompt rules for generated titles and keywords."""
+
+    title_requirements = title_requirements_for_print_type(print_type)
+    keyword_suffix = keyword_suffix_for_print_type(print_type)
+    return (
+        "Title rules: natural American English, optimized "
+        "for Wayfair search, target 120-170 characters, absolute maximum 245 "
+        "characters, no SKU, no brand name, no URL, no quotation marks, no ALL "
+        "CAPS, no keyword stuffing, no unsupported claims. The title must not "
+        "be abstract: it must include the visible subject/theme plus clear "
+        f"product-category wording required here: {title_requirements}. "
+        "Do not mention packaging, shipping tubes, installation steps, ink "
+        "technology, country of printing, certifications, or material claims "
+        "in the title unless they are visibly part of the product image. "
+        "Prefer specific searchable descriptors such as room, style, color, "
+        "theme, nursery, kids room, bedroom, living room, ocean, floral, animal, "
+        "boho, tropical, vintage, modern, or watercolor when visible. "
+        "Keyword rules: one concise plural SEO phrase, 2-5 words before the "
+        "required product suffix, no commas, no adjectives that are not visible, "
+        f"must end exactly with '{keyword_suffix}', e.g. 'Dog {keyword_suffix}'. "
+    )
+
+
+def marketing_text_rules(print_type: str | None) -> str:
+    """Return the prompt rules for generated marketing copy and bullets."""
+
+    benefit_guidance = benefit_guidance_for_print_type(print_type)
+    return (
+        "SEO goals: use the keyword phrase naturally, include relevant buyer "
+        "intent terms such as wall decor, nursery, bedroom, living room, office, "
+        "peel and stick, removable, mural, decal, wallpaper only when they fit "
+        "the product category. Avoid keyword stuffing. "
+        "Compliance rules: no brand names, no SKU, no price, no discounts, no "
+        "shipping or delivery promises, no guarantees, no medical/safety claims, "
+        "no claims not implied by the product category. Do not mention Wayfair. "
+        "Use only approved product facts from the product-specific guidance; "
+        "do not invent certifications, guarantees, child-safety claims, or "
+        "environmental claims beyond that guidance. "
+        "Style: warm, clear, specific, practical, and ready for a product page. "
+        "Marketing copy rules: one short single paragraph, complete sentences, "
+        "180-450 characters, no line breaks, no bullet formatting, no trademark "
+        "symbols, no copyright symbols, no registered symbols, no emoji, no "
+        "extra spacing. "
+        "Feature bullet rules: each bullet must be 15 words or less, one short "
+        "sentence fragment or sentence, one product aspect only, no line breaks, "
+        "no special symbols, no punctuation-heavy formatting. Provide all five "
+        "bullets. Bullets should cover distinct facts: visual impact, material "
+        "or print quality, installation, size/fit, room use case, surface "
+        "compatibility, or packaging when relevant. "
+        f"Product-specific benefit guidance: {benefit_guidance}. "
+    )
+
+
 def title_requirements_for_print_type(print_type: str | None) -> str:
     """Return required product wording for generated titles."""
 
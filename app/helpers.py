@@ -53,3 +53,10 @@ def is_valid_url(value: str) -> bool:
 
     parsed = urlparse(value.strip())
     return parsed.scheme in {"http", "https"} and bool(parsed.netloc)
+
+
+def format_age(seconds: float) -> str:
+    """Format an age in seconds as ``hours:minutes``."""
+
+    minutes = int(seconds // 60)
+    return f"{minutes // 60}:{minutes % 60:02d}"
@@ -0,0 +1,89 @@
+"""Bounded in-memory cache for downloaded Gemini images."""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+import threading
+
+CachedImage = tuple[bytes, str]
+
+
+@dataclass(frozen=True)
+class ImageCacheStats:
+    """Point-in-time counters and size of an image cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    total_bytes: int
+
+
+class ImageCache:
+    """Thread-safe LRU of image bytes limited by total size and entry count.
+
+    The least recently used images are evicted first once either limit is
+    exceeded. An image larger than the whole byte budget is not cached.
+    """
+
+    def __init__(self, max_bytes: int, max_entries: int) -> None:
+        """Initialize the empty cache with its limits."""
+
+        self.max_bytes = max(max_bytes, 0)
+        self.max_entries = max(max_entries, 0)
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, CachedImage] = OrderedDict()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> CachedImage | None:
+        """Return a cached image and mark it as recently used."""
+
+        with self._lock:
+            image = self._entries.get(key)
+            if image is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return image
+
+    def put(self, key: str, image: CachedImage) -> None:
+        """Store an image and evict the oldest entries beyond the limits."""
+
+        size = len(image[0])
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._total_bytes -= len(previous[0])
+            if size > self.max_bytes or self.max_entries == 0:
+                return
+            self._entries[key] = image
+            self._total_bytes += size
+            while (
+                self._total_bytes > self.max_bytes
+                or len(self._entries) > self.max_entries
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= len(evicted[0])
+                self.evictions += 1
+
+    def stats(self) -> ImageCacheStats:
+        """Return the current counters and cache size."""
+
+        with self._lock:
+            return ImageCacheStats(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                entries=len(self._entries),
+                total_bytes=self._total_bytes,
+            )
+
+    def clear(self) -> None:
+        """Drop every cached image, keeping the counters."""
+
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
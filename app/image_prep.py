@@ -0,0 +1,66 @@
+"""Downscale and re-encode images before sending them to Gemini.
+
+Images that Pillow cannot decode are sent unchanged.
+"""
+
+from io import BytesIO
+
+from PIL import Image, ImageOps
+
+JPEG_IMAGE_FORMAT = "jpeg"
+WEBP_IMAGE_FORMAT = "webp"
+IMAGE_FORMAT_MIME_TYPES = {
+    JPEG_IMAGE_FORMAT: "image/jpeg",
+    WEBP_IMAGE_FORMAT: "image/webp",
+}
+
+
+def prepare_image(
+    image_bytes: bytes,
+    mime_type: str,
+    max_edge: int,
+    image_format: str = JPEG_IMAGE_FORMAT,
+    quality: int = 85,
+) -> tuple[bytes, str]:
+    """Return the image resized to ``max_edge`` and re-encoded, or the original.
+
+    The original bytes are kept when resizing is disabled, the image cannot be
+    decoded, or re-encoding a small image would only make it larger.
+    """
+
+    output_mime_type = IMAGE_FORMAT_MIME_TYPES.get(image_format)
+    if max_edge <= 0 or output_mime_type is None:
+        return image_bytes, mime_type
+
+    try:
+        with Image.open(BytesIO(image_bytes)) as source:
+            image = ImageOps.exif_transpose(source)
+            resized = max(image.size) > max_edge
+            if resized:
+                image.thumbnail((max_edge, max_edge), Image.Resampling.LANCZOS)
+            image = flatten_for_format(image, image_format)
+            output = BytesIO()
+            image.save(output, format=image_format.upper(), quality=quality)
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return image_bytes, mime_type
+
+    prepared_bytes = output.getvalue()
+    if not resized and len(prepared_bytes) >= len(image_bytes):
+        return image_bytes, mime_type
+    return prepared_bytes, output_mime_type
+
+
+def flatten_for_format(image: Image.Image, image_format: str) -> Image.Image:
+    """Convert the image to a mode the target format can store.
+
+    JPEG has no alpha channel, so transparent areas are laid over white.
+    """
+
+    if image_format == WEBP_IMAGE_FORMAT:
+        return image if image.mode in ("RGB", "RGBA") else image.convert("RGBA")
+    if image.mode == "RGB":
+        return image
+    rgba = image.convert("RGBA")
+    background = Image.new("RGB", rgba.size, (255, 255, 255))
+    background.paste(rgba, mask=rgba.getchannel("A"))
+    return background
@@ -0,0 +1,164 @@
+"""Background export queue for submitted listings."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from enum import StrEnum
+import itertools
+import os
+from pathlib import Path
+import time
+
+from data.listing import ListingSpec
+
+MAX_FINISHED_EXPORT_JOBS = 50
+
+
+class ExportJobStatus(StrEnum):
+    """Lifecycle states of one export job."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class ExportJob:
+    """Immutable snapshot of one submitted form."""
+
+    job_id: int
+    spec: ListingSpec
+    folder: str
+
+
+@dataclass
+class ExportJobRecord:
+    """Mutable progress and outcome of one export job."""
+
+    job: ExportJob
+    status: ExportJobStatus = ExportJobStatus.QUEUED
+    steps_done: int = 0
+    steps_total: int = 0
+    started_at: float | None = None
+    finished_at: float | None = None
+    output_path: Path | None = None
+    warning: str | None = None
+    error: str | None = None
+
+    @property
+    def duration(self) -> float | None:
+        """Return the run time in seconds once the job has started."""
+
+        if self.started_at is None:
+            return None
+        finished_at = self.finished_at or time.perf_counter()
+        return finished_at - self.started_at
+
+
+ExportJobRunner = Callable[[ExportJobRecord], Awaitable[None]]
+ExportJobListener = Callable[[ExportJobRecord], None]
+ErrorFormatter = Callable[[Exception], str]
+
+
+class ExportJobQueue:
+    """Run submitted export jobs in the background with bounded concurrency.
+
+    The runner does the actual work; the queue tracks status and timing and
+    notifies the listener on every change, always from the event loop. Only
+    the newest ``max_finished`` finished jobs are kept; older ones are
+    dropped and passed to ``on_evict``.
+    """
+
+    def __init__(
+        self,
+        runner: ExportJobRunner,
+        on_update: ExportJobListener,
+        max_workers: int = 2,
+        format_error: ErrorFormatter = str,
+        max_finished: int = MAX_FINISHED_EXPORT_JOBS,
+        on_evict: ExportJobListener | None = None,
+    ) -> None:
+        """Store callbacks, the number of jobs allowed to run at once and the
+        number of finished jobs to keep.
+        """
+
+        self.runner = runner
+        self.on_update = on_update
+        self.on_evict = on_evict
+        self.max_finished = max(max_finished, 0)
+        self.format_error = format_error
+        self.slots = asyncio.Semaphore(max(max_workers, 1))
+        self.records: list[ExportJobRecord] = []
+        self.tasks: set[asyncio.Task[None]] = set()
+        self.job_ids = itertools.count(1)
+
+    @property
+    def active_count(self) -> int:
+        """Return how many jobs are queued or running."""
+
+        return sum(
+            1
+            for record in self.records
+            if record.status in (ExportJobStatus.QUEUED, ExportJobStatus.RUNNING)
+        )
+
+    def submit(
+        self,
+        spec: ListingSpec,
+        folder: str | os.PathLike[str],
+    ) -> ExportJobRecord:
+        """Queue one listing export and return its tracking record."""
+
+        record = ExportJobRecord(ExportJob(next(self.job_ids), spec, os.fspath(folder)))
+        self.records.append(record)
+        task = asyncio.get_running_loop().create_task(self.process(record))
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        self.on_update(record)
+        return record
+
+    def report_progress(self, record: ExportJobRecord, done: int, total: int) -> None:
+        """Store step progress of a running job and notify the listener."""
+
+        record.steps_done = done
+        record.steps_total = total
+        self.on_update(record)
+
+    async def process(self, record: ExportJobRecord) -> None:
+        """Wait for a free worker slot, run the job and record its outcome."""
+
+        async with self.slots:
+            record.status = ExportJobStatus.RUNNING
+            record.started_at = time.perf_counter()
+            self.on_update(record)
+            try:
+                await self.runner(record)
+            except Exception as exc:
+                record.status = ExportJobStatus.FAILED
+                record.error = self.format_error(exc)
+            else:
+                record.status = ExportJobStatus.DONE
+            finally:
+                record.finished_at = time.perf_counter()
+            self.on_update(record)
+        self.evict_finished()
+
+    def evict_finished(self) -> None:
+        """Drop the oldest finished jobs beyond ``max_finished``."""
+
+        finished = [
+            record
+            for record in self.records
+            if record.status in (ExportJobStatus.DONE, ExportJobStatus.FAILED)
+        ]
+        evicted = finished[: max(len(finished) - self.max_finished, 0)]
+        if not evicted:
+            return
+        evicted_ids = {id(record) for record in evicted}
+        self.records = [
+            record for record in self.records if id(record) not in evicted_ids
+        ]
+        if self.on_evict is not None:
+            for record in evicted:
+                self.on_evict(record)
@@ -32,6 +32,7 @@ CATALOG: tuple[str, ...] = (
     _("AI limit was reached. Standard template text was used. Try again later."),
     _("AI service is temporarily unavailable. Try again later."),
     _("AI service is temporarily unavailable. Standard template text was used."),
+    _("AI took too long to respond. Try again later."),
     _("AI generation failed. Try again later."),
     _("AI generation failed. Standard template text was used."),
     _("AI text generation failed. Standard template text was used."),
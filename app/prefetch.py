@@ -0,0 +1,243 @@
+"""Speculative background work started while the operator fills in the form."""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from data.models import MarketingTexts
+
+MarketingTextKey = tuple[str, str, str, bool]
+MarketingTextGenerator = Callable[
+    [str, str, str, bool], Coroutine[Any, Any, MarketingTexts]
+]
+ImageDownloader = Callable[[str], Coroutine[Any, Any, object]]
+
+
+class MarketingTextPrefetcher:
+    """Generate marketing texts ahead of submit for the inputs being typed.
+
+    Each change restarts a short debounce; once title, keyword and print type
+    stay unchanged that long, generation starts on the event loop. Requests
+    for inputs that are no longer current are cancelled, and finished results
+    are kept under their inputs. Submitting reserves the request for its job,
+    so later edits to the form can no longer cancel it.
+    """
+
+    def __init__(
+        self,
+        generate: MarketingTextGenerator,
+        debounce_seconds: float,
+        max_results: int = 8,
+    ) -> None:
+        """Store the async generator and the speculation limits."""
+
+        self.generate = generate
+        self.debounce_seconds = debounce_seconds
+        self.max_results = max_results
+        self.results: OrderedDict[MarketingTextKey, asyncio.Future[MarketingTexts]] = (
+            OrderedDict()
+        )
+        self.debounce_task: asyncio.Task[None] | None = None
+        self.debounce_key: MarketingTextKey | None = None
+        self.reserved: dict[MarketingTextKey, asyncio.Future[MarketingTexts]] = {}
+        self.reservations: dict[MarketingTextKey, int] = {}
+
+    def schedule(self, title: str, keyword: str, print_type: str, fresh: bool) -> None:
+        """Restart the debounce for new inputs and cancel stale requests."""
+
+        self.cancel_debounce()
+        key = (title, keyword, print_type, fresh)
+        self.cancel_stale(key)
+        if not title.strip() or not keyword.strip() or not print_type:
+            return
+        self.debounce_key = key
+        self.debounce_task = asyncio.get_running_loop().create_task(
+            self.start_after_debounce(key)
+        )
+
+    def cancel_debounce(self) -> None:
+        """Drop a pending debounced start."""
+
+        if self.debounce_task is not None:
+            self.debounce_task.cancel()
+        self.debounce_task = None
+        self.debounce_key = None
+
+    async def start_after_debounce(self, key: MarketingTextKey) -> None:
+        """Start generation once the inputs have been stable long enough."""
+
+        await asyncio.sleep(self.debounce_seconds)
+        self.debounce_task = None
+        self.debounce_key = None
+        self.start(key)
+
+    def start(self, key: MarketingTextKey) -> asyncio.Future[MarketingTexts]:
+        """Return the running or finished task for the inputs, starting one if needed."""
+
+        task = self.results.get(key)
+        if task is not None:
+            self.results.move_to_end(key)
+            return task
+        task = self.create_task(key)
+        task.add_done_callback(lambda done: self.discard_failed(key, done))
+        self.store(key, task)
+        return task
+
+    def remember(
+        self,
+        title: str,
+        keyword: str,
+        print_type: str,
+        fresh: bool,
+        texts: MarketingTexts,
+    ) -> None:
+        """Keep texts generated elsewhere as the finished result for the inputs."""
+
+        key = (title, keyword, print_type, fresh)
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(texts)
+        previous = self.results.pop(key, None)
+        if previous is not None:
+            previous.cancel()
+        self.store(key, future)
+
+    def store(
+        self,
+        key: MarketingTextKey,
+        future: asyncio.Future[MarketingTexts],
+    ) -> None:
+        """Add a result and evict the oldest ones beyond the limit."""
+
+        self.results[key] = future
+        while len(self.results) > self.max_results:
+            _, evicted = self.results.popitem(last=False)
+            evicted.cancel()
+
+    def create_task(self, key: MarketingTextKey) -> asyncio.Task[MarketingTexts]:
+        """Start the generator for the inputs as an event-loop task."""
+
+        return asyncio.get_running_loop().create_task(self.generate(*key))
+
+    def reserve(self, title: str, keyword: str, print_type: str, fresh: bool) -> None:
+        """Hand the request for submitted inputs to their job, starting it now.
+
+        Jobs submitted with the same inputs share one reserved request; it is
+        released once every one of them has taken it.
+        """
+
+        key = (title, keyword, print_type, fresh)
+        if self.debounce_key == key:
+            self.cancel_debounce()
+        if key not in self.reserved:
+            task = self.results.pop(key, None)
+            self.reserved[key] = task or self.create_task(key)
+        self.reservations[key] = self.reservations.get(key, 0) + 1
+
+    def take_reserved(
+        self,
+        key: MarketingTextKey,
+    ) -> asyncio.Future[MarketingTexts] | None:
+        """Return the reserved request for the inputs and release one reservation."""
+
+        task = self.reserved.get(key)
+        if task is None:
+            return None
+        self.reservations[key] -= 1
+        if not self.reservations[key]:
+            del self.reserved[key]
+            del self.reservations[key]
+        return task
+
+    def cancel_speculation(self) -> None:
+        """Cancel the pending debounce and every unfinished speculative request.
+
+        Requests already reserved by submitted jobs keep running.
+        """
+
+        self.cancel_debounce()
+        for key, task in list(self.results.items()):
+            if not task.done():
+                task.cancel()
+                del self.results[key]
+
+    def cancel_stale(self, key: MarketingTextKey) -> None:
+        """Cancel unfinished requests for any inputs other than ``key``."""
+
+        for other_key, task in list(self.results.items()):
+            if other_key != key and not task.done():
+                task.cancel()
+                del self.results[other_key]
+
+    def discard_failed(
+        self,
+        key: MarketingTextKey,
+        task: asyncio.Future[MarketingTexts],
+    ) -> None:
+        """Forget a failed speculative request so the next caller retries it."""
+
+        if task.cancelled() or task.exception() is not None:
+            if self.results.get(key) is task:
+                del self.results[key]
+
+    async def get(
+        self,
+        title: str,
+        keyword: str,
+        print_type: str,
+        fresh: bool,
+    ) -> MarketingTexts:
+        """Return texts for the inputs, using a reserved or speculative result."""
+
+        key = (title, keyword, print_type, fresh)
+        if self.debounce_key == key:
+            self.cancel_debounce()
+        task = self.take_reserved(key) or self.results.pop(key, None)
+        if task is None:
+            task = self.create_task(key)
+        return await task
+
+
+class ImagePrefetcher:
+    """Download the main image in the background before Suggest is clicked.
+
+    A new URL cancels the previous download and starts after a short
+    debounce. Failures are ignored here; the Suggest click downloads the
+    image again and reports them.
+    """
+
+    def __init__(self, download: ImageDownloader, debounce_seconds: float) -> None:
+        """Store the async downloader and the debounce delay."""
+
+        self.download = download
+        self.debounce_seconds = debounce_seconds
+        self.image_url = ""
+        self.task: asyncio.Task[None] | None = None
+
+    def schedule(self, image_url: str) -> None:
+        """Prefetch ``image_url`` unless it is already being fetched."""
+
+        if image_url == self.image_url and self.task is not None:
+            return
+        self.cancel()
+        if not image_url:
+            return
+        self.image_url = image_url
+        self.task = asyncio.get_running_loop().create_task(self.run(image_url))
+
+    def cancel(self) -> None:
+        """Cancel the running prefetch."""
+
+        if self.task is not None:
+            self.task.cancel()
+        self.task = None
+        self.image_url = ""
+
+    async def run(self, image_url: str) -> None:
+        """Wait out the debounce, then download and prepare the image."""
+
+        await asyncio.sleep(self.debounce_seconds)
+        try:
+            await self.download(image_url)
+        except Exception:
+            pass
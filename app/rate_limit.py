@@ -0,0 +1,100 @@
+"""Retry policy and client-side rate limiting for Gemini requests."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import random
+import threading
+import time
+
+from google.genai import errors
+import httpx
+
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Exponential backoff with full jitter for transient Gemini failures."""
+
+    max_attempts: int = 4
+    base_delay: float = 1.0
+    max_delay: float = 20.0
+    retryable_status_codes: frozenset[int] = RETRYABLE_STATUS_CODES
+
+    def is_retryable(self, exc: Exception) -> bool:
+        """Return whether a failed attempt is worth repeating."""
+
+        if isinstance(exc, errors.APIError):
+            return exc.code in self.retryable_status_codes
+        return isinstance(exc, (OSError, httpx.TransportError))
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Return a random delay before retry number ``attempt`` (from 1)."""
+
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+
+class TokenBucket:
+    """Token bucket that spaces out requests to stay within a quota.
+
+    Callers take a token and, when the bucket is empty, wait in arrival order
+    until their token has been refilled. It is safe to share between threads
+    and event loops; a non-positive rate disables limiting.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        """Start with a full bucket of ``burst`` tokens."""
+
+        self.rate = requests_per_minute / 60
+        self.capacity = float(max(burst, 1))
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = self.capacity
+        self.updated_at = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how many seconds to wait before using it."""
+
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = self.clock()
+            elapsed = now - self.updated_at
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def release(self) -> None:
+        """Give back a token whose request was never sent."""
+
+        if self.rate <= 0:
+            return
+        with self._lock:
+            self.tokens = min(self.capacity, self.tokens + 1)
+
+    async def acquire(self) -> None:
+        """Wait until a request may be sent.
+
+        A caller cancelled while waiting returns its token, so abandoned
+        requests do not push back later ones.
+        """
+
+        delay = self.reserve()
+        if delay > 0:
+            try:
+                await self.sleep(delay)
+            except asyncio.CancelledError:
+                self.release()
+                raise
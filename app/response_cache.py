@@ -0,0 +1,109 @@
+"""On-disk cache of parsed Gemini responses keyed by request content."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+import threading
+import time
+from typing import Any
+
+RESPONSE_CACHE_DIRNAME = "gemini_cache"
+
+
+def default_response_cache_dir() -> Path:
+    """Return the response cache directory inside the app storage directory."""
+
+    flet_storage = os.environ.get("FLET_APP_STORAGE_DATA")
+    if flet_storage:
+        return Path(flet_storage) / RESPONSE_CACHE_DIRNAME
+    return Path.home() / ".wayfairflatmakerbydk" / RESPONSE_CACHE_DIRNAME
+
+
+def response_cache_key(request: dict[str, Any]) -> str:
+    """Return a stable content hash of a JSON-serializable request description."""
+
+    payload = json.dumps(request, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class GeminiResponseCache:
+    """Store one JSON file per request hash, expiring and pruning old entries.
+
+    Entries older than the TTL are ignored and removed. When the directory
+    grows past the size cap, the least recently used files are deleted first;
+    a cache hit refreshes its file's modification time.
+    """
+
+    def __init__(self, directory: Path, ttl_seconds: float, max_bytes: int) -> None:
+        """Store the cache directory and its limits."""
+
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached response, or ``None`` when missing or expired."""
+
+        path = self.path_for(key)
+        with self._lock:
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+                if time.time() - float(data["created_at"]) > self.ttl_seconds:
+                    path.unlink(missing_ok=True)
+                    return None
+                response = data["response"]
+                os.utime(path)
+            except (OSError, KeyError, TypeError, ValueError):
+                return None
+            return response if isinstance(response, dict) else None
+
+    def put(self, key: str, response: dict[str, Any]) -> None:
+        """Atomically save a response, then prune the directory to its limits."""
+
+        data = {"created_at": time.time(), "response": response}
+        with self._lock:
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                fd, temp_name = tempfile.mkstemp(
+                    dir=self.directory, prefix=f".{key}.", suffix=".tmp"
+                )
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+                        json.dump(data, temp_file, ensure_ascii=False)
+                    os.replace(temp_name, self.path_for(key))
+                except BaseException:
+                    Path(temp_name).unlink(missing_ok=True)
+                    raise
+                self.prune()
+            except OSError:
+                pass
+
+    def prune(self) -> None:
+        """Delete expired entries and the oldest ones beyond the size cap."""
+
+        now = time.time()
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if now - stat.st_mtime > self.ttl_seconds:
+                path.unlink(missing_ok=True)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_bytes <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total_bytes -= size
+
+    def path_for(self, key: str) -> Path:
+        """Return the file that holds one cache entry."""
+
+        return self.directory / f"{key}.json"
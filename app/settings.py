@@ -43,6 +43,24 @@ class AppSettings(BaseSettings):
 
     gemini_api_key: str = ""
     gemini_model: str = "gemini-2.5-flash"
+    excel_writer_backend: str = "openpyxl"
+    export_workers: int = 2
+    price_ttl_seconds: int = 900
+    price_source: str = "url"
+    price_source_location: str = ""
+    gemini_image_cache_mb: int = 64
+    gemini_image_cache_entries: int = 32
+    gemini_response_cache_days: int = 30
+    gemini_response_cache_mb: int = 20
+    gemini_image_max_edge: int = 1536
+    gemini_image_format: str = "jpeg"
+    gemini_image_quality: int = 85
+    gemini_combined_suggestions: bool = True
+    gemini_base_url: str = ""
+    gemini_requests_per_minute: int = 30
+    gemini_rate_burst: int = 5
+    gemini_max_attempts: int = 4
+    gemini_deadline_seconds: int = 90
 
     model_config = SettingsConfigDict(
         env_file=_find_env_file(),
@@ -0,0 +1,52 @@
+"""Coalescing of concurrent async requests that share a key."""
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Run one coroutine per key and let concurrent callers share its result.
+
+    A caller that is cancelled stops waiting without disturbing the others;
+    the shared request itself is cancelled only when its last caller leaves.
+    Once it finishes, the next call for the key starts a new request.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the empty table of in-flight requests."""
+
+        self.pending: dict[str, asyncio.Task[T]] = {}
+        self.waiters: dict[str, int] = {}
+
+    async def run(
+        self,
+        key: str,
+        start: Callable[[], Coroutine[Any, Any, T]],
+    ) -> T:
+        """Await the in-flight request for ``key``, starting it when there is none."""
+
+        task = self.pending.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(start())
+            self.pending[key] = task
+            task.add_done_callback(lambda done: self.forget(key, done))
+        self.waiters[key] = self.waiters.get(key, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            if self.waiters[key] == 1 and not task.done():
+                task.cancel()
+            raise
+        finally:
+            self.waiters[key] -= 1
+            if not self.waiters[key]:
+                del self.waiters[key]
+
+    def forget(self, key: str, task: asyncio.Task[T]) -> None:
+        """Drop a finished request so later calls start afresh."""
+
+        if self.pending.get(key) is task:
+            del self.pending[key]
@@ -12,7 +12,9 @@ from app.constants import (
     SUCCESS_SNACKBAR_DURATION_MS,
 )
 from app.gemini import GeminiUserError
-from data import DataShaperFactory
+from app.jobs import ExportJobRecord
+from app.settings import settings
+from data.listing import ListingSpec, export_listing
 from data.models import MarketingTexts
 from data.pricing import PriceSourceError
 
@@ -89,22 +91,55 @@ def validate_fields(maker: "WayfairFlatMaker") -> bool:
     return valid
 
 
+def build_listing_spec(maker: "WayfairFlatMaker") -> ListingSpec:
+    """Snapshot the validated form values into an immutable listing spec."""
+
+    print_type_value = maker.print_type_dd.value
+    if print_type_value is None:
+        raise ValueError("Print type is required before submission.")
+
+    image_links = tuple(
+        (maker.get_image_field(cast(ft.Row, control)).value or "").strip()
+        for control in maker.image_links_column.controls
+        if (maker.get_image_field(cast(ft.Row, control)).value or "").strip()
+    )
+    sizes: list[tuple[int, int]] = []
+    for control in maker.sizes_column.controls:
+        width_field, height_field = get_size_fields(cast(ft.Row, control))
+        sizes.append(
+            (int(cast(str, width_field.value)), int(cast(str, height_field.value)))
+        )
+
+    return ListingSpec(
+        print_type=print_type_value,
+        title=cast(str, maker.title_field.value),
+        sku=cast(str, maker.sku_field.value),
+        keyword=cast(str, maker.keyword_field.value),
+        image_links=image_links,
+        sizes=tuple(sizes),
+        color_choice=maker.design_radio.value or "no",
+        personalization_choice=maker.personalization_radio.value or "No",
+        fresh_ai_texts=bool(maker.fresh_ai_switch.value),
+    )
+
+
 async def get_ai_marketing_texts(
     maker: "WayfairFlatMaker",
     title: str,
     keyword: str,
     print_type_value: str,
+    fresh: bool,
 ) -> tuple[MarketingTexts | None, str | None]:
     """Return AI-generated marketing texts plus a user-facing warning if needed."""
 
     if not maker.gemini_client.is_configured:
         return None, None
     try:
-        texts = await asyncio.to_thread(
-            maker.gemini_client.generate_marketing_texts,
+        texts = await maker.marketing_prefetcher.get(
             title,
             keyword,
             print_type_value,
+            fresh,
         )
         return texts, None
     except GeminiUserError as exc:
@@ -115,11 +150,49 @@ async def get_ai_marketing_texts(
         )
 
 
+def describe_export_error(maker: "WayfairFlatMaker", exc: Exception) -> str:
+    """Return a user-facing message for a failed export job."""
+
+    if isinstance(exc, PriceSourceError):
+        return maker._(
+            "Could not load price data. Check your internet connection and try again."
+        )
+    return maker._("Error: %(err)s") % {"err": exc}
+
+
+async def run_export_job(maker: "WayfairFlatMaker", record: ExportJobRecord) -> None:
+    """Generate texts, then shape and save one queued listing in a worker thread."""
+
+    spec = record.job.spec
+    marketing_texts, record.warning = await get_ai_marketing_texts(
+        maker,
+        spec.title,
+        spec.keyword,
+        spec.print_type,
+        spec.fresh_ai_texts,
+    )
+
+    loop = asyncio.get_running_loop()
+
+    def report_progress(done: int, total: int) -> None:
+        """Hand progress from the worker thread back to the event loop."""
+
+        loop.call_soon_threadsafe(maker.job_queue.report_progress, record, done, total)
+
+    record.output_path = await asyncio.to_thread(
+        export_listing,
+        spec,
+        maker.price_provider,
+        record.job.folder,
+        writer_backend=settings.excel_writer_backend,
+        marketing_texts=marketing_texts,
+        on_progress=report_progress,
+    )
+
+
 async def clear_errors(maker: "WayfairFlatMaker") -> None:
     """Clear highlighted errors after a short delay."""
 
-    maker.progress_ring.visible = False
-    maker.page.update()
     await asyncio.sleep(ERROR_HIGHLIGHT_DURATION_SECONDS)
 
     if maker.print_type_dd.error_text:
@@ -168,16 +241,11 @@ async def submit_form(
     maker: "WayfairFlatMaker",
     folder: str | os.PathLike[str],
 ) -> None:
-    """Validate inputs, generate the spreadsheet, and report the result."""
+    """Validate inputs, queue the export job, and reset the form."""
 
-    maker.progress_ring.visible = True
-    maker.success_icon.visible = False
     maker.submit_button.disabled = True
     maker.page.update()
 
-    await asyncio.sleep(0.1)
-
-    generated = False
     try:
         if not validate_fields(maker):
             snack_bar = ft.SnackBar(
@@ -190,93 +258,25 @@ async def submit_form(
             await clear_errors(maker)
             return
 
-        print_type_value = maker.print_type_dd.value
-        if print_type_value is None:
-            raise ValueError("Print type is required before submission.")
-        shaper = DataShaperFactory.create_shaper(print_type_value)
-
-        title = maker.title_field.value
-        sku = maker.sku_field.value
-        keyword = maker.keyword_field.value
-        image_links = [
-            maker.get_image_field(cast(ft.Row, control)).value.strip()
-            for control in maker.image_links_column.controls
-            if (maker.get_image_field(cast(ft.Row, control)).value or "").strip()
-        ]
-        design_choice = maker.design_radio.value or "no"
-        personalization_choice = maker.personalization_radio.value or "No"
+        spec = build_listing_spec(maker)
         if maker.gemini_client.is_configured:
-            maker.submit_button_text.value = maker._("Generating...")
-            maker.page.update()
-        marketing_texts, ai_warning = await get_ai_marketing_texts(
-            maker,
-            cast(str, title),
-            cast(str, keyword),
-            print_type_value,
-        )
-
-        for control in maker.sizes_column.controls:
-            row = cast(ft.Row, control)
-            width_field, height_field = get_size_fields(row)
-            width = int(cast(str, width_field.value))
-            height = int(cast(str, height_field.value))
-            price: float | dict[str, float]
-            if print_type_value == "wallpapers":
-                price = maker.price_provider.get_wallpaper_prices(width, height)
-            else:
-                price = maker.price_provider.get_decal_price(
-                    width,
-                    height,
-                    design_choice,
-                )
-            shaper.add_record(
-                title=cast(str, title),
-                keyword=cast(str, keyword),
-                sku=cast(str, sku),
-                image_links=image_links,
-                height=height,
-                width=width,
-                price=price,
-                color_choice=design_choice if print_type_value == "decals" else "no",
-                personalization_choice=(
-                    personalization_choice if print_type_value == "decals" else "No"
-                ),
-                marketing_texts=marketing_texts,
+            maker.marketing_prefetcher.reserve(
+                spec.title,
+                spec.keyword,
+                spec.print_type,
+                spec.fresh_ai_texts,
             )
-
-        shaper.write_file(cast(str, sku), folder)
-
-        maker.progress_ring.visible = False
-        maker.success_icon.visible = True
-
-        message = ai_warning or maker._("Spreadsheet generated")
+        maker.job_queue.submit(spec, folder)
         snack_bar = ft.SnackBar(
-            ft.Text(message),
+            ft.Text(maker._("Added to the export queue")),
             duration=SUCCESS_SNACKBAR_DURATION_MS,
-            bgcolor=ft.Colors.ORANGE_100 if ai_warning else ft.Colors.GREEN_100,
-            show_close_icon=bool(ai_warning),
+            bgcolor=ft.Colors.GREEN_100,
         )
         maker.page.show_dialog(snack_bar)
-        generated = True
         maker.reset_form()
-        maker.page.update()
-    except PriceSourceError:
-        maker.progress_ring.visible = False
-        alert = ft.AlertDialog(
-            title=ft.Text(
-                maker._(
-                    "Could not load price data. Check your internet connection and try again."
-                )
-            )
-        )
-        maker.page.show_dialog(alert)
     except Exception as ex:
-        maker.progress_ring.visible = False
         alert = ft.AlertDialog(title=ft.Text(maker._("Error: %(err)s") % {"err": ex}))
         maker.page.show_dialog(alert)
     finally:
-        if not generated:
-            maker.progress_ring.visible = False
         maker.submit_button.disabled = False
-        maker.submit_button_text.value = maker._("Generate Spreadsheet")
         maker.page.update()
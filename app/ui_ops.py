@@ -5,6 +5,8 @@ from typing import TYPE_CHECKING, cast
 import flet as ft
 
 from app.constants import AUTOFILL_HELPER_TEXT, MAIN_IMAGE_WARNING
+from app.helpers import format_age
+from app.jobs import ExportJobRecord, ExportJobStatus
 
 if TYPE_CHECKING:
     from app.flat_maker import WayfairFlatMaker
@@ -74,6 +76,7 @@ def apply_i18n(maker: "WayfairFlatMaker") -> None:
     maker.keyword_field.label = maker._("Keywords")
     maker.keyword_field.hint_text = get_keyword_hint(maker)
     maker.suggest_button_text.value = maker._("✨ Suggest title & keywords")
+    maker.fresh_ai_switch.label = maker._("Skip cached AI results")
     maker.main_image_note.value = maker._(MAIN_IMAGE_WARNING)
     maker.submit_button_text.value = maker._("Generate Spreadsheet")
     get_radio_control(maker.design_radio, 0).label = maker._("Yes")
@@ -103,9 +106,99 @@ def apply_i18n(maker: "WayfairFlatMaker") -> None:
         if index == 0 and maker.suggest_progress_ring not in row.controls:
             row.controls.append(maker.suggest_progress_ring)
 
+    maker.refresh_prices_button.tooltip = maker._("Refresh prices")
+    update_price_age(maker)
+    for record in maker.job_queue.records:
+        update_export_job_entry(maker, record)
+
     maker.toggle_main_image_note()
 
 
+def update_price_age(maker: "WayfairFlatMaker") -> None:
+    """Show how old the active price table is."""
+
+    age = maker.price_provider.table_age()
+    maker.price_age_row.visible = age is not None
+    if age is not None:
+        maker.price_age_text.value = maker._("Price table age: %(age)s") % {
+            "age": format_age(age)
+        }
+
+
+def describe_export_job(maker: "WayfairFlatMaker", record: ExportJobRecord) -> str:
+    """Build the one-line status text of an export job."""
+
+    parts = [record.job.spec.sku]
+    if record.status is ExportJobStatus.QUEUED:
+        parts.append(maker._("Queued"))
+    elif record.status is ExportJobStatus.RUNNING:
+        progress = (
+            f" {record.steps_done}/{record.steps_total}" if record.steps_total else ""
+        )
+        parts.append(f"{maker._('Generating...')}{progress}")
+    else:
+        if record.duration is not None:
+            parts.append(f"{record.duration:.1f} s")
+        if record.status is ExportJobStatus.DONE:
+            parts.append(str(record.output_path))
+        else:
+            parts.append(record.error or "")
+    if record.warning:
+        parts.append(record.warning)
+    return " · ".join(parts)
+
+
+def build_export_job_icon(record: ExportJobRecord) -> ft.Control:
+    """Return the status indicator shown before an export job entry."""
+
+    if record.status is ExportJobStatus.RUNNING:
+        return ft.ProgressRing(width=16, height=16)
+    if record.status is ExportJobStatus.DONE:
+        return ft.Icon(ft.Icons.CHECK, color=ft.Colors.GREEN, size=18)
+    if record.status is ExportJobStatus.FAILED:
+        return ft.Icon(ft.Icons.ERROR_OUTLINE, color=ft.Colors.RED_700, size=18)
+    return ft.Icon(ft.Icons.SCHEDULE, color=ft.Colors.GREY_600, size=18)
+
+
+def update_export_job_entry(maker: "WayfairFlatMaker", record: ExportJobRecord) -> None:
+    """Create or refresh the status list entry of one export job."""
+
+    entry = maker.job_entries.get(record.job.job_id)
+    if entry is None:
+        entry = ft.Row(alignment=ft.MainAxisAlignment.CENTER)
+        maker.job_entries[record.job.job_id] = entry
+        maker.jobs_column.controls.insert(0, entry)
+
+    if record.status is ExportJobStatus.FAILED:
+        color = ft.Colors.RED_700
+    elif record.warning:
+        color = ft.Colors.ORANGE_700
+    else:
+        color = None
+    entry.controls = [
+        build_export_job_icon(record),
+        ft.Text(describe_export_job(maker, record), color=color, selectable=True),
+    ]
+
+
+def remove_export_job_entry(maker: "WayfairFlatMaker", record: ExportJobRecord) -> None:
+    """Remove the status list entry of a job the queue no longer keeps."""
+
+    entry = maker.job_entries.pop(record.job.job_id, None)
+    if entry is not None and entry in maker.jobs_column.controls:
+        maker.jobs_column.controls.remove(entry)
+
+
+def render_export_job(maker: "WayfairFlatMaker", record: ExportJobRecord) -> None:
+    """Refresh one job entry and the submit-row activity indicators."""
+
+    update_export_job_entry(maker, record)
+    busy = maker.job_queue.active_count > 0
+    maker.progress_ring.visible = busy
+    maker.success_icon.visible = not busy and record.status is ExportJobStatus.DONE
+    maker.page.update()
+
+
 def add_size(maker: "WayfairFlatMaker") -> None:
     """Append a new size row."""
 
@@ -189,6 +282,8 @@ def reset_form(maker: "WayfairFlatMaker") -> None:
     reset_dynamic_controls(maker)
     maker.set_print_type_visibility()
     maker.toggle_main_image_note()
+    maker.marketing_prefetcher.cancel_speculation()
+    maker.image_prefetcher.cancel()
 
 
 def init_ui(maker: "WayfairFlatMaker") -> None:
@@ -213,6 +308,7 @@ def init_ui(maker: "WayfairFlatMaker") -> None:
         ft.Row(
             controls=[maker.image_buttons_row], alignment=ft.MainAxisAlignment.CENTER
         ),
+        ft.Row(controls=[maker.fresh_ai_switch], alignment=ft.MainAxisAlignment.CENTER),
         ft.Row(
             controls=[maker.design_container], alignment=ft.MainAxisAlignment.CENTER
         ),
@@ -227,4 +323,6 @@ def init_ui(maker: "WayfairFlatMaker") -> None:
         ft.Row(controls=[maker.buttons_row], alignment=ft.MainAxisAlignment.CENTER),
         ft.Divider(),
         ft.Row(controls=[maker.submit_row], alignment=ft.MainAxisAlignment.CENTER),
+        maker.price_age_row,
+        maker.jobs_column,
     )
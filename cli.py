@@ -0,0 +1,162 @@
+"""Headless entry point that generates spreadsheets from a listing manifest."""
+
+import argparse
+from collections.abc import Sequence
+import os
+from pathlib import Path
+import sys
+import time
+
+from data.batch import BatchWorkbookExport
+from data.manifest import ManifestError, load_manifest
+from data.parallel import ListingResult, ParallelListingGenerator
+from data.price_sources import (
+    PRICE_SOURCES,
+    URL_PRICE_SOURCE,
+    PriceProviderFactory,
+)
+from data.pricing import PriceSourceError
+from data.writer_factory import OPENPYXL_WRITER_BACKEND, XML_WRITER_BACKEND
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+
+    parser = argparse.ArgumentParser(
+        description=(
+            "Generate Wayfair spreadsheets from a CSV or JSON manifest with one "
+            "listing per entry."
+        ),
+    )
+    parser.add_argument("manifest", type=Path, help="Path to a .csv or .json file.")
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        default=Path.cwd(),
+        help="Folder for generated workbooks (default: current directory).",
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="NAME",
+        help="Write every listing into one workbook named NAME instead of one per SKU.",
+    )
+    parser.add_argument(
+        "--writer",
+        choices=(OPENPYXL_WRITER_BACKEND, XML_WRITER_BACKEND),
+        default=OPENPYXL_WRITER_BACKEND,
+        help="Workbook writer backend (default: %(default)s).",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for generation; 1 runs in-process (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--price-source",
+        choices=PRICE_SOURCES,
+        default=URL_PRICE_SOURCE,
+        help="Where prices come from (default: %(default)s).",
+    )
+    parser.add_argument(
+        "--price-location",
+        default="",
+        help=(
+            "Sheet CSV URL, local .csv/.xlsx price file, or snapshot cache file; "
+            "empty uses the source's default."
+        ),
+    )
+    return parser
+
+
+def print_result(result: ListingResult, completed: int, total: int) -> None:
+    """Print one per-listing progress line."""
+
+    status = "ok" if result.ok else "FAILED"
+    detail = result.error if result.error else (result.output_path or "batched")
+    print(
+        f"[{completed:>{len(str(total))}}/{total}] #{result.index} {result.sku}: "
+        f"{status} in {result.seconds:.3f}s - {detail}",
+        flush=True,
+    )
+
+
+def print_summary(results: Sequence[ListingResult], elapsed: float) -> None:
+    """Print totals for the whole run."""
+
+    succeeded = sum(1 for result in results if result.ok)
+    failed = len(results) - succeeded
+    shaping_seconds = sum(result.seconds for result in results)
+    average = shaping_seconds / len(results) if results else 0.0
+    print(
+        f"Done: {succeeded} generated, {failed} failed, {len(results)} total "
+        f"in {elapsed:.2f}s (avg {average:.3f}s per listing)."
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    """Generate every manifest listing and return the process exit code."""
+
+    started = time.perf_counter()
+    try:
+        specs = load_manifest(args.manifest)
+    except (OSError, ManifestError) as exc:
+        print(f"Could not read manifest: {exc}", file=sys.stderr)
+        return 2
+
+    try:
+        price_provider = PriceProviderFactory.create_provider(
+            args.price_source, args.price_location
+        )
+    except PriceSourceError as exc:
+        print(f"Could not load price data: {exc}", file=sys.stderr)
+        return 2
+    price_started = time.perf_counter()
+    try:
+        price_provider.get_price_table()
+    except PriceSourceError as exc:
+        print(f"Could not load price data: {exc}", file=sys.stderr)
+        return 2
+    if price_provider.loaded_from_disk:
+        try:
+            price_provider.refresh()
+        except PriceSourceError as exc:
+            print(f"Using cached price data: {exc}", file=sys.stderr)
+    print(f"Price table loaded in {time.perf_counter() - price_started:.3f}s.")
+
+    batch = BatchWorkbookExport(args.writer) if args.batch else None
+    generator = ParallelListingGenerator(
+        price_provider, writer_backend=args.writer, workers=max(args.workers, 1)
+    )
+    results = generator.generate(
+        specs,
+        args.output,
+        batch=batch,
+        on_progress=lambda result, completed: print_result(
+            result, completed, len(specs)
+        ),
+    )
+
+    if batch is not None and len(batch):
+        batch_size = len(batch)
+        write_started = time.perf_counter()
+        output_path = batch.write_file(args.batch, args.output)
+        print(
+            f"Batch workbook with {batch_size} listings saved in "
+            f"{time.perf_counter() - write_started:.3f}s - {output_path}"
+        )
+
+    print_summary(results, time.perf_counter() - started)
+    return 0 if all(result.ok for result in results) else 1
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Parse arguments and run the headless generator."""
+
+    return run(build_parser().parse_args(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
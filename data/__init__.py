@@ -1,7 +1,23 @@
 """Public data-layer exports."""
 
+from data.batch import BatchWorkbookExport
 from data.factory import DataShaperFactory
 from data.excel_writer import ExcelWriter
+from data.parallel import ParallelListingGenerator
+from data.price_cache import CachedPriceProvider
+from data.price_sources import PriceProviderFactory
 from data.pricing import PriceProvider
+from data.writer_factory import ExcelWriterFactory
+from data.xml_writer import XmlPatchExcelWriter
 
-__all__ = ["DataShaperFactory", "ExcelWriter", "PriceProvider"]
+__all__ = [
+    "BatchWorkbookExport",
+    "CachedPriceProvider",
+    "DataShaperFactory",
+    "ExcelWriter",
+    "ExcelWriterFactory",
+    "ParallelListingGenerator",
+    "PriceProvider",
+    "PriceProviderFactory",
+    "XmlPatchExcelWriter",
+]
@@ -3,26 +3,41 @@
 from abc import ABC, abstractmethod
 from collections.abc import Mapping, Sequence
 import os
+from pathlib import Path
+from typing import ClassVar
 
-from data.excel_writer import ExcelWriter
 from data.models import (
     AdditionalImageRow,
+    ExportRow,
     MarketingTexts,
     PackageParameters,
     PriceInput,
     RowData,
 )
+from data.writer_factory import OPENPYXL_WRITER_BACKEND, ExcelWriterFactory
 
 
 class BaseDataShaper(ABC):
-    """Base class for product-specific data shapers."""
+    """Base class for product-specific data shapers.
 
-    def __init__(self, sheet_name: str) -> None:
+    Each export row is a chain of three blocks: the values of one variant, the
+    values shared by every variant of a record, and the class-wide
+    ``STATIC_COLUMNS`` that never change. Writers read the blocks in place, so
+    the constant columns are built once per class instead of once per row.
+    """
+
+    STATIC_COLUMNS: ClassVar[RowData] = {}
+
+    def __init__(
+        self,
+        sheet_name: str,
+        writer_backend: str = OPENPYXL_WRITER_BACKEND,
+    ) -> None:
         """Initialize shared storage and the workbook writer."""
 
-        self.rows: list[RowData] = []
+        self.rows: list[ExportRow] = []
         self.additional_image_rows: list[AdditionalImageRow] = []
-        self.writer = ExcelWriter(sheet_name=sheet_name)
+        self.writer = ExcelWriterFactory.create_writer(sheet_name, writer_backend)
 
     @abstractmethod
     def set_texts(self, keyword: str, **kwargs: str) -> MarketingTexts:
@@ -100,50 +115,71 @@ class BaseDataShaper(ABC):
 
         return f"{int(width)}x{int(height)} inches"
 
+    def append_row(self, variant_values: RowData, record_values: RowData) -> None:
+        """Append a row layering variant and record values over the static columns.
+
+        The keys that ``take_rows`` groups, sorts or removes belong in
+        ``variant_values``: they are read from that block directly.
+        """
+
+        self.rows.append(ExportRow(variant_values, record_values, self.STATIC_COLUMNS))
+
     @staticmethod
-    def finalize_row(row: RowData) -> RowData:
+    def finalize_row(row: ExportRow) -> ExportRow:
         """Remove internal sorting keys from an export row."""
 
-        row.pop("variant_sort_price", None)
-        row.pop("variant_sort_area", None)
-        row.pop("variant_sort_order", None)
+        variant_values = row.maps[0]
+        variant_values.pop("variant_sort_price", None)
+        variant_values.pop("variant_sort_area", None)
+        variant_values.pop("variant_sort_order", None)
         return row
 
     def apply_primary_variant_flags(self, sku: str) -> None:
         """Mark the cheapest variant in a group as the primary variant."""
 
-        group_rows = [row for row in self.rows if row.get("Group Reference ID") == sku]
+        group_rows = [
+            row for row in self.rows if row.maps[0].get("Group Reference ID") == sku
+        ]
         if not group_rows:
             return
 
         primary_row = min(
             group_rows,
             key=lambda row: (
-                float(row.get("variant_sort_price", float("inf"))),
-                float(row.get("variant_sort_area", float("inf"))),
-                int(row.get("variant_sort_order", 0)),
+                float(row.maps[0].get("variant_sort_price", float("inf"))),
+                float(row.maps[0].get("variant_sort_area", float("inf"))),
+                int(row.maps[0].get("variant_sort_order", 0)),
             ),
         )
         for row in group_rows:
-            row["Variant Type"] = (
+            row.maps[0]["Variant Type"] = (
                 "Primary Variant" if row is primary_row else "Non-Primary Variant"
             )
 
-    def write_file(self, sku: str, folder: str | os.PathLike[str]) -> None:
-        """Finalize row ordering and write the workbook to disk."""
+    def take_rows(self, sku: str) -> tuple[list[ExportRow], list[AdditionalImageRow]]:
+        """Finalize row ordering and hand over the collected export rows."""
 
         self.apply_primary_variant_flags(sku)
         self.rows.sort(
             key=lambda item: (
-                0 if "Peel-n-Stick" in item.get("Manufacturer Part Number", "") else 1
+                0
+                if "Peel-n-Stick" in item.maps[0].get("Manufacturer Part Number", "")
+                else 1
             )
         )
-        self.rows = [self.finalize_row(row) for row in self.rows]
-        self.writer.write_data_with_additional_images(
-            self.rows,
-            self.additional_image_rows,
+        rows = [self.finalize_row(row) for row in self.rows]
+        additional_image_rows = list(self.additional_image_rows)
+        self.rows.clear()
+        self.additional_image_rows.clear()
+        return rows, additional_image_rows
+
+    def write_file(self, sku: str, folder: str | os.PathLike[str]) -> Path:
+        """Finalize row ordering and write the workbook to disk."""
+
+        rows, additional_image_rows = self.take_rows(sku)
+        return self.writer.write_data_with_additional_images(
+            rows,
+            additional_image_rows,
             sku,
             folder,
         )
-        self.rows.clear()
-        self.additional_image_rows.clear()
@@ -0,0 +1,90 @@
+"""Batch export that writes many SKUs into a single workbook."""
+
+import os
+from pathlib import Path
+
+from data.base_shaper import BaseDataShaper
+from data.excel_writer import (
+    ADDITIONAL_IMAGES_SHEET,
+    ADDITIONAL_IMAGES_START_ROW,
+    HEADER_ROW,
+    MAIN_SHEET_START_ROW,
+    SheetRows,
+)
+from data.models import AdditionalImageRow, ExportRow
+from data.writer_factory import OPENPYXL_WRITER_BACKEND, ExcelWriterFactory
+
+
+class BatchWorkbookExport:
+    """Collect finalized rows of many SKUs and save them in one workbook.
+
+    Decal and wallpaper rows land in their own template sheets, so a single
+    template copy and a single save cover the whole batch.
+    """
+
+    def __init__(self, writer_backend: str = OPENPYXL_WRITER_BACKEND) -> None:
+        """Initialize empty per-sheet row storage."""
+
+        self.writer_backend = writer_backend
+        self.rows_by_sheet: dict[str, list[ExportRow]] = {}
+        self.additional_image_rows: list[AdditionalImageRow] = []
+        self.skus: list[str] = []
+
+    def __len__(self) -> int:
+        """Return the number of SKUs collected so far."""
+
+        return len(self.skus)
+
+    def add_shaper(self, shaper: BaseDataShaper, sku: str) -> None:
+        """Move one SKU's finalized rows from a shaper into the batch."""
+
+        rows, additional_image_rows = shaper.take_rows(sku)
+        self.add_rows(shaper.writer.sheet_name, rows, additional_image_rows, sku)
+
+    def add_rows(
+        self,
+        sheet_name: str,
+        rows: list[ExportRow],
+        additional_image_rows: list[AdditionalImageRow],
+        sku: str,
+    ) -> None:
+        """Append already finalized rows of one SKU to the batch."""
+
+        self.rows_by_sheet.setdefault(sheet_name, []).extend(rows)
+        self.additional_image_rows.extend(additional_image_rows)
+        self.skus.append(sku)
+
+    def build_sheet_rows(self) -> list[SheetRows]:
+        """Describe which collected rows go to which template sheet."""
+
+        sheets = [
+            SheetRows(sheet_name, MAIN_SHEET_START_ROW, HEADER_ROW, rows)
+            for sheet_name, rows in self.rows_by_sheet.items()
+            if rows
+        ]
+        if self.additional_image_rows:
+            sheets.append(
+                SheetRows(
+                    ADDITIONAL_IMAGES_SHEET,
+                    start_row=ADDITIONAL_IMAGES_START_ROW,
+                    header_row=HEADER_ROW,
+                    rows=self.additional_image_rows,
+                )
+            )
+        return sheets
+
+    def write_file(self, name: str, folder: str | os.PathLike[str]) -> Path:
+        """Write every collected SKU into one workbook and reset the batch."""
+
+        if not self.rows_by_sheet:
+            raise ValueError("The batch has no rows to export.")
+
+        writer = ExcelWriterFactory.create_writer(
+            next(iter(self.rows_by_sheet)),
+            self.writer_backend,
+        )
+        output_path = writer.write_new_workbook(self.build_sheet_rows(), name, folder)
+        self.rows_by_sheet.clear()
+        self.additional_image_rows.clear()
+        self.skus.clear()
+        return output_path
@@ -5,6 +5,7 @@ from data.decal_shaper import DecalDataShaper
 from data.factory import DataShaperFactory
 from data.models import (
     AdditionalImageRow,
+    ExportRow,
     MarketingTexts,
     PackageParameters,
     PriceInput,
@@ -19,6 +20,7 @@ __all__ = [
     "BaseDataShaper",
     "DataShaperFactory",
     "DecalDataShaper",
+    "ExportRow",
     "MarketingTexts",
     "PackageParameters",
     "PriceInput",
@@ -1,6 +1,7 @@
 """Data shaper for Wayfair wall-sticker exports."""
 
 from collections.abc import Sequence
+from typing import ClassVar
 
 from data.base_shaper import BaseDataShaper
 from data.models import (
@@ -10,16 +11,55 @@ from data.models import (
     RowData,
     WAYFAIR_COMPLIANCE_VERIFIED_PROGRAM,
 )
+from data.writer_factory import OPENPYXL_WRITER_BACKEND
 
 
 class DecalDataShaper(BaseDataShaper):
     """Data shaper for decal listings."""
 
-    def __init__(self) -> None:
+    STATIC_COLUMNS: ClassVar[RowData] = {
+        "Brand": "Stickalz",
+        "Minimum Order Quantity": 1,
+        "Force Quantity Multiplier": 1,
+        "Display Set Quantity": 1,
+        "Ship Type": "Small Parcel",
+        "Freight Class": 400,
+        "Lead Time": 72,
+        "Replacement Lead Time": 72,
+        "Warning Required": "No",
+        "Country Of Manufacturer": "United States",
+        "Product Type": "Accent",
+        "Subject": "Fashion",
+        "Surface Type": "Glossy",
+        "Material": "Vinyl",
+        "Compatible Surfaces": "Multi-Surface;Flat Surface;Glass Wall;Stainless Steel;Existing Tile;Chalkboard;Appliance;Mirror;Acrylic Panel;Laminate;Plywood Wall;Drywall;Ceramic Tile Wall;Concrete;Stone Wall",
+        "Age Group": "All Ages",
+        "Room Use": "Bedroom;Living Room;Nursery;Home Office;Playroom;School Classroom;Art School",
+        "Holiday / Occasion": "No Holiday",
+        "BPA Free": "No",
+        "Licensed Product Category": "Does Not Apply",
+        "Movie / Show Series Name": "Does Not Apply",
+        "Durability": "Water Resistant;Fade Resistant;Heat Resistant;Stain Resistant;Tip Resistant;Waterproof;Weather Resistant",
+        "Adjustability Features": "Does Not Apply",
+        "General Features": "Non-Wall Damaging",
+        "Total Number of Pieces Included": 1,
+        "Pieces Included": "Does Not Apply",
+        WAYFAIR_COMPLIANCE_VERIFIED_PROGRAM: "No",
+        "Uniform Packaging and Labeling Regulations (UPLR) Compliant": "Yes",
+        "Canada Product Restriction": "No",
+        "Reason for Restriction": "Does Not Apply",
+        "Sustainability & Social Responsibility Certifications (North America Only)": "No",
+        "Commercial Warranty": "Yes",
+        "Commercial Warranty Length": "30 Days",
+        "ISTA Certified": "Does Not Apply",
+    }
+
+    def __init__(self, writer_backend: str = OPENPYXL_WRITER_BACKEND) -> None:
         """Initialize decal-specific constants and templates."""
 
         super().__init__(
             sheet_name="3757 - Wall Stickers",
+            writer_backend=writer_backend,
         )
         self.common_technical_images: list[str] = [
             "https://www.dropbox.com/scl/fi/p5m99jzack5fvidiwb83d/st-4x-100-2000px.jpg?rlkey=i9l7aqtztr0qvhl4fgile9r2j&st=rfddmlym&dl=0",
@@ -146,90 +186,59 @@ class DecalDataShaper(BaseDataShaper):
         size_label = self.format_size(width, height)
         base_cost = self.get_single_price(price)
 
+        record_values: RowData = {
+            "Product Name": f"{title} {sku}",
+            "Variant Grouping 1": (
+                "Color" if normalized_color_choice == "yes" else "Size"
+            ),
+            "Variant Grouping 2": "Size" if normalized_color_choice == "yes" else None,
+            "Variant Attribute Name On Site 2": (
+                size_label if normalized_color_choice == "yes" else None
+            ),
+            "Base Cost": base_cost,
+            "Marketing Copy": texts.marketing_copy,
+            "Feature Bullet 1": texts.feature_bullet_1,
+            "Feature Bullet 2": texts.feature_bullet_2,
+            "Feature Bullet 3": texts.feature_bullet_3,
+            "Feature Bullet 4": texts.feature_bullet_4,
+            "Feature Bullet 5": texts.feature_bullet_5,
+            "Product Weight": package_parameters.weight,
+            "Carton Weight 1": package_parameters.weight,
+            "Carton Height 1": package_parameters.height,
+            "Carton Width 1": package_parameters.width,
+            "Carton Depth 1": package_parameters.depth,
+            "Image File Name or URL 1": image_slots[0],
+            "Image File Name or URL 2": image_slots[1],
+            "Image File Name or URL 3": image_slots[2],
+            "Image File Name or URL 4": image_slots[3],
+            "Image File Name or URL 5": image_slots[4],
+            "Personalization or Monogramming": personalization_choice,
+            "Overall Height - Top to Bottom": height,
+            "Overall Width - Side to Side": width,
+        }
+
         for part_number in part_numbers:
             color_value = (
                 part_number[len(base_number) + 1 :]
                 if normalized_color_choice == "yes"
                 else "Multicolor"
             )
-            data: RowData = {
-                "Brand": "Stickalz",
-                "Supplier Part Number": part_number,
-                "Manufacturer Part Number": part_number,
-                "Product Name": f"{title} {sku}",
-                "Variant Type": "Non-Primary Variant",
-                "Group Reference ID": sku,
-                "Variant Grouping 1": (
-                    "Color" if normalized_color_choice == "yes" else "Size"
-                ),
-                "Variant Attribute Name On Site 1": (
-                    color_value if normalized_color_choice == "yes" else size_label
-                ),
-                "Variant Grouping 2": (
-                    "Size" if normalized_color_choice == "yes" else None
-                ),
-                "Variant Attribute Name On Site 2": (
-                    size_label if normalized_color_choice == "yes" else None
-                ),
-                "Base Cost": base_cost,
-                "Marketing Copy": texts.marketing_copy,
-                "Feature Bullet 1": texts.feature_bullet_1,
-                "Feature Bullet 2": texts.feature_bullet_2,
-                "Feature Bullet 3": texts.feature_bullet_3,
-                "Feature Bullet 4": texts.feature_bullet_4,
-                "Feature Bullet 5": texts.feature_bullet_5,
-                "Minimum Order Quantity": 1,
-                "Force Quantity Multiplier": 1,
-                "Display Set Quantity": 1,
-                "Product Weight": package_parameters.weight,
-                "Ship Type": "Small Parcel",
-                "Freight Class": 400,
-                "Lead Time": 72,
-                "Replacement Lead Time": 72,
-                "Carton Weight 1": package_parameters.weight,
-                "Carton Height 1": package_parameters.height,
-                "Carton Width 1": package_parameters.width,
-                "Carton Depth 1": package_parameters.depth,
-                "Warning Required": "No",
-                "Country Of Manufacturer": "United States",
-                "Image File Name or URL 1": image_slots[0],
-                "Image File Name or URL 2": image_slots[1],
-                "Image File Name or URL 3": image_slots[2],
-                "Image File Name or URL 4": image_slots[3],
-                "Image File Name or URL 5": image_slots[4],
-                "Product Type": "Accent",
-                "Subject": "Fashion",
-                "Surface Type": "Glossy",
-                "Material": "Vinyl",
-                "Compatible Surfaces": "Multi-Surface;Flat Surface;Glass Wall;Stainless Steel;Existing Tile;Chalkboard;Appliance;Mirror;Acrylic Panel;Laminate;Plywood Wall;Drywall;Ceramic Tile Wall;Concrete;Stone Wall",
-                "Age Group": "All Ages",
-                "Personalization or Monogramming": personalization_choice,
-                "Room Use": "Bedroom;Living Room;Nursery;Home Office;Playroom;School Classroom;Art School",
-                "Holiday / Occasion": "No Holiday",
-                "BPA Free": "No",
-                "Licensed Product Category": "Does Not Apply",
-                "Movie / Show Series Name": "Does Not Apply",
-                "Durability": "Water Resistant;Fade Resistant;Heat Resistant;Stain Resistant;Tip Resistant;Waterproof;Weather Resistant",
-                "Adjustability Features": "Does Not Apply",
-                "General Features": "Non-Wall Damaging",
-                "Color": color_value,
-                "Total Number of Pieces Included": 1,
-                "Pieces Included": "Does Not Apply",
-                WAYFAIR_COMPLIANCE_VERIFIED_PROGRAM: "No",
-                "Uniform Packaging and Labeling Regulations (UPLR) Compliant": "Yes",
-                "Canada Product Restriction": "No",
-                "Reason for Restriction": "Does Not Apply",
-                "Sustainability & Social Responsibility Certifications (North America Only)": "No",
-                "Overall Height - Top to Bottom": height,
-                "Overall Width - Side to Side": width,
-                "Commercial Warranty": "Yes",
-                "Commercial Warranty Length": "30 Days",
-                "ISTA Certified": "Does Not Apply",
-                "variant_sort_price": base_cost,
-                "variant_sort_area": width * height,
-                "variant_sort_order": len(self.rows),
-            }
-            self.rows.append(data)
+            self.append_row(
+                {
+                    "Supplier Part Number": part_number,
+                    "Manufacturer Part Number": part_number,
+                    "Variant Type": "Non-Primary Variant",
+                    "Group Reference ID": sku,
+                    "Variant Attribute Name On Site 1": (
+                        color_value if normalized_color_choice == "yes" else size_label
+                    ),
+                    "Color": color_value,
+                    "variant_sort_price": base_cost,
+                    "variant_sort_area": width * height,
+                    "variant_sort_order": len(self.rows),
+                },
+                record_values,
+            )
 
             self.additional_image_rows.extend(
                 [
@@ -1,15 +1,184 @@
 """Workbook writing helpers for Wayfair templates."""
 
+from collections import ChainMap
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass, field
 import datetime
 import os
 from pathlib import Path
+import pickle
+import threading
 from typing import Any
 
 from openpyxl import load_workbook
+from openpyxl.workbook.workbook import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
 
 ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
-RowData = dict[str, Any]
+RowData = Mapping[str, Any]
+HEADER_ROW = 4
+MAIN_SHEET_START_ROW = 8
+ADDITIONAL_IMAGES_SHEET = "Additional Images"
+ADDITIONAL_IMAGES_START_ROW = 7
+
+
+def row_blocks(row: RowData) -> Sequence[RowData]:
+    """Return the key blocks of a row, later blocks overriding earlier ones.
+
+    Layered shaper rows are read block by block, so their shared blocks are
+    never copied into a merged dict per row.
+    """
+
+    if isinstance(row, ChainMap):
+        return row.maps[::-1]
+    return (row,)
+
+
+@dataclass(frozen=True)
+class SheetRows:
+    """Rows destined for one template sheet."""
+
+    sheet_name: str
+    start_row: int
+    header_row: int
+    rows: Sequence[RowData]
+
+
+class UnknownColumnsError(ValueError):
+    """Raised when export rows carry keys that a template sheet has no column for."""
+
+    def __init__(self, sheet_name: str, keys: Iterable[str]) -> None:
+        """Store the sheet name and the sorted unknown keys."""
+
+        self.sheet_name = sheet_name
+        self.keys = tuple(sorted(keys))
+        super().__init__(
+            f"Template sheet '{sheet_name}' has no columns for: {', '.join(self.keys)}."
+        )
+
+
+@dataclass(frozen=True)
+class SheetLayout:
+    """Header-name to column-index map for one template sheet version."""
+
+    sheet_name: str
+    header_row: int
+    start_row: int
+    columns: Mapping[str, int]
+
+    @classmethod
+    def from_header_cells(
+        cls,
+        sheet_name: str,
+        header_row: int,
+        start_row: int,
+        header_cells: Iterable[tuple[int, Any]],
+    ) -> "SheetLayout":
+        """Build a layout from ``(column index, header value)`` pairs."""
+
+        columns: dict[str, int] = {}
+        for column, value in header_cells:
+            if value:
+                columns.setdefault(str(value), column)
+        return cls(sheet_name, header_row, start_row, columns)
+
+    def check_keys(self, rows: Iterable[RowData]) -> None:
+        """Raise when any row carries a key that has no template column.
+
+        Blocks shared between rows are checked once.
+        """
+
+        blocks = {id(block): block for row in rows for block in row_blocks(row)}
+        unknown_keys = (
+            set().union(*(block.keys() for block in blocks.values()))
+            - self.columns.keys()
+        )
+        if unknown_keys:
+            raise UnknownColumnsError(self.sheet_name, unknown_keys)
+
+
+@dataclass(frozen=True)
+class TemplateSnapshot:
+    """Pristine parsed template pinned to one on-disk file version."""
+
+    path: Path
+    mtime_ns: int
+    pickled_workbook: bytes
+    layouts: dict[tuple[str, int, int], SheetLayout] = field(default_factory=dict)
+
+    def clone_workbook(self) -> Workbook:
+        """Return an independent workbook copy of the pristine template."""
+
+        return pickle.loads(self.pickled_workbook)
+
+
+class TemplateCache:
+    """Process-wide cache that parses each template file once per version.
+
+    The parsed workbook is kept as pickled bytes: unpickling is several times
+    cheaper than re-parsing the template XML and always yields a copy that no
+    other export can mutate.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the empty cache and its lock."""
+
+        self._lock = threading.Lock()
+        self._snapshots: dict[Path, TemplateSnapshot] = {}
+
+    def get_snapshot(self, path: Path) -> TemplateSnapshot:
+        """Return the cached snapshot, reloading it when the file has changed."""
+
+        mtime_ns = path.stat().st_mtime_ns
+        with self._lock:
+            snapshot = self._snapshots.get(path)
+            if snapshot is None or snapshot.mtime_ns != mtime_ns:
+                workbook = load_workbook(path)
+                snapshot = TemplateSnapshot(
+                    path=path,
+                    mtime_ns=mtime_ns,
+                    pickled_workbook=pickle.dumps(
+                        workbook, protocol=pickle.HIGHEST_PROTOCOL
+                    ),
+                )
+                self._snapshots[path] = snapshot
+            return snapshot
+
+    def get_layout(
+        self,
+        snapshot: TemplateSnapshot,
+        worksheet: Worksheet,
+        header_row: int,
+        start_row: int,
+    ) -> SheetLayout:
+        """Return the sheet layout, reading its header row on first use."""
+
+        key = (worksheet.title, header_row, start_row)
+        with self._lock:
+            layout = snapshot.layouts.get(key)
+            if layout is None:
+                layout = SheetLayout.from_header_cells(
+                    worksheet.title,
+                    header_row,
+                    start_row,
+                    ((cell.column, cell.value) for cell in worksheet[header_row]),
+                )
+                snapshot.layouts[key] = layout
+            return layout
+
+    def load_workbook(self, path: Path) -> Workbook:
+        """Return a fresh, independent copy of the template workbook."""
+
+        return self.get_snapshot(path).clone_workbook()
+
+    def clear(self) -> None:
+        """Drop every cached template snapshot."""
+
+        with self._lock:
+            self._snapshots.clear()
+
+
+template_cache = TemplateCache()
 
 
 class ExcelWriter:
@@ -20,63 +189,122 @@ class ExcelWriter:
 
         self.template_filename = Path(ASSETS_DIR / "template.xlsx")
         self.sheet_name = sheet_name
-        self.start_row: int = 8
+        self.start_row: int = MAIN_SHEET_START_ROW
+
+    def preload_template(self) -> None:
+        """Parse and cache the template ahead of the first write."""
+
+        template_cache.get_snapshot(self.template_filename)
 
     @staticmethod
     def write_sheet(
         ws: Worksheet,
-        start_row: int,
-        header_row: int,
-        data: list[RowData],
+        layout: SheetLayout,
+        data: Sequence[RowData],
     ) -> None:
-        """Write rows into a worksheet using header names as keys."""
+        """Write only the keys each row carries into their template columns."""
 
-        headers = [cell.value for cell in ws[header_row] if cell.value]
-
-        for i, row_data in enumerate(data, start=start_row):
-            for col_idx, header in enumerate(headers, start=1):
-                if header in row_data:
-                    ws.cell(row=i, column=col_idx, value=row_data[header])
+        layout.check_keys(data)
+        columns = layout.columns
+        for i, row_data in enumerate(data, start=layout.start_row):
+            for block in row_blocks(row_data):
+                for header, value in block.items():
+                    ws.cell(row=i, column=columns[header], value=value)
 
     @staticmethod
     def build_output_path(sku: str, folder: str | os.PathLike[str]) -> Path:
-        """Build and create the target path for a generated workbook."""
+        """Build and reserve a new target path for a generated workbook.
+
+        The file is created empty to claim its name, so exports of the same
+        SKU in the same minute get ``_2``, ``_3``... suffixes instead of
+        overwriting each other.
+        """
 
-        filename = f"{sku}_{datetime.datetime.now().strftime('%d_%m_%Y_%H_%M')}.xlsx"
+        stem = f"{sku}_{datetime.datetime.now().strftime('%d_%m_%Y_%H_%M')}"
         folder_path = Path(folder)
         folder_path.mkdir(parents=True, exist_ok=True)
-        return folder_path / filename
+        output_path = folder_path / f"{stem}.xlsx"
+        counter = 1
+        while True:
+            try:
+                output_path.open("x").close()
+                return output_path
+            except FileExistsError:
+                counter += 1
+                output_path = folder_path / f"{stem}_{counter}.xlsx"
+
+    def write_new_workbook(
+        self,
+        sheets: Sequence[SheetRows],
+        name: str,
+        folder: str | os.PathLike[str],
+    ) -> Path:
+        """Write the sheets to a newly reserved file, removing it on failure."""
+
+        output_path = self.build_output_path(name, folder)
+        try:
+            self.write_workbook(sheets, output_path)
+        except BaseException:
+            output_path.unlink(missing_ok=True)
+            raise
+        return output_path
+
+    def build_sheet_rows(
+        self,
+        new_data: Sequence[RowData],
+        additional_images_data: Sequence[RowData] | None = None,
+    ) -> list[SheetRows]:
+        """Describe which rows go to which template sheet."""
+
+        sheets = [SheetRows(self.sheet_name, self.start_row, HEADER_ROW, new_data)]
+        if additional_images_data:
+            sheets.append(
+                SheetRows(
+                    ADDITIONAL_IMAGES_SHEET,
+                    start_row=ADDITIONAL_IMAGES_START_ROW,
+                    header_row=HEADER_ROW,
+                    rows=additional_images_data,
+                )
+            )
+        return sheets
+
+    def write_workbook(self, sheets: Sequence[SheetRows], output_path: Path) -> None:
+        """Fill a template copy with the given sheet rows and save it."""
+
+        snapshot = template_cache.get_snapshot(self.template_filename)
+        wb = snapshot.clone_workbook()
+        for sheet in sheets:
+            ws = wb[sheet.sheet_name]
+            layout = template_cache.get_layout(
+                snapshot,
+                ws,
+                header_row=sheet.header_row,
+                start_row=sheet.start_row,
+            )
+            self.write_sheet(ws, layout, sheet.rows)
+        wb.save(output_path)
 
     def write_data(
         self,
-        new_data: list[RowData],
+        new_data: Sequence[RowData],
         sku: str,
         folder: str | os.PathLike[str],
-    ) -> None:
+    ) -> Path:
         """Write the main sheet into a new workbook file."""
 
-        wb = load_workbook(self.template_filename)
-        ws = wb[self.sheet_name]
-        self.write_sheet(ws, self.start_row, 4, new_data)
-        wb.save(self.build_output_path(sku, folder))
+        return self.write_new_workbook(self.build_sheet_rows(new_data), sku, folder)
 
     def write_data_with_additional_images(
         self,
-        new_data: list[RowData],
-        additional_images_data: list[RowData],
+        new_data: Sequence[RowData],
+        additional_images_data: Sequence[RowData],
         sku: str,
         folder: str | os.PathLike[str],
-    ) -> None:
+    ) -> Path:
         """Write the main sheet and optional additional-images sheet."""
 
-        wb = load_workbook(self.template_filename)
-        self.write_sheet(wb[self.sheet_name], self.start_row, 4, new_data)
-
-        if additional_images_data:
-            self.write_sheet(
-                wb["Additional Images"],
-                start_row=7,
-                header_row=4,
-                data=additional_images_data,
-            )
-        wb.save(self.build_output_path(sku, folder))
+        return self.write_new_workbook(
+            self.build_sheet_rows(new_data, additional_images_data),
+            sku,
+            folder,
+        )
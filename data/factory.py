@@ -3,17 +3,21 @@
 from data.base_shaper import BaseDataShaper
 from data.decal_shaper import DecalDataShaper
 from data.wallpaper_shaper import WallpaperDataShaper
+from data.writer_factory import OPENPYXL_WRITER_BACKEND
 
 
 class DataShaperFactory:
     """Factory for creating product-specific data shapers."""
 
     @staticmethod
-    def create_shaper(shaper_type: str) -> BaseDataShaper:
+    def create_shaper(
+        shaper_type: str,
+        writer_backend: str = OPENPYXL_WRITER_BACKEND,
+    ) -> BaseDataShaper:
         """Create a data shaper for the given print type."""
 
         if shaper_type == "decals":
-            return DecalDataShaper()
+            return DecalDataShaper(writer_backend=writer_backend)
         if shaper_type == "wallpapers":
-            return WallpaperDataShaper()
+            return WallpaperDataShaper(writer_backend=writer_backend)
         raise ValueError(f"Unknown shaper type: {shaper_type}")
@@ -0,0 +1,123 @@
+"""Listing input snapshot and the shared shape-and-price flow."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+import os
+from pathlib import Path
+
+from data.base_shaper import BaseDataShaper
+from data.factory import DataShaperFactory
+from data.models import MarketingTexts, PriceInput
+from data.pricing import PriceProvider
+from data.writer_factory import OPENPYXL_WRITER_BACKEND
+
+SizePair = tuple[int, int]
+ExportProgressCallback = Callable[[int, int], None]
+
+
+@dataclass(frozen=True)
+class ListingSpec:
+    """Immutable inputs for one generated listing."""
+
+    print_type: str
+    title: str
+    sku: str
+    keyword: str
+    image_links: tuple[str, ...]
+    sizes: tuple[SizePair, ...]
+    color_choice: str = "no"
+    personalization_choice: str = "No"
+    fresh_ai_texts: bool = False
+
+    @property
+    def is_decal(self) -> bool:
+        """Return whether the listing uses the decal shaping flow."""
+
+        return self.print_type == "decals"
+
+
+def shape_listing(
+    spec: ListingSpec,
+    price_provider: PriceProvider,
+    writer_backend: str = OPENPYXL_WRITER_BACKEND,
+    marketing_texts: MarketingTexts | None = None,
+    on_progress: ExportProgressCallback | None = None,
+) -> BaseDataShaper:
+    """Price every size of a listing and return the filled shaper.
+
+    ``on_progress`` is called with ``(sizes_done, sizes_total)`` after each size.
+    """
+
+    shaper = DataShaperFactory.create_shaper(
+        spec.print_type,
+        writer_backend=writer_backend,
+    )
+    widths = [width for width, _ in spec.sizes]
+    heights = [height for _, height in spec.sizes]
+    prices: list[PriceInput]
+    if spec.print_type == "wallpapers":
+        price_matrix = price_provider.get_wallpaper_price_matrix(widths, heights)
+        prices = [
+            {
+                material: material_prices[index]
+                for material, material_prices in price_matrix.items()
+            }
+            for index in range(len(spec.sizes))
+        ]
+    else:
+        prices = list(
+            price_provider.get_decal_prices(widths, heights, spec.color_choice)
+        )
+
+    for done, ((width, height), price) in enumerate(zip(spec.sizes, prices), start=1):
+        shaper.add_record(
+            title=spec.title,
+            keyword=spec.keyword,
+            sku=spec.sku,
+            image_links=spec.image_links,
+            height=height,
+            width=width,
+            price=price,
+            color_choice=spec.color_choice if spec.is_decal else "no",
+            personalization_choice=(
+                spec.personalization_choice if spec.is_decal else "No"
+            ),
+            marketing_texts=marketing_texts,
+        )
+        if on_progress is not None:
+            on_progress(done, len(spec.sizes))
+    return shaper
+
+
+def export_listing(
+    spec: ListingSpec,
+    price_provider: PriceProvider,
+    folder: str | os.PathLike[str],
+    writer_backend: str = OPENPYXL_WRITER_BACKEND,
+    marketing_texts: MarketingTexts | None = None,
+    on_progress: ExportProgressCallback | None = None,
+) -> Path:
+    """Shape a listing, save its workbook and return the saved path.
+
+    Progress counts every priced size plus one final step for the save, so
+    callers can run this in a worker thread and mirror the steps in a UI.
+    """
+
+    total_steps = len(spec.sizes) + 1
+
+    def report(done: int, _sizes_total: int) -> None:
+        """Forward size progress with the save step included in the total."""
+
+        if on_progress is not None:
+            on_progress(done, total_steps)
+
+    shaper = shape_listing(
+        spec,
+        price_provider,
+        writer_backend=writer_backend,
+        marketing_texts=marketing_texts,
+        on_progress=report,
+    )
+    output_path = shaper.write_file(spec.sku, folder)
+    report(total_steps, total_steps)
+    return output_path
@@ -0,0 +1,157 @@
+"""CSV and JSON manifest parsing for headless batch generation."""
+
+from collections.abc import Iterable, Mapping
+import csv
+from io import StringIO
+import json
+from pathlib import Path
+import re
+from typing import Any
+
+from data.listing import ListingSpec, SizePair
+
+PRINT_TYPES = ("decals", "wallpapers")
+LINK_SEPARATOR_PATTERN = re.compile(r"[;|\s]+")
+SIZE_SEPARATOR_PATTERN = re.compile(r"[;,|\s]+")
+SIZE_PATTERN = re.compile(r"^(\d+)[xX×](\d+)$")
+
+
+class ManifestError(ValueError):
+    """Raised when a manifest entry cannot be turned into a listing."""
+
+
+def load_manifest(path: str | Path) -> list[ListingSpec]:
+    """Read listings from a ``.csv`` or ``.json`` manifest file."""
+
+    manifest_path = Path(path)
+    text = manifest_path.read_text(encoding="utf-8-sig")
+    if manifest_path.suffix.lower() == ".json":
+        return parse_json_manifest(text)
+    return parse_csv_manifest(text)
+
+
+def parse_json_manifest(text: str) -> list[ListingSpec]:
+    """Parse a JSON list of listings, optionally wrapped in ``{"listings": ...}``."""
+
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError as exc:
+        raise ManifestError(f"Manifest is not valid JSON: {exc}") from exc
+    if isinstance(data, Mapping):
+        data = data.get("listings")
+    if not isinstance(data, list):
+        raise ManifestError("JSON manifest must be a list of listings.")
+    return [parse_entry(entry, index) for index, entry in enumerate(data, start=1)]
+
+
+def parse_csv_manifest(text: str) -> list[ListingSpec]:
+    """Parse a CSV manifest with one listing per row.
+
+    Quoted cells may span several lines; entries are numbered by the line
+    their row starts on.
+    """
+
+    reader = csv.DictReader(StringIO(text, newline=""))
+    specs: list[ListingSpec] = []
+    line_number = 2
+    for row in reader:
+        if any(
+            (value or "").strip() for value in row.values() if isinstance(value, str)
+        ):
+            specs.append(parse_entry(row, line_number))
+        line_number = reader.line_num + 1
+    return specs
+
+
+def parse_entry(entry: Any, line: int) -> ListingSpec:
+    """Validate one manifest entry and build its listing snapshot."""
+
+    if not isinstance(entry, Mapping):
+        raise ManifestError(f"Entry {line}: expected an object with listing fields.")
+
+    print_type = text_field(entry, "print_type", line).lower()
+    if print_type not in PRINT_TYPES:
+        raise ManifestError(
+            f"Entry {line}: print_type must be one of {', '.join(PRINT_TYPES)}."
+        )
+
+    image_links = tuple(split_list(entry.get("image_links"), LINK_SEPARATOR_PATTERN))
+    if not image_links:
+        raise ManifestError(f"Entry {line}: at least one image link is required.")
+
+    sizes = tuple(parse_sizes(entry.get("sizes"), line))
+    if not sizes:
+        raise ManifestError(f"Entry {line}: at least one size is required.")
+
+    color_choice = normalize_choice(entry.get("color_choice"), "no", line)
+    personalization_choice = normalize_choice(
+        entry.get("personalization_choice"), "No", line
+    ).capitalize()
+    return ListingSpec(
+        print_type=print_type,
+        title=text_field(entry, "title", line),
+        sku=text_field(entry, "sku", line),
+        keyword=text_field(entry, "keyword", line),
+        image_links=image_links,
+        sizes=sizes,
+        color_choice=color_choice,
+        personalization_choice=personalization_choice,
+    )
+
+
+def text_field(entry: Mapping[str, Any], key: str, line: int) -> str:
+    """Return a required non-empty text field."""
+
+    value = entry.get(key)
+    text = str(value).strip() if value is not None else ""
+    if not text:
+        raise ManifestError(f"Entry {line}: {key} is required.")
+    return text
+
+
+def normalize_choice(value: Any, default: str, line: int) -> str:
+    """Return ``yes``/``no`` for a Yes/No manifest column."""
+
+    if value is None or (isinstance(value, str) and not value.strip()):
+        return default
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    text = str(value).strip().lower()
+    if text in {"yes", "y", "true", "1"}:
+        return "yes"
+    if text in {"no", "n", "false", "0"}:
+        return "no"
+    raise ManifestError(f"Entry {line}: expected Yes or No, got {value!r}.")
+
+
+def split_list(value: Any, separator: re.Pattern[str]) -> Iterable[str]:
+    """Split a list-like manifest value into trimmed non-empty strings."""
+
+    if value is None:
+        return []
+    if isinstance(value, list):
+        items = value
+    else:
+        items = separator.split(str(value))
+    return [str(item).strip() for item in items if str(item).strip()]
+
+
+def parse_sizes(value: Any, line: int) -> Iterable[SizePair]:
+    """Parse ``WxH`` sizes from a string or a list of pairs."""
+
+    if isinstance(value, list) and all(
+        isinstance(item, (list, tuple)) for item in value
+    ):
+        raw_sizes = [f"{item[0]}x{item[1]}" if len(item) == 2 else "" for item in value]
+    else:
+        raw_sizes = list(split_list(value, SIZE_SEPARATOR_PATTERN))
+
+    sizes: list[SizePair] = []
+    for raw_size in raw_sizes:
+        match = SIZE_PATTERN.match(raw_size)
+        if match is None:
+            raise ManifestError(
+                f"Entry {line}: size {raw_size!r} must look like WIDTHxHEIGHT."
+            )
+        sizes.append((int(match.group(1)), int(match.group(2))))
+    return sizes
@@ -1,10 +1,12 @@
 """Shared data-shaping models and type aliases."""
 
+from collections import ChainMap
 from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import Any
 
 RowData = dict[str, Any]
+ExportRow = ChainMap[str, Any]
 AdditionalImageRow = dict[str, str]
 PriceInput = float | Mapping[str, float]
 WAYFAIR_COMPLIANCE_VERIFIED_PROGRAM = (
@@ -0,0 +1,218 @@
+"""Process-pool generation of many listings for batch runs."""
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+import os
+from pathlib import Path
+import time
+
+from data.batch import BatchWorkbookExport
+from data.excel_writer import ADDITIONAL_IMAGES_SHEET
+from data.listing import ListingSpec, shape_listing
+from data.models import AdditionalImageRow, ExportRow
+from data.pricing import PriceProvider, PriceTable
+from data.writer_factory import OPENPYXL_WRITER_BACKEND, ExcelWriterFactory
+
+
+@dataclass(frozen=True)
+class ListingResult:
+    """Outcome and timing of one generated listing."""
+
+    index: int
+    sku: str
+    seconds: float
+    output_path: Path | None = None
+    error: str | None = None
+    sheet_name: str = ""
+    rows: list[ExportRow] = field(default_factory=list, repr=False)
+    additional_image_rows: list[AdditionalImageRow] = field(
+        default_factory=list, repr=False
+    )
+
+    @property
+    def ok(self) -> bool:
+        """Return whether the listing was generated without errors."""
+
+        return self.error is None
+
+
+ProgressCallback = Callable[[ListingResult, int], None]
+
+worker_price_provider: PriceProvider | None = None
+
+
+def generate_listing(
+    index: int,
+    spec: ListingSpec,
+    price_provider: PriceProvider,
+    writer_backend: str,
+    folder: str | os.PathLike[str],
+    collect_rows: bool = False,
+) -> ListingResult:
+    """Shape one listing and either save it or return its finalized rows."""
+
+    started = time.perf_counter()
+    try:
+        shaper = shape_listing(spec, price_provider, writer_backend=writer_backend)
+        if collect_rows:
+            rows, additional_image_rows = shaper.take_rows(spec.sku)
+            return ListingResult(
+                index,
+                spec.sku,
+                time.perf_counter() - started,
+                sheet_name=shaper.writer.sheet_name,
+                rows=rows,
+                additional_image_rows=additional_image_rows,
+            )
+        output_path = shaper.write_file(spec.sku, folder)
+    except Exception as exc:
+        return ListingResult(
+            index, spec.sku, time.perf_counter() - started, error=str(exc)
+        )
+    return ListingResult(index, spec.sku, time.perf_counter() - started, output_path)
+
+
+def init_worker(price_table: PriceTable, writer_backend: str) -> None:
+    """Install the parent's price table and warm this worker's template cache."""
+
+    global worker_price_provider
+    worker_price_provider = PriceProvider()
+    worker_price_provider.install_table(price_table)
+    ExcelWriterFactory.create_writer(
+        ADDITIONAL_IMAGES_SHEET, writer_backend
+    ).preload_template()
+
+
+def generate_in_worker(
+    index: int,
+    spec: ListingSpec,
+    writer_backend: str,
+    folder: str | os.PathLike[str],
+    collect_rows: bool,
+) -> ListingResult:
+    """Generate one listing inside a pool worker."""
+
+    if worker_price_provider is None:
+        raise RuntimeError("Worker process was started without a price table.")
+    return generate_listing(
+        index, spec, worker_price_provider, writer_backend, folder, collect_rows
+    )
+
+
+class ParallelListingGenerator:
+    """Spread listing generation across a pool of worker processes.
+
+    The parent loads the price table once and hands it to every worker through
+    the pool initializer; each worker then keeps its own template cache.
+    """
+
+    def __init__(
+        self,
+        price_provider: PriceProvider,
+        writer_backend: str = OPENPYXL_WRITER_BACKEND,
+        workers: int | None = None,
+    ) -> None:
+        """Store the shared price source, writer backend and pool size."""
+
+        self.price_provider = price_provider
+        self.writer_backend = writer_backend
+        self.workers = workers or os.cpu_count() or 1
+
+    def generate(
+        self,
+        specs: Sequence[ListingSpec],
+        folder: str | os.PathLike[str],
+        batch: BatchWorkbookExport | None = None,
+        on_progress: ProgressCallback | None = None,
+    ) -> list[ListingResult]:
+        """Generate every listing and return the results in manifest order.
+
+        With a batch, workers only shape rows and the parent adds them to the
+        batch in manifest order, so the batch workbook is deterministic.
+        """
+
+        collect_rows = batch is not None
+        workers = min(self.workers, len(specs))
+        if workers <= 1:
+            results = self.generate_in_process(specs, folder, collect_rows, on_progress)
+        else:
+            results = self.generate_in_pool(
+                specs, folder, collect_rows, workers, on_progress
+            )
+
+        if batch is not None:
+            for result in results:
+                if result.ok:
+                    batch.add_rows(
+                        result.sheet_name,
+                        result.rows,
+                        result.additional_image_rows,
+                        result.sku,
+                    )
+        return results
+
+    def generate_in_process(
+        self,
+        specs: Sequence[ListingSpec],
+        folder: str | os.PathLike[str],
+        collect_rows: bool,
+        on_progress: ProgressCallback | None,
+    ) -> list[ListingResult]:
+        """Generate listings one after another in the current process."""
+
+        results: list[ListingResult] = []
+        for index, spec in enumerate(specs, start=1):
+            result = generate_listing(
+                index,
+                spec,
+                self.price_provider,
+                self.writer_backend,
+                folder,
+                collect_rows,
+            )
+            results.append(result)
+            if on_progress is not None:
+                on_progress(result, len(results))
+        return results
+
+    def generate_in_pool(
+        self,
+        specs: Sequence[ListingSpec],
+        folder: str | os.PathLike[str],
+        collect_rows: bool,
+        workers: int,
+        on_progress: ProgressCallback | None,
+    ) -> list[ListingResult]:
+        """Generate listings in worker processes and sort them by manifest index."""
+
+        price_table = self.price_provider.get_price_table()
+        results: list[ListingResult] = []
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_worker,
+            initargs=(price_table, self.writer_backend),
+        ) as executor:
+            futures: dict[Future[ListingResult], tuple[int, ListingSpec]] = {
+                executor.submit(
+                    generate_in_worker,
+                    index,
+                    spec,
+                    self.writer_backend,
+                    folder,
+                    collect_rows,
+                ): (index, spec)
+                for index, spec in enumerate(specs, start=1)
+            }
+            for future in as_completed(futures):
+                index, spec = futures[future]
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    result = ListingResult(index, spec.sku, 0.0, error=str(exc))
+                results.append(result)
+                if on_progress is not None:
+                    on_progress(result, len(results))
+
+        results.sort(key=lambda result: result.index)
+        return results
@@ -0,0 +1,268 @@
+"""On-disk price table cache with conditional HTTP revalidation."""
+
+from dataclasses import dataclass, replace
+import json
+import os
+from pathlib import Path
+import tempfile
+import threading
+import time
+from typing import Any
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+from data.pricing import (
+    PRICE_SHEET_CSV_URL,
+    PricePoint,
+    PricePointsByCategory,
+    PriceProvider,
+    PriceSourceError,
+    PriceTable,
+)
+
+PRICE_CACHE_FILENAME = "price_cache.json"
+PRICE_CACHE_VERSION = 1
+
+
+def default_price_cache_path() -> Path:
+    """Return the price cache file inside the app storage directory."""
+
+    flet_storage = os.environ.get("FLET_APP_STORAGE_DATA")
+    if flet_storage:
+        return Path(flet_storage) / PRICE_CACHE_FILENAME
+    return Path.home() / ".wayfairflatmakerbydk" / PRICE_CACHE_FILENAME
+
+
+@dataclass(frozen=True)
+class PriceCacheEntry:
+    """One downloaded price sheet with its parsed points and HTTP validators."""
+
+    source_url: str
+    csv_text: str
+    points_by_category: PricePointsByCategory
+    fetched_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class PriceCacheStore:
+    """Read and atomically write the cached price sheet as JSON."""
+
+    def __init__(self, path: Path) -> None:
+        """Store the cache file location."""
+
+        self.path = path
+
+    def load(self) -> PriceCacheEntry | None:
+        """Return the cached entry, or ``None`` when missing or unreadable."""
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") != PRICE_CACHE_VERSION:
+                return None
+            csv_text = data["csv_text"]
+            try:
+                points_by_category = self.decode_points(data["points"])
+            except (KeyError, TypeError, ValueError):
+                points_by_category = PriceProvider.parse_price_points(csv_text)
+            return PriceCacheEntry(
+                source_url=data["source_url"],
+                csv_text=csv_text,
+                points_by_category=points_by_category,
+                fetched_at=float(data["fetched_at"]),
+                etag=data.get("etag"),
+                last_modified=data.get("last_modified"),
+            )
+        except (
+            OSError,
+            KeyError,
+            TypeError,
+            ValueError,
+            AttributeError,
+            PriceSourceError,
+        ):
+            return None
+
+    def save(self, entry: PriceCacheEntry) -> None:
+        """Write the entry next to the target file and swap it in atomically."""
+
+        data = {
+            "version": PRICE_CACHE_VERSION,
+            "source_url": entry.source_url,
+            "fetched_at": entry.fetched_at,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "csv_text": entry.csv_text,
+            "points": self.encode_points(entry.points_by_category),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+                json.dump(data, temp_file, ensure_ascii=False)
+            os.replace(temp_name, self.path)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def encode_points(points_by_category: PricePointsByCategory) -> dict[str, Any]:
+        """Convert parsed price points to plain JSON lists."""
+
+        return {
+            category: {
+                group: [[point.width, point.height, point.price] for point in points]
+                for group, points in groups.items()
+            }
+            for category, groups in points_by_category.items()
+        }
+
+    @staticmethod
+    def decode_points(data: dict[str, Any]) -> PricePointsByCategory:
+        """Rebuild parsed price points from their JSON form."""
+
+        return {
+            category: {
+                group: [
+                    PricePoint(group, int(width), int(height), float(price))
+                    for width, height, price in points
+                ]
+                for group, points in groups.items()
+            }
+            for category, groups in data.items()
+        }
+
+
+class CachedPriceProvider(PriceProvider):
+    """Price provider that starts from the on-disk copy of the price sheet.
+
+    The first lookup uses the cached table without touching the network;
+    ``revalidate`` then asks the source whether the sheet changed, sending
+    the stored ETag and Last-Modified validators.
+    """
+
+    def __init__(
+        self,
+        sheet_csv_url: str = PRICE_SHEET_CSV_URL,
+        cache_store: PriceCacheStore | None = None,
+        ttl_seconds: float | None = None,
+    ) -> None:
+        """Store the source URL and the cache file used to persist the sheet."""
+
+        super().__init__(sheet_csv_url, ttl_seconds=ttl_seconds)
+        self.cache_store = cache_store or PriceCacheStore(default_price_cache_path())
+        self.cache_entry: PriceCacheEntry | None = None
+        self.lock = threading.Lock()
+
+    def load_price_table(self) -> PriceTable:
+        """Install the disk copy when it is valid, otherwise download the sheet."""
+
+        with self.lock:
+            if self.price_table is not None:
+                return self.price_table
+            entry = self.load_cached_entry()
+            if entry is not None:
+                try:
+                    price_table = self.install_entry(entry)
+                except PriceSourceError:
+                    entry = None
+                else:
+                    self.loaded_from_disk = True
+                    return price_table
+            entry = self.download_entry(None)
+            price_table = self.install_entry(entry)
+            self.save_entry(entry)
+            return price_table
+
+    def refresh(self) -> bool:
+        """Refresh through a conditional request against the cached validators."""
+
+        return self.revalidate()
+
+    def revalidate(self) -> bool:
+        """Re-check the source and return whether a newer sheet was installed.
+
+        A sheet is only reported as changed when its parsed prices differ, so
+        a full response with the same content keeps the active table. An
+        invalid new sheet raises ``PriceSourceError`` and is neither installed
+        nor saved, so the previous table stays active.
+        """
+
+        with self.lock:
+            previous_entry = self.cache_entry
+            entry = self.download_entry(previous_entry)
+            changed = (
+                previous_entry is None
+                or self.price_table is None
+                or entry.points_by_category != previous_entry.points_by_category
+            )
+            if changed:
+                self.install_entry(entry)
+            else:
+                entry = replace(entry, fetched_at=time.time())
+                self.cache_entry = entry
+                self.fetched_at = entry.fetched_at
+            self.save_entry(entry)
+            self.loaded_from_disk = False
+            return changed
+
+    def load_cached_entry(self) -> PriceCacheEntry | None:
+        """Return the disk entry when it was downloaded from the current URL."""
+
+        entry = self.cache_store.load()
+        if entry is None or entry.source_url != self.sheet_csv_url:
+            return None
+        return entry
+
+    def download_entry(
+        self,
+        cached_entry: PriceCacheEntry | None,
+    ) -> PriceCacheEntry:
+        """Fetch the sheet, returning ``cached_entry`` when it is not modified."""
+
+        request = Request(self.sheet_csv_url)
+        if cached_entry is not None:
+            if cached_entry.etag:
+                request.add_header("If-None-Match", cached_entry.etag)
+            if cached_entry.last_modified:
+                request.add_header("If-Modified-Since", cached_entry.last_modified)
+
+        try:
+            with urlopen(request, timeout=12) as response:
+                csv_text = response.read().decode("utf-8-sig")
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except HTTPError as exc:
+            if exc.code == 304 and cached_entry is not None:
+                return cached_entry
+            raise PriceSourceError("Could not load prices from Google Sheets.") from exc
+        except (OSError, URLError) as exc:
+            raise PriceSourceError("Could not load prices from Google Sheets.") from exc
+
+        return PriceCacheEntry(
+            source_url=self.sheet_csv_url,
+            csv_text=csv_text,
+            points_by_category=self.parse_price_points(csv_text),
+            fetched_at=time.time(),
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+    def install_entry(self, entry: PriceCacheEntry) -> PriceTable:
+        """Validate an entry and make its points the active price table."""
+
+        price_table = PriceTable.from_points(entry.points_by_category)
+        self.cache_entry = entry
+        self.install_table(price_table)
+        self.fetched_at = entry.fetched_at
+        return price_table
+
+    def save_entry(self, entry: PriceCacheEntry) -> None:
+        """Persist an entry, keeping the in-memory table when the disk fails."""
+
+        try:
+            self.cache_store.save(entry)
+        except OSError:
+            pass
@@ -0,0 +1,136 @@
+"""Offline price sources and the factory that picks one from settings."""
+
+import csv
+from io import StringIO
+import os
+from pathlib import Path
+from xml.etree.ElementTree import ParseError
+from zipfile import BadZipFile
+
+from openpyxl import load_workbook
+from openpyxl.utils.exceptions import InvalidFileException
+
+from data.price_cache import (
+    CachedPriceProvider,
+    PriceCacheStore,
+    default_price_cache_path,
+)
+from data.pricing import (
+    PRICE_SHEET_CSV_URL,
+    PriceProvider,
+    PriceSource,
+    PriceSourceError,
+)
+
+URL_PRICE_SOURCE = "url"
+FILE_PRICE_SOURCE = "file"
+SNAPSHOT_PRICE_SOURCE = "snapshot"
+PRICE_SOURCES = (URL_PRICE_SOURCE, FILE_PRICE_SOURCE, SNAPSHOT_PRICE_SOURCE)
+
+
+class FilePriceSource(PriceSource):
+    """Price sheet read from a local ``.csv`` or ``.xlsx`` file."""
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        """Store the local price file path."""
+
+        self.path = Path(path)
+
+    def read_csv(self) -> str:
+        """Return the file contents as CSV text."""
+
+        try:
+            if self.path.suffix.lower() in {".xlsx", ".xlsm"}:
+                return self.read_workbook_csv()
+            return self.path.read_text(encoding="utf-8-sig")
+        except (
+            OSError,
+            ValueError,
+            KeyError,
+            BadZipFile,
+            InvalidFileException,
+            ParseError,
+        ) as exc:
+            raise PriceSourceError(
+                f"Could not read prices from {self.path.name}."
+            ) from exc
+
+    def read_workbook_csv(self) -> str:
+        """Convert the first worksheet of a workbook to CSV text."""
+
+        wb = load_workbook(self.path, read_only=True, data_only=True)
+        try:
+            output = StringIO()
+            writer = csv.writer(output)
+            for row in wb.worksheets[0].iter_rows(values_only=True):
+                writer.writerow(["" if value is None else value for value in row])
+            return output.getvalue()
+        finally:
+            wb.close()
+
+
+class SnapshotPriceSource(PriceSource):
+    """Last known good price sheet saved by the on-disk price cache."""
+
+    def __init__(self, cache_store: PriceCacheStore | None = None) -> None:
+        """Store the cache file that holds the snapshot."""
+
+        self.cache_store = cache_store or PriceCacheStore(default_price_cache_path())
+
+    def read_csv(self) -> str:
+        """Return the CSV text of the cached sheet."""
+
+        entry = self.cache_store.load()
+        if entry is None:
+            raise PriceSourceError("No saved price snapshot is available.")
+        return entry.csv_text
+
+
+class UnavailablePriceSource(PriceSource):
+    """Placeholder for a misconfigured source that reports why on every read."""
+
+    def __init__(self, error: PriceSourceError) -> None:
+        """Store the configuration error to report."""
+
+        self.error = error
+
+    def read_csv(self) -> str:
+        """Raise the stored configuration error."""
+
+        raise PriceSourceError(str(self.error))
+
+
+class PriceProviderFactory:
+    """Factory for creating price providers backed by a chosen source."""
+
+    @staticmethod
+    def create_provider(
+        source: str = URL_PRICE_SOURCE,
+        location: str = "",
+        ttl_seconds: float | None = None,
+    ) -> PriceProvider:
+        """Create a price provider for the given source name and location.
+
+        ``location`` is the sheet URL, the local file path, or the snapshot
+        cache file; an empty value uses that source's default. An unknown
+        source or a missing file path raises ``PriceSourceError``.
+        """
+
+        if source == URL_PRICE_SOURCE:
+            return CachedPriceProvider(
+                location or PRICE_SHEET_CSV_URL,
+                ttl_seconds=ttl_seconds,
+            )
+        if source == FILE_PRICE_SOURCE:
+            if not location:
+                raise PriceSourceError("The file price source needs a file path.")
+            return PriceProvider(
+                ttl_seconds=ttl_seconds,
+                source=FilePriceSource(location),
+            )
+        if source == SNAPSHOT_PRICE_SOURCE:
+            cache_path = Path(location) if location else default_price_cache_path()
+            return PriceProvider(
+                source=SnapshotPriceSource(PriceCacheStore(cache_path))
+            )
+        raise PriceSourceError(f"Unknown price source: {source}")
@@ -0,0 +1,101 @@
+"""Hot reload of a local price file into a running price provider."""
+
+import os
+from pathlib import Path
+import threading
+
+from watchdog.events import (
+    EVENT_TYPE_CLOSED,
+    EVENT_TYPE_CREATED,
+    EVENT_TYPE_MODIFIED,
+    EVENT_TYPE_MOVED,
+    FileSystemEvent,
+    FileSystemEventHandler,
+)
+from watchdog.observers import Observer
+from watchdog.observers.api import BaseObserver
+
+from data.pricing import PriceProvider
+
+PRICE_FILE_RELOAD_DELAY_SECONDS = 0.5
+RELOAD_EVENT_TYPES = {
+    EVENT_TYPE_CLOSED,
+    EVENT_TYPE_CREATED,
+    EVENT_TYPE_MODIFIED,
+    EVENT_TYPE_MOVED,
+}
+
+
+class PriceFileWatcher(FileSystemEventHandler):
+    """Reload the provider's table whenever the watched price file changes.
+
+    The parent directory is watched so editors that save through a temporary
+    file and a rename are noticed too. Bursts of events are coalesced into
+    one reload, and reloads run one at a time on a background thread. A file
+    that fails to read or validate leaves the previous table active.
+    """
+
+    def __init__(
+        self,
+        price_provider: PriceProvider,
+        path: str | os.PathLike[str],
+        reload_delay: float = PRICE_FILE_RELOAD_DELAY_SECONDS,
+    ) -> None:
+        """Store the provider to update and the file that feeds it."""
+
+        super().__init__()
+        self.price_provider = price_provider
+        self.path = Path(path).absolute()
+        self.reload_delay = reload_delay
+        self.observer: BaseObserver | None = None
+        self.reload_timer: threading.Timer | None = None
+        self.timer_lock = threading.Lock()
+        self.reload_lock = threading.Lock()
+
+    def start(self) -> None:
+        """Start watching the price file's directory."""
+
+        if self.observer is not None:
+            return
+        self.observer = Observer()
+        self.observer.schedule(self, os.fspath(self.path.parent), recursive=False)
+        self.observer.daemon = True
+        self.observer.start()
+
+    def stop(self) -> None:
+        """Stop watching and drop any pending reload."""
+
+        with self.timer_lock:
+            if self.reload_timer is not None:
+                self.reload_timer.cancel()
+                self.reload_timer = None
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer.join()
+            self.observer = None
+
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        """Schedule a reload when an event touches the price file."""
+
+        if event.is_directory or event.event_type not in RELOAD_EVENT_TYPES:
+            return
+        paths = {os.fsdecode(event.src_path), os.fsdecode(event.dest_path)}
+        if os.fspath(self.path) in paths:
+            self.schedule_reload()
+
+    def schedule_reload(self) -> None:
+        """Restart the reload delay so a burst of writes causes one reload."""
+
+        with self.timer_lock:
+            if self.reload_timer is not None:
+                self.reload_timer.cancel()
+            self.reload_timer = threading.Timer(self.reload_delay, self.reload_prices)
+            self.reload_timer.name = "price-file-reload"
+            self.reload_timer.daemon = True
+            self.reload_timer.start()
+
+    def reload_prices(self) -> None:
+        """Re-read the price file and swap in the new table when it is valid."""
+
+        with self.reload_lock:
+            self.price_provider.run_background_refresh()
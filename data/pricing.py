@@ -1,13 +1,21 @@
 """Price lookup and interpolation for generated product variants."""
 
-from collections.abc import Iterable, Mapping
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping, Sequence
 import csv
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from io import StringIO
+import threading
+import time
 from urllib.error import URLError
 from urllib.request import urlopen
 
+import numpy as np
+import numpy.typing as npt
+
 PriceByWallpaperType = dict[str, float]
+PriceMatrix = dict[str, list[float]]
 PricePointsByGroup = dict[str, list["PricePoint"]]
 PricePointsByCategory = dict[str, PricePointsByGroup]
 
@@ -23,6 +31,9 @@ WALLPAPER_TYPE_TO_PRICE_GROUP: Mapping[str, str] = {
     "Non-Woven: Premium": "Non-Woven: Premium",
 }
 
+PRICE_REFRESH_RETRY_SECONDS = 60.0
+SIZE_KEY_FACTOR = 1 << 32
+
 DECAL_COLOR_CHOICE_TO_PRICE_GROUP: Mapping[str, str] = {
     "yes": "Plottered",
     "no": "Printed",
@@ -33,6 +44,32 @@ class PriceSourceError(RuntimeError):
     """Raised when a price source cannot provide usable price data."""
 
 
+class PriceSource(ABC):
+    """Where the raw price sheet CSV comes from."""
+
+    @abstractmethod
+    def read_csv(self) -> str:
+        """Return the price sheet as CSV text or raise ``PriceSourceError``."""
+
+
+class UrlPriceSource(PriceSource):
+    """Price sheet downloaded from a CSV export URL."""
+
+    def __init__(self, url: str = PRICE_SHEET_CSV_URL) -> None:
+        """Store the CSV export URL."""
+
+        self.url = url
+
+    def read_csv(self) -> str:
+        """Fetch the Google Sheet CSV export used as the price source."""
+
+        try:
+            with urlopen(self.url, timeout=12) as response:
+                return response.read().decode("utf-8-sig")
+        except (OSError, URLError) as exc:
+            raise PriceSourceError("Could not load prices from Google Sheets.") from exc
+
+
 @dataclass(frozen=True)
 class PricePoint:
     """One known price for one material group and size."""
@@ -49,24 +86,256 @@ class PricePoint:
         return self.width * self.height
 
 
+@dataclass(frozen=True)
+class PriceGroupIndex:
+    """Lookup structures for one material group, built once per price table.
+
+    Exact sizes hit a dict keyed on ``(min, max)`` dimensions; other sizes
+    bisect the area-sorted arrays. Ties keep the sheet order, matching a
+    stable sort of the points by area. The same structures are kept as NumPy
+    arrays so ``prices_for`` can price many sizes in one pass.
+    """
+
+    exact_prices: Mapping[tuple[int, int], float]
+    areas: tuple[int, ...]
+    prices: tuple[float, ...]
+    exact_keys_array: npt.NDArray[np.int64] = field(compare=False, repr=False)
+    exact_prices_array: npt.NDArray[np.float64] = field(compare=False, repr=False)
+    areas_array: npt.NDArray[np.int64] = field(compare=False, repr=False)
+    prices_array: npt.NDArray[np.float64] = field(compare=False, repr=False)
+
+    @classmethod
+    def from_points(cls, points: Iterable[PricePoint]) -> "PriceGroupIndex":
+        """Build the index from a group's price points."""
+
+        known_points = sorted(points, key=lambda point: point.area)
+        exact_prices: dict[tuple[int, int], float] = {}
+        for point in known_points:
+            dimensions = (
+                min(point.width, point.height),
+                max(point.width, point.height),
+            )
+            exact_prices.setdefault(dimensions, round(point.price, 2))
+        exact_sizes = np.array(sorted(exact_prices), dtype=np.int64).reshape(-1, 2)
+        areas = tuple(point.area for point in known_points)
+        prices = tuple(point.price for point in known_points)
+        return cls(
+            exact_prices=exact_prices,
+            areas=areas,
+            prices=prices,
+            exact_keys_array=size_keys(exact_sizes[:, 0], exact_sizes[:, 1]),
+            exact_prices_array=np.array(
+                [exact_prices[(short, long)] for short, long in exact_sizes.tolist()],
+                dtype=np.float64,
+            ),
+            areas_array=np.array(areas, dtype=np.int64),
+            prices_array=np.array(prices, dtype=np.float64),
+        )
+
+    def price_for(self, width: int, height: int) -> float:
+        """Return the exact or area-interpolated price for a requested size."""
+
+        if not self.areas:
+            raise PriceSourceError("Price table has no usable price rows.")
+
+        exact_price = self.exact_prices.get((min(width, height), max(width, height)))
+        if exact_price is not None:
+            return exact_price
+
+        target_area = width * height
+        if target_area <= self.areas[0]:
+            return round(self.prices[0], 2)
+        if target_area >= self.areas[-1]:
+            return round(self.prices[-1], 2)
+
+        next_index = bisect_left(self.areas, target_area)
+        previous_area = self.areas[next_index - 1]
+        previous_price = self.prices[next_index - 1]
+        next_area = self.areas[next_index]
+        next_price = self.prices[next_index]
+        area_delta = next_area - previous_area
+        if area_delta == 0:
+            price = (previous_price + next_price) / 2
+            return PriceProvider.round_interpolated_price(price)
+        position = (target_area - previous_area) / area_delta
+        price = previous_price + (next_price - previous_price) * position
+        return PriceProvider.round_interpolated_price(price)
+
+    def prices_for(
+        self,
+        widths: Sequence[int],
+        heights: Sequence[int],
+    ) -> list[float]:
+        """Return prices for many sizes at once, identical to ``price_for``.
+
+        Exact sizes are found with ``searchsorted`` over the sorted size keys
+        and masked in; the rest are interpolated along the area axis with
+        the same float operations as ``price_for``, so every price matches it
+        bit for bit.
+        """
+
+        if len(widths) != len(heights):
+            raise ValueError("Widths and heights must have the same length.")
+        if not self.areas:
+            raise PriceSourceError("Price table has no usable price rows.")
+        if not widths:
+            return []
+        if len(self.areas) == 1:
+            return [round(self.prices[0], 2)] * len(widths)
+
+        width_array = np.asarray(widths, dtype=np.int64)
+        height_array = np.asarray(heights, dtype=np.int64)
+        target_areas = width_array * height_array
+        areas = self.areas_array
+        prices = self.prices_array
+
+        next_index = np.clip(np.searchsorted(areas, target_areas), 1, len(areas) - 1)
+        previous_area = areas[next_index - 1]
+        next_area = areas[next_index]
+        previous_price = prices[next_index - 1]
+        next_price = prices[next_index]
+        area_delta = next_area - previous_area
+        with np.errstate(divide="ignore", invalid="ignore"):
+            position = (target_areas - previous_area) / area_delta
+        interpolated = np.where(
+            area_delta == 0,
+            (previous_price + next_price) / 2,
+            previous_price + (next_price - previous_price) * position,
+        )
+        result = np.trunc(interpolated) + 0.99
+        result = np.where(target_areas <= areas[0], round(self.prices[0], 2), result)
+        result = np.where(target_areas >= areas[-1], round(self.prices[-1], 2), result)
+
+        keys = size_keys(
+            np.minimum(width_array, height_array),
+            np.maximum(width_array, height_array),
+        )
+        exact_index = np.minimum(
+            np.searchsorted(self.exact_keys_array, keys),
+            len(self.exact_keys_array) - 1,
+        )
+        is_exact = self.exact_keys_array[exact_index] == keys
+        result = np.where(is_exact, self.exact_prices_array[exact_index], result)
+        return [float(price) for price in result]
+
+
+def size_keys(
+    short_sides: npt.NDArray[np.int64],
+    long_sides: npt.NDArray[np.int64],
+) -> npt.NDArray[np.int64]:
+    """Pack ``(min, max)`` sizes into sortable integer keys."""
+
+    return short_sides * SIZE_KEY_FACTOR + long_sides
+
+
+@dataclass(frozen=True)
+class PriceTable:
+    """Validated price table with ready-to-use interpolation indexes."""
+
+    points_by_category: PricePointsByCategory
+    wallpaper_indexes: Mapping[str, PriceGroupIndex]
+    decal_indexes: Mapping[str, PriceGroupIndex]
+
+    @classmethod
+    def from_points(cls, points_by_category: PricePointsByCategory) -> "PriceTable":
+        """Validate parsed points and index every required price group."""
+
+        wallpaper_points = points_by_category.get("Wallpapers", {})
+        decal_points = points_by_category.get("Decals", {})
+        PriceProvider.validate_required_groups(
+            wallpaper_points,
+            set(WALLPAPER_TYPE_TO_PRICE_GROUP.values()),
+            "Wallpaper",
+        )
+        PriceProvider.validate_required_groups(
+            decal_points,
+            set(DECAL_COLOR_CHOICE_TO_PRICE_GROUP.values()),
+            "Decal",
+        )
+        return cls(
+            points_by_category=points_by_category,
+            wallpaper_indexes={
+                group: PriceGroupIndex.from_points(wallpaper_points[group])
+                for group in set(WALLPAPER_TYPE_TO_PRICE_GROUP.values())
+            },
+            decal_indexes={
+                group: PriceGroupIndex.from_points(decal_points[group])
+                for group in set(DECAL_COLOR_CHOICE_TO_PRICE_GROUP.values())
+            },
+        )
+
+
 class PriceProvider:
     """Fetch and calculate product prices from external source data."""
 
-    def __init__(self, sheet_csv_url: str = PRICE_SHEET_CSV_URL) -> None:
-        """Store external source settings and initialize the in-memory cache."""
+    def __init__(
+        self,
+        sheet_csv_url: str = PRICE_SHEET_CSV_URL,
+        ttl_seconds: float | None = None,
+        source: PriceSource | None = None,
+    ) -> None:
+        """Store external source settings and initialize the in-memory cache.
+
+        ``source`` defaults to downloading ``sheet_csv_url``. With
+        ``ttl_seconds`` set, lookups on an older table keep serving it and
+        start one background refresh that swaps in the new table when ready.
+        """
 
         self.sheet_csv_url = sheet_csv_url
-        self.points_by_category: PricePointsByCategory | None = None
+        self.source = source or UrlPriceSource(sheet_csv_url)
+        self.ttl_seconds = ttl_seconds
+        self.loaded_from_disk = False
+        self.price_table: PriceTable | None = None
+        self.fetched_at: float | None = None
+        self.last_refresh_error: PriceSourceError | None = None
+        self.retry_at = 0.0
+        self.refresh_thread: threading.Thread | None = None
+        self.refresh_thread_lock = threading.Lock()
 
     def get_wallpaper_prices(self, width: int, height: int) -> PriceByWallpaperType:
         """Return calculated prices for every wallpaper material variant."""
 
-        points_by_group = self.get_wallpaper_points_by_group()
-        prices: PriceByWallpaperType = {}
-        for material_name, group_name in WALLPAPER_TYPE_TO_PRICE_GROUP.items():
-            group_points = points_by_group.get(group_name, [])
-            prices[material_name] = self.interpolate_price(group_points, width, height)
-        return prices
+        indexes = self.get_price_table().wallpaper_indexes
+        return {
+            material_name: indexes[group_name].price_for(width, height)
+            for material_name, group_name in WALLPAPER_TYPE_TO_PRICE_GROUP.items()
+        }
+
+    def get_wallpaper_price_matrix(
+        self,
+        widths: Sequence[int],
+        heights: Sequence[int],
+    ) -> PriceMatrix:
+        """Return one price list per wallpaper material for many sizes at once.
+
+        Materials that share a price group are priced once and get copies of
+        the same list.
+        """
+
+        indexes = self.get_price_table().wallpaper_indexes
+        prices_by_group = {
+            group_name: indexes[group_name].prices_for(widths, heights)
+            for group_name in set(WALLPAPER_TYPE_TO_PRICE_GROUP.values())
+        }
+        return {
+            material_name: list(prices_by_group[group_name])
+            for material_name, group_name in WALLPAPER_TYPE_TO_PRICE_GROUP.items()
+        }
+
+    def get_decal_prices(
+        self,
+        widths: Sequence[int],
+        heights: Sequence[int],
+        color_choice: str,
+    ) -> list[float]:
+        """Return decal prices for many sizes at once."""
+
+        group_name = DECAL_COLOR_CHOICE_TO_PRICE_GROUP.get(
+            color_choice.strip().lower(),
+            "Printed",
+        )
+        indexes = self.get_price_table().decal_indexes
+        return indexes[group_name].prices_for(widths, heights)
 
     def get_decal_price(
         self,
@@ -80,67 +349,138 @@ class PriceProvider:
             color_choice.strip().lower(),
             "Printed",
         )
-        points_by_group = self.get_decal_points_by_group()
-        return self.interpolate_price(
-            points_by_group.get(group_name, []), width, height
-        )
+        return self.get_price_table().decal_indexes[group_name].price_for(width, height)
 
     def get_wallpaper_points_by_group(self) -> PricePointsByGroup:
-        """Return cached wallpaper price points, fetching the sheet on first use."""
+        """Return validated wallpaper price points, fetching the sheet on first use."""
 
-        points_by_group = self.get_points_by_category().get("Wallpapers", {})
-        self.validate_required_groups(
-            points_by_group,
-            set(WALLPAPER_TYPE_TO_PRICE_GROUP.values()),
-            "Wallpaper",
-        )
-        return points_by_group
+        return self.get_points_by_category()["Wallpapers"]
 
     def get_decal_points_by_group(self) -> PricePointsByGroup:
-        """Return cached decal price points, fetching the sheet on first use."""
+        """Return validated decal price points, fetching the sheet on first use."""
 
-        points_by_group = self.get_points_by_category().get("Decals", {})
-        self.validate_required_groups(
-            points_by_group,
-            set(DECAL_COLOR_CHOICE_TO_PRICE_GROUP.values()),
-            "Decal",
-        )
-        return points_by_group
+        return self.get_points_by_category()["Decals"]
 
     def get_points_by_category(self) -> PricePointsByCategory:
         """Return cached price points grouped by category and material group."""
 
-        if self.points_by_category is None:
-            csv_text = self.fetch_sheet_csv()
-            self.points_by_category = self.parse_price_points(csv_text)
-        return self.points_by_category
+        return self.get_price_table().points_by_category
 
-    def fetch_sheet_csv(self) -> str:
-        """Fetch the Google Sheet CSV export used as the price source."""
+    def get_price_table(self) -> PriceTable:
+        """Return the active validated table, loading it on first use."""
+
+        price_table = self.price_table
+        if price_table is None:
+            price_table = self.load_price_table()
+        elif self.is_stale():
+            self.schedule_refresh()
+        return price_table
+
+    def load_price_table(self) -> PriceTable:
+        """Fetch, validate and install the first price table."""
+
+        return self.install_points(self.parse_price_points(self.fetch_sheet_csv()))
+
+    def install_points(self, points_by_category: PricePointsByCategory) -> PriceTable:
+        """Validate parsed points, then atomically swap in the new table."""
+
+        return self.install_table(PriceTable.from_points(points_by_category))
+
+    def install_table(self, price_table: PriceTable) -> PriceTable:
+        """Make an already validated table active and restart its age."""
+
+        self.price_table = price_table
+        self.fetched_at = time.time()
+        return price_table
+
+    def refresh(self) -> bool:
+        """Download the sheet again, swap in the new table and report a change."""
+
+        previous_table = self.price_table
+        points_by_category = self.parse_price_points(self.fetch_sheet_csv())
+        self.install_points(points_by_category)
+        return (
+            previous_table is None
+            or points_by_category != previous_table.points_by_category
+        )
+
+    def table_age(self) -> float | None:
+        """Return the active table's age in seconds, or ``None`` before loading."""
+
+        if self.fetched_at is None:
+            return None
+        return max(time.time() - self.fetched_at, 0.0)
+
+    def is_stale(self) -> bool:
+        """Return whether the active table is older than the configured TTL."""
+
+        age = self.table_age()
+        if self.ttl_seconds is None or age is None or age < self.ttl_seconds:
+            return False
+        return time.time() >= self.retry_at
+
+    def is_refreshing(self) -> bool:
+        """Return whether a background refresh is currently running."""
+
+        thread = self.refresh_thread
+        return thread is not None and thread.is_alive()
+
+    def schedule_refresh(self) -> bool:
+        """Start a background refresh unless one is already running."""
+
+        with self.refresh_thread_lock:
+            if self.is_refreshing():
+                return False
+            self.refresh_thread = threading.Thread(
+                target=self.run_background_refresh,
+                name="price-refresh",
+                daemon=True,
+            )
+            self.refresh_thread.start()
+            return True
+
+    def run_background_refresh(self) -> None:
+        """Refresh the table and keep serving the old one when that fails."""
 
         try:
-            with urlopen(self.sheet_csv_url, timeout=12) as response:
-                return response.read().decode("utf-8-sig")
-        except (OSError, URLError) as exc:
-            raise PriceSourceError("Could not load prices from Google Sheets.") from exc
+            self.refresh()
+        except PriceSourceError as exc:
+            self.last_refresh_error = exc
+            self.retry_at = time.time() + PRICE_REFRESH_RETRY_SECONDS
+        else:
+            self.last_refresh_error = None
+
+    def fetch_sheet_csv(self) -> str:
+        """Read the raw price sheet CSV from the configured source."""
+
+        return self.source.read_csv()
 
     @staticmethod
     def parse_price_points(csv_text: str) -> PricePointsByCategory:
-        """Parse grouped price rows from the source CSV."""
+        """Parse grouped price rows from the source CSV.
+
+        Rows cut short, as in a file that is still being written, are skipped;
+        text that is not valid CSV raises ``PriceSourceError``.
+        """
 
         points_by_category: PricePointsByCategory = {}
         current_category = ""
         current_group = ""
 
-        for row in csv.DictReader(StringIO(csv_text)):
-            current_category = row.get("Category", "").strip() or current_category
-            current_group = row.get("Type / Material", "").strip() or current_group
+        try:
+            rows = list(csv.DictReader(StringIO(csv_text)))
+        except csv.Error as exc:
+            raise PriceSourceError("The price sheet is not valid CSV.") from exc
+
+        for row in rows:
+            current_category = (row.get("Category") or "").strip() or current_category
+            current_group = (row.get("Type / Material") or "").strip() or current_group
             if not current_category or not current_group:
                 continue
 
-            width_text = row.get("Width", "").strip()
-            height_text = row.get("Length", "").strip()
-            price_text = row.get("Base cost", "").strip()
+            width_text = (row.get("Width") or "").strip()
+            height_text = (row.get("Length") or "").strip()
+            price_text = (row.get("Base cost") or "").strip()
             if not width_text or not height_text or not price_text:
                 continue
 
@@ -214,33 +554,4 @@ class PriceProvider:
     ) -> float:
         """Return exact or area-interpolated price for a requested size."""
 
-        known_points = sorted(points, key=lambda point: point.area)
-        if not known_points:
-            raise PriceSourceError("Price table has no usable price rows.")
-
-        requested_dimensions = sorted((width, height))
-        for point in known_points:
-            if requested_dimensions == sorted((point.width, point.height)):
-                return round(point.price, 2)
-
-        area_prices = [(point.area, point.price) for point in known_points]
-
-        target_area = width * height
-        if target_area <= area_prices[0][0]:
-            return round(area_prices[0][1], 2)
-        if target_area >= area_prices[-1][0]:
-            return round(area_prices[-1][1], 2)
-
-        previous_area, previous_price = area_prices[0]
-        for next_area, next_price in area_prices[1:]:
-            if target_area <= next_area:
-                area_delta = next_area - previous_area
-                if area_delta == 0:
-                    price = (previous_price + next_price) / 2
-                    return PriceProvider.round_interpolated_price(price)
-                position = (target_area - previous_area) / area_delta
-                price = previous_price + (next_price - previous_price) * position
-                return PriceProvider.round_interpolated_price(price)
-            previous_area, previous_price = next_area, next_price
-
-        return round(area_prices[-1][1], 2)
+        return PriceGroupIndex.from_points(points).price_for(width, height)
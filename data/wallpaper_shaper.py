@@ -1,6 +1,7 @@
 """Data shaper for Wayfair wallpaper exports."""
 
 from collections.abc import Sequence
+from typing import ClassVar
 
 from data.base_shaper import BaseDataShaper
 from data.models import (
@@ -11,17 +12,57 @@ from data.models import (
     WallpaperPrintType,
     WAYFAIR_COMPLIANCE_VERIFIED_PROGRAM,
 )
+from data.writer_factory import OPENPYXL_WRITER_BACKEND
 
 
 class WallpaperDataShaper(BaseDataShaper):
     """Data shaper for wallpaper listings."""
 
     VIDEO_URL: str = "https://www.dropbox.com/scl/fi/9a6ny0g8wx65f297mv8om/wallpaper-marketing-video.MOV?rlkey=4fs9d6sx4vsv81gcpk07hhi8b&st=e8idosxe&dl=0"
-
-    def __init__(self) -> None:
+    STATIC_COLUMNS: ClassVar[RowData] = {
+        "Brand": "Stickalz",
+        "Variant Grouping 1": "Wallpaper Material",
+        "Variant Grouping 2": "Size",
+        "Minimum Order Quantity": 1,
+        "Force Quantity Multiplier": 1,
+        "Display Set Quantity": 1,
+        "Ship Type": "Small Parcel",
+        "Freight Class": 400,
+        "Lead Time": 120,
+        "Replacement Lead Time": 120,
+        "Warning Required": "No",
+        "Country Of Manufacturer": "United States",
+        "Video File Name or URL 1": VIDEO_URL,
+        "Product Type": "Wall Mural",
+        "Age Group": "All Ages",
+        "Pattern": "Does Not Apply",
+        "Wallpaper Texture": "Smooth",
+        "Finish": "Primed",
+        "Match Type": "Random",
+        "Supplier Intended and Approved Use": "Non Residential Use; Residential Use",
+        "BPA Free": "No",
+        "Designer": "Does Not Apply",
+        "Movie / Show Series Name": "Does Not Apply",
+        "Sports Team Name": "Does Not Apply",
+        "Durability": "Mold / Mildew Resistant;Water Resistant;Fade Resistant;Heat Resistant;Non-Porous;Non-Staining",
+        "Product Care": "Wipe clean with a damp cloth",
+        "Color": "Multicolor",
+        "Pattern Repeat Frequency": 0,
+        "Pattern Interval": 0.0,
+        "Wood Species": "Does Not Apply",
+        "Uniform Packaging and Labeling Regulations (UPLR) Compliant": "Yes",
+        "Canada Product Restriction": "No",
+        "Reason for Restriction": "Does Not Apply",
+        "Sustainability & Social Responsibility Certifications (North America Only)": "No",
+        "Commercial Warranty": "Yes",
+        "Commercial Warranty Length": "30 Days",
+        WAYFAIR_COMPLIANCE_VERIFIED_PROGRAM: "No",
+    }
+
+    def __init__(self, writer_backend: str = OPENPYXL_WRITER_BACKEND) -> None:
         """Initialize wallpaper-specific constants and templates."""
 
-        super().__init__(sheet_name="6161 - Wallpaper")
+        super().__init__(sheet_name="6161 - Wallpaper", writer_backend=writer_backend)
         self.technical_images: list[str] = [
             "https://www.dropbox.com/scl/fi/v4cfjc5e83qgqej5w9b11/1.png?rlkey=pucx792sf969vrgu4mtlx6y5v&st=fzounq4b&dl=0",
             "https://www.dropbox.com/scl/fi/vl5iu0kz4iseu8ag7e9k4/2.png?rlkey=iuh2vzv3bb7flw91vu4fk98rg&st=mt098dai&dl=0",
@@ -153,85 +194,51 @@ class WallpaperDataShaper(BaseDataShaper):
         )
         size_label = self.format_size(width, height)
 
+        record_values: RowData = {
+            "Product Name": f"{title} {sku}",
+            "Variant Attribute Name On Site 2": size_label,
+            "Marketing Copy": texts.marketing_copy,
+            "Feature Bullet 1": texts.feature_bullet_1,
+            "Feature Bullet 2": texts.feature_bullet_2,
+            "Feature Bullet 3": texts.feature_bullet_3,
+            "Feature Bullet 4": texts.feature_bullet_4,
+            "Feature Bullet 5": texts.feature_bullet_5,
+            "Product Weight": package_parameters.weight,
+            "Carton Weight 1": package_parameters.weight,
+            "Carton Height 1": package_parameters.height,
+            "Carton Width 1": package_parameters.width,
+            "Carton Depth 1": package_parameters.depth,
+            "Image File Name or URL 1": image_slots[0],
+            "Image File Name or URL 2": image_slots[1],
+            "Image File Name or URL 3": image_slots[2],
+            "Image File Name or URL 4": image_slots[3],
+            "Image File Name or URL 5": image_slots[4],
+            "Overall Product Length - End to End": self.convert_inches_to_feet(height),
+            "Overall Width - Side to Side": width,
+            "Square Footage per Unit": self.calculate_sq_ft(width, height),
+            "Overall Product Weight": package_parameters.weight,
+        }
+
         for material_name, part_number in part_numbers.items():
             attributes = self.print_type[material_name]
             base_cost = self.get_material_price(price, material_name)
-            data: RowData = {
-                "Brand": "Stickalz",
-                "Supplier Part Number": part_number,
-                "Manufacturer Part Number": part_number,
-                "Product Name": f"{title} {sku}",
-                "Variant Type": "Non-Primary Variant",
-                "Group Reference ID": sku,
-                "Variant Grouping 1": "Wallpaper Material",
-                "Variant Attribute Name On Site 1": attributes.display_name,
-                "Variant Grouping 2": "Size",
-                "Variant Attribute Name On Site 2": size_label,
-                "Base Cost": base_cost,
-                "Marketing Copy": texts.marketing_copy,
-                "Feature Bullet 1": texts.feature_bullet_1,
-                "Feature Bullet 2": texts.feature_bullet_2,
-                "Feature Bullet 3": texts.feature_bullet_3,
-                "Feature Bullet 4": texts.feature_bullet_4,
-                "Feature Bullet 5": texts.feature_bullet_5,
-                "Minimum Order Quantity": 1,
-                "Force Quantity Multiplier": 1,
-                "Display Set Quantity": 1,
-                "Product Weight": package_parameters.weight,
-                "Ship Type": "Small Parcel",
-                "Freight Class": 400,
-                "Lead Time": 120,
-                "Replacement Lead Time": 120,
-                "Carton Weight 1": package_parameters.weight,
-                "Carton Height 1": package_parameters.height,
-                "Carton Width 1": package_parameters.width,
-                "Carton Depth 1": package_parameters.depth,
-                "Warning Required": "No",
-                "Country Of Manufacturer": "United States",
-                "Image File Name or URL 1": image_slots[0],
-                "Image File Name or URL 2": image_slots[1],
-                "Image File Name or URL 3": image_slots[2],
-                "Image File Name or URL 4": image_slots[3],
-                "Image File Name or URL 5": image_slots[4],
-                "Video File Name or URL 1": self.VIDEO_URL,
-                "Product Type": "Wall Mural",
-                "Age Group": "All Ages",
-                "Pattern": "Does Not Apply",
-                "Wallpaper Texture": "Smooth",
-                "Material": attributes.material,
-                "Finish": "Primed",
-                "Application Type": attributes.application,
-                "Match Type": "Random",
-                "Removal Type": attributes.removal,
-                "Supplier Intended and Approved Use": "Non Residential Use; Residential Use",
-                "BPA Free": "No",
-                "Designer": "Does Not Apply",
-                "Movie / Show Series Name": "Does Not Apply",
-                "Sports Team Name": "Does Not Apply",
-                "Durability": "Mold / Mildew Resistant;Water Resistant;Fade Resistant;Heat Resistant;Non-Porous;Non-Staining",
-                "Product Care": "Wipe clean with a damp cloth",
-                "Color": "Multicolor",
-                "Pattern Repeat Frequency": 0,
-                "Pattern Interval": 0.0,
-                "Wood Species": "Does Not Apply",
-                "Uniform Packaging and Labeling Regulations (UPLR) Compliant": "Yes",
-                "Canada Product Restriction": "No",
-                "Reason for Restriction": "Does Not Apply",
-                "Sustainability & Social Responsibility Certifications (North America Only)": "No",
-                "Overall Product Length - End to End": self.convert_inches_to_feet(
-                    height
-                ),
-                "Overall Width - Side to Side": width,
-                "Square Footage per Unit": self.calculate_sq_ft(width, height),
-                "Overall Product Weight": package_parameters.weight,
-                "Commercial Warranty": "Yes",
-                "Commercial Warranty Length": "30 Days",
-                WAYFAIR_COMPLIANCE_VERIFIED_PROGRAM: "No",
-                "variant_sort_price": base_cost,
-                "variant_sort_area": width * height,
-                "variant_sort_order": len(self.rows),
-            }
-            self.rows.append(data)
+            self.append_row(
+                {
+                    "Supplier Part Number": part_number,
+                    "Manufacturer Part Number": part_number,
+                    "Variant Type": "Non-Primary Variant",
+                    "Group Reference ID": sku,
+                    "Variant Attribute Name On Site 1": attributes.display_name,
+                    "Base Cost": base_cost,
+                    "Material": attributes.material,
+                    "Application Type": attributes.application,
+                    "Removal Type": attributes.removal,
+                    "variant_sort_price": base_cost,
+                    "variant_sort_area": width * height,
+                    "variant_sort_order": len(self.rows),
+                },
+                record_values,
+            )
             self.additional_image_rows.extend(
                 [
                     {
@@ -0,0 +1,24 @@
+"""Factory for creating workbook writer backends."""
+
+from data.excel_writer import ExcelWriter
+from data.xml_writer import XmlPatchExcelWriter
+
+OPENPYXL_WRITER_BACKEND = "openpyxl"
+XML_WRITER_BACKEND = "xml"
+
+
+class ExcelWriterFactory:
+    """Factory for creating workbook writers for a template sheet."""
+
+    @staticmethod
+    def create_writer(
+        sheet_name: str,
+        backend: str = OPENPYXL_WRITER_BACKEND,
+    ) -> ExcelWriter:
+        """Create a workbook writer for the given backend name."""
+
+        if backend == OPENPYXL_WRITER_BACKEND:
+            return ExcelWriter(sheet_name=sheet_name)
+        if backend == XML_WRITER_BACKEND:
+            return XmlPatchExcelWriter(sheet_name=sheet_name)
+        raise ValueError(f"Unknown writer backend: {backend}")
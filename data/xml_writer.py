@@ -0,0 +1,451 @@
+"""Zip-level workbook writer that patches sheet XML without openpyxl."""
+
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import dataclass
+import math
+from pathlib import Path
+import posixpath
+import re
+import threading
+from typing import Any
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+import zipfile
+
+from data.excel_writer import ExcelWriter, SheetLayout, SheetRows, row_blocks
+
+SPREADSHEET_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+RELATIONSHIP_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PACKAGE_RELATIONSHIP_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+ROW_PATTERN = re.compile(r'<row\b[^>]*?\sr="(\d+)"[^>]*?(?:/>|>.*?</row>)', re.DOTALL)
+ROW_ATTRIBUTES_PATTERN = re.compile(r"<row\b([^>]*?)(/?)>")
+CELL_PATTERN = re.compile(
+    r'<c\b([^>]*?)\sr="([A-Z]+)\d+"([^>]*?)(?:/>|>(.*?)</c>)', re.DOTALL
+)
+STYLE_PATTERN = re.compile(r'\bs="(\d+)"')
+SPANS_PATTERN = re.compile(r'\s+spans="[^"]*"')
+DIMENSION_PATTERN = re.compile(r'<dimension ref="([A-Z]+)(\d+)(?::([A-Z]+)(\d+))?"/>')
+ILLEGAL_CHARACTERS_PATTERN = re.compile(r"[\000-\010]|[\013-\014]|[\016-\037]")
+ERROR_CODES = frozenset(
+    {"#NULL!", "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!", "#N/A"}
+)
+MAX_CELL_TEXT_LENGTH = 32767
+
+
+def column_letter(index: int) -> str:
+    """Convert a 1-based column index to its spreadsheet letter."""
+
+    letters = ""
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def column_index(letters: str) -> int:
+    """Convert a spreadsheet column letter to its 1-based index."""
+
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - 64
+    return index
+
+
+@dataclass(frozen=True)
+class SheetPart:
+    """One worksheet part split around its ``sheetData`` element."""
+
+    path: str
+    prefix: str
+    rows: Mapping[int, str]
+    suffix: str
+    layout: SheetLayout
+    column_letters: Mapping[str, str]
+
+
+@dataclass(frozen=True)
+class XmlTemplate:
+    """Raw template parts pinned to one on-disk file version."""
+
+    path: Path
+    mtime_ns: int
+    entries: tuple[tuple[zipfile.ZipInfo, bytes], ...]
+    sheet_paths: Mapping[str, str]
+    shared_strings: tuple[str, ...]
+
+    def part_data(self, part_path: str) -> bytes:
+        """Return the raw bytes of one template part."""
+
+        return next(data for info, data in self.entries if info.filename == part_path)
+
+
+class XmlTemplateCache:
+    """Process-wide cache of raw template parts and parsed sheet layouts."""
+
+    def __init__(self) -> None:
+        """Initialize the empty cache and its lock."""
+
+        self._lock = threading.Lock()
+        self._templates: dict[Path, XmlTemplate] = {}
+        self._sheet_parts: dict[tuple[Path, int, str, int, int], SheetPart] = {}
+
+    def get_template(self, path: Path) -> XmlTemplate:
+        """Return the cached template, reloading it when the file has changed."""
+
+        mtime_ns = path.stat().st_mtime_ns
+        with self._lock:
+            template = self._templates.get(path)
+            if template is None or template.mtime_ns != mtime_ns:
+                template = self.read_template(path, mtime_ns)
+                self._templates[path] = template
+            return template
+
+    def get_sheet_part(
+        self,
+        template: XmlTemplate,
+        sheet_name: str,
+        header_row: int,
+        start_row: int,
+    ) -> SheetPart:
+        """Return a parsed worksheet part, parsing it on first use."""
+
+        key = (template.path, template.mtime_ns, sheet_name, header_row, start_row)
+        with self._lock:
+            sheet_part = self._sheet_parts.get(key)
+            if sheet_part is None:
+                sheet_part = self.parse_sheet_part(
+                    template,
+                    sheet_name,
+                    header_row,
+                    start_row,
+                )
+                self._sheet_parts[key] = sheet_part
+            return sheet_part
+
+    def clear(self) -> None:
+        """Drop every cached template and sheet layout."""
+
+        with self._lock:
+            self._templates.clear()
+            self._sheet_parts.clear()
+
+    @staticmethod
+    def read_template(path: Path, mtime_ns: int) -> XmlTemplate:
+        """Read every zip entry and resolve sheet names to part paths."""
+
+        with zipfile.ZipFile(path) as archive:
+            entries = tuple(
+                (info, archive.read(info.filename)) for info in archive.infolist()
+            )
+        parts = {info.filename: data for info, data in entries}
+        return XmlTemplate(
+            path=path,
+            mtime_ns=mtime_ns,
+            entries=entries,
+            sheet_paths=XmlTemplateCache.parse_sheet_paths(parts),
+            shared_strings=XmlTemplateCache.parse_shared_strings(
+                parts.get("xl/sharedStrings.xml")
+            ),
+        )
+
+    @staticmethod
+    def parse_sheet_paths(parts: Mapping[str, bytes]) -> dict[str, str]:
+        """Map visible sheet names to their worksheet part paths."""
+
+        relationships = ElementTree.fromstring(parts["xl/_rels/workbook.xml.rels"])
+        targets = {
+            relationship.attrib["Id"]: relationship.attrib["Target"]
+            for relationship in relationships.iter(
+                f"{{{PACKAGE_RELATIONSHIP_NS}}}Relationship"
+            )
+        }
+        workbook = ElementTree.fromstring(parts["xl/workbook.xml"])
+        sheet_paths: dict[str, str] = {}
+        for sheet in workbook.iter(f"{{{SPREADSHEET_NS}}}sheet"):
+            target = targets[sheet.attrib[f"{{{RELATIONSHIP_NS}}}id"]]
+            if target.startswith("/"):
+                sheet_path = target.lstrip("/")
+            else:
+                sheet_path = posixpath.normpath(posixpath.join("xl", target))
+            sheet_paths[sheet.attrib["name"]] = sheet_path
+        return sheet_paths
+
+    @staticmethod
+    def parse_shared_strings(data: bytes | None) -> tuple[str, ...]:
+        """Return the shared-string table as plain text values."""
+
+        if data is None:
+            return ()
+        root = ElementTree.fromstring(data)
+        return tuple(
+            XmlTemplateCache.rich_text(item)
+            for item in root.iter(f"{{{SPREADSHEET_NS}}}si")
+        )
+
+    @staticmethod
+    def rich_text(item: ElementTree.Element) -> str:
+        """Return the visible text of a shared-string or inline-string item."""
+
+        plain_text = item.find(f"{{{SPREADSHEET_NS}}}t")
+        if plain_text is not None:
+            return plain_text.text or ""
+        return "".join(
+            run.text or ""
+            for run in item.findall(f"{{{SPREADSHEET_NS}}}r/{{{SPREADSHEET_NS}}}t")
+        )
+
+    @staticmethod
+    def parse_sheet_part(
+        template: XmlTemplate,
+        sheet_name: str,
+        header_row: int,
+        start_row: int,
+    ) -> SheetPart:
+        """Split a worksheet part into reusable rows and surrounding markup."""
+
+        part_path = template.sheet_paths[sheet_name]
+        xml_text = template.part_data(part_path).decode("utf-8")
+
+        data_start = xml_text.index("<sheetData")
+        data_open_end = xml_text.index(">", data_start) + 1
+        if xml_text[data_open_end - 2] == "/":
+            prefix = xml_text[: data_open_end - 2] + ">"
+            body = ""
+            suffix = "</sheetData>" + xml_text[data_open_end:]
+        else:
+            data_end = xml_text.index("</sheetData>", data_open_end)
+            prefix = xml_text[:data_open_end]
+            body = xml_text[data_open_end:data_end]
+            suffix = xml_text[data_end:]
+
+        rows = {
+            int(match.group(1)): match.group(0) for match in ROW_PATTERN.finditer(body)
+        }
+        layout = SheetLayout.from_header_cells(
+            sheet_name,
+            header_row,
+            start_row,
+            XmlTemplateCache.parse_row_headers(
+                rows.get(header_row, ""),
+                template.shared_strings,
+            ),
+        )
+        return SheetPart(
+            path=part_path,
+            prefix=prefix,
+            rows=rows,
+            suffix=suffix,
+            layout=layout,
+            column_letters={
+                header: column_letter(column)
+                for header, column in layout.columns.items()
+            },
+        )
+
+    @staticmethod
+    def parse_row_headers(
+        row_xml: str,
+        shared_strings: Sequence[str],
+    ) -> list[tuple[int, str | None]]:
+        """Return ``(column index, header text)`` pairs for a header row."""
+
+        if not row_xml:
+            return []
+        row = ElementTree.fromstring(
+            row_xml.replace("<row ", f'<row xmlns="{SPREADSHEET_NS}" ', 1)
+        )
+        headers: list[tuple[int, str | None]] = []
+        for cell in row.iter(f"{{{SPREADSHEET_NS}}}c"):
+            cell_type = cell.attrib.get("t")
+            value: str | None
+            if cell_type == "s":
+                value_node = cell.find(f"{{{SPREADSHEET_NS}}}v")
+                value = (
+                    shared_strings[int(value_node.text)]
+                    if value_node is not None and value_node.text
+                    else None
+                )
+            elif cell_type == "inlineStr":
+                inline_string = cell.find(f"{{{SPREADSHEET_NS}}}is")
+                value = (
+                    XmlTemplateCache.rich_text(inline_string)
+                    if inline_string is not None
+                    else None
+                )
+            else:
+                value_node = cell.find(f"{{{SPREADSHEET_NS}}}v")
+                value = value_node.text if value_node is not None else None
+            letters = re.sub(r"\d+", "", cell.attrib["r"])
+            headers.append((column_index(letters), value))
+        return headers
+
+
+xml_template_cache = XmlTemplateCache()
+
+
+class XmlPatchExcelWriter(ExcelWriter):
+    """Write generated data by streaming row XML into the template zip.
+
+    Every part that is not a target sheet is copied byte-for-byte; target sheets
+    keep their markup and only get new cells merged into the data rows.
+    """
+
+    def preload_template(self) -> None:
+        """Read and cache the template zip ahead of the first write."""
+
+        xml_template_cache.get_template(self.template_filename)
+
+    def write_workbook(self, sheets: Sequence[SheetRows], output_path: Path) -> None:
+        """Copy the template zip and patch the rows of the target sheets."""
+
+        template = xml_template_cache.get_template(self.template_filename)
+        patched_parts: dict[str, bytes] = {}
+        for sheet in sheets:
+            sheet_part = xml_template_cache.get_sheet_part(
+                template,
+                sheet.sheet_name,
+                sheet.header_row,
+                sheet.start_row,
+            )
+            if sheet_part.path in patched_parts:
+                raise ValueError(f"Sheet {sheet.sheet_name} was written twice.")
+            patched_parts[sheet_part.path] = self.render_sheet(sheet_part, sheet)
+
+        with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for info, data in template.entries:
+                archive.writestr(
+                    self.clone_zip_info(info),
+                    patched_parts.get(info.filename, data),
+                )
+
+    @staticmethod
+    def clone_zip_info(info: zipfile.ZipInfo) -> zipfile.ZipInfo:
+        """Return a fresh entry header so shared cached headers stay untouched."""
+
+        clone = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+        clone.compress_type = info.compress_type
+        clone.create_system = info.create_system
+        clone.external_attr = info.external_attr
+        return clone
+
+    def render_sheet(self, sheet_part: SheetPart, sheet: SheetRows) -> bytes:
+        """Return worksheet XML with the given rows merged into the template."""
+
+        sheet_part.layout.check_keys(sheet.rows)
+        letters = sheet_part.column_letters
+        block_cells: dict[int, list[tuple[str, Any]]] = {}
+        rows = dict(sheet_part.rows)
+        for row_number, row_data in enumerate(sheet.rows, start=sheet.start_row):
+            *shared_blocks, own_block = row_blocks(row_data)
+            cells: list[tuple[str, Any]] = []
+            for block in shared_blocks:
+                translated = block_cells.get(id(block))
+                if translated is None:
+                    translated = [(letters[key], value) for key, value in block.items()]
+                    block_cells[id(block)] = translated
+                cells.extend(translated)
+            cells.extend((letters[key], value) for key, value in own_block.items())
+            rows[row_number] = self.merge_row(row_number, rows.get(row_number), cells)
+
+        body = "".join(rows[row_number] for row_number in sorted(rows))
+        prefix = self.update_dimension(sheet_part.prefix, max(rows, default=0))
+        return (prefix + body + sheet_part.suffix).encode("utf-8")
+
+    @classmethod
+    def merge_row(
+        cls,
+        row_number: int,
+        row_xml: str | None,
+        values: Iterable[tuple[str, Any]],
+    ) -> str:
+        """Merge new cell values into an existing or new ``<row>`` element.
+
+        ``values`` are ``(column letters, value)`` pairs; a later pair for the
+        same column replaces an earlier one.
+        """
+
+        existing_cells: dict[str, tuple[str, str]] = {}
+        attributes = f' r="{row_number}"'
+        if row_xml is not None:
+            attributes_match = ROW_ATTRIBUTES_PATTERN.match(row_xml)
+            if attributes_match is not None:
+                attributes = SPANS_PATTERN.sub("", attributes_match.group(1))
+            for cell_match in CELL_PATTERN.finditer(row_xml):
+                existing_cells[cell_match.group(2)] = (
+                    cell_match.group(0),
+                    cell_match.group(1) + cell_match.group(3),
+                )
+
+        cells: dict[str, str] = {
+            letters: cell_xml for letters, (cell_xml, _) in existing_cells.items()
+        }
+        for letters, value in values:
+            cell_attributes = existing_cells.get(letters, ("", ""))[1]
+            style_match = STYLE_PATTERN.search(cell_attributes)
+            style = f' s="{style_match.group(1)}"' if style_match else ""
+            cell_xml = cls.render_cell(f"{letters}{row_number}", style, value)
+            if cell_xml is None:
+                cells.pop(letters, None)
+            else:
+                cells[letters] = cell_xml
+
+        ordered_cells = "".join(
+            cells[letters] for letters in sorted(cells, key=column_index)
+        )
+        return f"<row{attributes}>{ordered_cells}</row>"
+
+    @staticmethod
+    def render_cell(reference: str, style: str, value: Any) -> str | None:
+        """Render one cell value as worksheet XML.
+
+        Types are inferred as openpyxl does: strings starting with ``=`` become
+        formulas, Excel error codes become error cells and numbers keep 16
+        significant digits. Non-finite numbers are rejected.
+        """
+
+        if value is None or value == "":
+            return f'<c r="{reference}"{style}/>' if style else None
+        if isinstance(value, bool):
+            return f'<c r="{reference}"{style} t="b"><v>{int(value)}</v></c>'
+        if isinstance(value, (int, float)):
+            if not math.isfinite(value):
+                raise ValueError(
+                    f"Cell {reference} holds {value}, which cannot be saved."
+                )
+            return f'<c r="{reference}"{style}><v>{value:.16g}</v></c>'
+        if isinstance(value, str):
+            value = value[:MAX_CELL_TEXT_LENGTH]
+            if ILLEGAL_CHARACTERS_PATTERN.search(value):
+                raise ValueError(
+                    f"Cell {reference} contains characters that cannot be saved."
+                )
+            if len(value) > 1 and value.startswith("="):
+                return f'<c r="{reference}"{style}><f>{escape(value[1:])}</f><v/></c>'
+            if value in ERROR_CODES:
+                return f'<c r="{reference}"{style} t="e"><v>{escape(value)}</v></c>'
+            return (
+                f'<c r="{reference}"{style} t="inlineStr"><is>'
+                f'<t xml:space="preserve">{escape(value)}</t></is></c>'
+            )
+        raise TypeError(
+            f"Unsupported cell value type for {reference}: {type(value).__name__}"
+        )
+
+    @staticmethod
+    def update_dimension(prefix: str, last_row: int) -> str:
+        """Extend the sheet dimension so it covers every written row."""
+
+        match = DIMENSION_PATTERN.search(prefix)
+        if match is None or last_row == 0:
+            return prefix
+        first_column, first_row, last_column, dimension_last_row = match.groups()
+        if last_column is None:
+            last_column, dimension_last_row = first_column, first_row
+        if last_row <= int(dimension_last_row):
+            return prefix
+        return (
+            prefix[: match.start()]
+            + f'<dimension ref="{first_column}{first_row}:{last_column}{last_row}"/>'
+            + prefix[match.end() :]
+        )
@@ -0,0 +1,81 @@
+"""Combined Gemini suggestions built from canned JSON answers."""
+
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from app.gemini import GeminiClient, GeminiUserError, ListingContentSuggestion
+from app.response_cache import GeminiResponseCache
+
+FULL_ANSWER = {
+    "title": "Fern Leaf Wall Decal",
+    "keyword": "fern wall decal",
+    "marketing_copy": "Bold botanical wall decal for calm living rooms.",
+    "feature_bullet_1": "Peels off cleanly",
+    "feature_bullet_2": "Printed on matte vinyl",
+    "feature_bullet_3": "Fits smooth walls",
+    "feature_bullet_4": "Cut to order",
+    "feature_bullet_5": "Ships rolled",
+}
+
+
+def suggest(answer: dict[str, Any], tmp_path: Path) -> ListingContentSuggestion:
+    """Run ``suggest_listing_content`` with a fixed image and Gemini answer."""
+
+    client = GeminiClient(
+        api_key="test-key",
+        response_cache=GeminiResponseCache(
+            tmp_path, ttl_seconds=60, max_bytes=1024 * 1024
+        ),
+    )
+
+    async def download_image(image_url: str) -> tuple[bytes, str]:
+        """Return a stand-in image."""
+
+        return b"image", "image/jpeg"
+
+    async def generate_json(parts: list[Any], fresh: bool = False) -> dict[str, Any]:
+        """Return the canned answer."""
+
+        return dict(answer)
+
+    client.download_image = download_image  # type: ignore[method-assign]
+    client.generate_json = generate_json  # type: ignore[method-assign]
+    return asyncio.run(
+        client.suggest_listing_content("https://example.com/fern.jpg", "decals")
+    )
+
+
+def test_complete_answer_includes_marketing_texts(tmp_path: Path) -> None:
+    """A complete answer fills the title, keyword and marketing texts."""
+
+    suggestion = suggest(FULL_ANSWER, tmp_path)
+
+    assert suggestion.title == "Fern Leaf Wall Decal"
+    assert suggestion.keyword == "fern wall decal"
+    assert suggestion.marketing_texts is not None
+    assert suggestion.marketing_texts.feature_bullet_5 == "Ships rolled"
+
+
+@pytest.mark.parametrize("missing", ["marketing_copy", "feature_bullet_3"])
+def test_incomplete_marketing_texts_keep_title_and_keyword(
+    tmp_path: Path, missing: str
+) -> None:
+    """A missing marketing field leaves the texts for a later request."""
+
+    answer = {key: value for key, value in FULL_ANSWER.items() if key != missing}
+    suggestion = suggest(answer, tmp_path)
+
+    assert suggestion.title == "Fern Leaf Wall Decal"
+    assert suggestion.keyword == "fern wall decal"
+    assert suggestion.marketing_texts is None
+
+
+def test_missing_keyword_still_fails(tmp_path: Path) -> None:
+    """Without a keyword there is nothing to suggest."""
+
+    answer = {key: value for key, value in FULL_ANSWER.items() if key != "keyword"}
+    with pytest.raises(GeminiUserError):
+        suggest(answer, tmp_path)
@@ -0,0 +1,67 @@
+"""Background export queue bookkeeping."""
+
+import asyncio
+
+from app.jobs import ExportJobQueue, ExportJobRecord, ExportJobStatus
+from data.listing import ListingSpec
+
+SPEC = ListingSpec(
+    print_type="decals",
+    title="Fern",
+    keyword="fern decal",
+    sku="SKU001",
+    image_links=("https://example.com/fern.jpg",),
+    sizes=((10, 14),),
+)
+
+
+def run_jobs(
+    count: int, max_finished: int, fail_every: int = 0
+) -> tuple[ExportJobQueue, list[ExportJobRecord]]:
+    """Run ``count`` jobs to completion and return the queue and evicted jobs."""
+
+    evicted: list[ExportJobRecord] = []
+
+    async def runner(record: ExportJobRecord) -> None:
+        """Finish at once, failing every ``fail_every``-th job."""
+
+        if fail_every and record.job.job_id % fail_every == 0:
+            raise RuntimeError("failed")
+
+    async def run() -> ExportJobQueue:
+        """Submit every job and wait for all of them."""
+
+        queue = ExportJobQueue(
+            runner,
+            on_update=lambda record: None,
+            max_finished=max_finished,
+            on_evict=evicted.append,
+        )
+        for index in range(count):
+            queue.submit(SPEC, f"/tmp/out-{index}")
+        await asyncio.gather(*queue.tasks)
+        return queue
+
+    return asyncio.run(run()), evicted
+
+
+def test_finished_jobs_are_capped() -> None:
+    """Only the newest finished jobs are kept; older ones are evicted."""
+
+    queue, evicted = run_jobs(count=7, max_finished=3, fail_every=2)
+
+    assert [record.job.job_id for record in queue.records] == [5, 6, 7]
+    assert [record.job.job_id for record in evicted] == [1, 2, 3, 4]
+    assert {record.status for record in evicted} == {
+        ExportJobStatus.DONE,
+        ExportJobStatus.FAILED,
+    }
+
+
+def test_jobs_within_the_cap_are_kept() -> None:
+    """Nothing is evicted while the finished jobs fit the cap."""
+
+    queue, evicted = run_jobs(count=3, max_finished=3)
+
+    assert len(queue.records) == 3
+    assert evicted == []
@@ -0,0 +1,38 @@
+"""CSV and JSON manifests for headless batch generation."""
+
+import pytest
+
+from data.manifest import ManifestError, parse_csv_manifest
+
+HEADER = "print_type,title,sku,keyword,image_links,sizes\r\n"
+
+
+def test_quoted_cells_may_span_lines() -> None:
+    """Line breaks inside quoted cells stay part of the cell."""
+
+    text = (
+        HEADER
+        + 'decals,"Fern Leaf\nWall Decal",SKU001,"fern decal\r\nbotanical",'
+        + "https://example.com/fern.jpg,10x14;22x24\r\n"
+        + "wallpapers,Ocean Mural,SKU002,ocean mural,https://example.com/sea.jpg,50x75\r\n"
+    )
+
+    specs = parse_csv_manifest(text)
+
+    assert [spec.sku for spec in specs] == ["SKU001", "SKU002"]
+    assert specs[0].title == "Fern Leaf\nWall Decal"
+    assert specs[0].keyword == "fern decal\r\nbotanical"
+    assert specs[0].sizes == ((10, 14), (22, 24))
+
+
+def test_errors_name_the_line_a_row_starts_on() -> None:
+    """Rows after a multi-line cell are reported by their own first line."""
+
+    text = (
+        HEADER
+        + 'decals,"Fern\nLeaf\nDecal",SKU001,fern decal,https://example.com/a.jpg,10x14\n'
+        + "posters,Ocean,SKU002,ocean,https://example.com/b.jpg,10x14\n"
+    )
+
+    with pytest.raises(ManifestError, match="Entry 5:"):
+        parse_csv_manifest(text)
@@ -0,0 +1,59 @@
+"""Unique workbook paths for exports of the same SKU."""
+
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from data.excel_writer import ExcelWriter, SheetRows
+from data.factory import DataShaperFactory
+
+
+def write_decal(folder: Path) -> Path:
+    """Shape and save a one-size decal listing for ``SKU001``."""
+
+    shaper = DataShaperFactory.create_shaper("decals")
+    shaper.add_record(
+        title="Fern Decal",
+        keyword="fern decal",
+        sku="SKU001",
+        image_links=["https://example.com/fern.jpg"],
+        height=14,
+        width=10,
+        price=12.5,
+        color_choice="no",
+        personalization_choice="No",
+    )
+    return shaper.write_file("SKU001", folder)
+
+
+def test_same_minute_exports_get_distinct_paths(tmp_path: Path) -> None:
+    """Concurrent exports of one SKU never share an output file."""
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        paths = list(executor.map(write_decal, [tmp_path] * 4))
+
+    assert len(set(paths)) == 4
+    assert all(path.stat().st_size > 0 for path in paths)
+    stems = sorted(path.stem for path in paths)
+    assert stems[1:] == [f"{stems[0]}_{counter}" for counter in range(2, 5)]
+
+
+def test_failed_write_releases_its_path(tmp_path: Path) -> None:
+    """A write that fails leaves no empty placeholder behind."""
+
+    class FailingWriter(ExcelWriter):
+        """Writer whose workbook step always fails."""
+
+        def write_workbook(
+            self, sheets: Sequence[SheetRows], output_path: Path
+        ) -> None:
+            """Fail before anything is written."""
+
+            raise OSError("disk full")
+
+    writer = FailingWriter("Decals")
+    with pytest.raises(OSError):
+        writer.write_new_workbook([], "SKU001", tmp_path)
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,151 @@
+"""Revalidation of the on-disk price cache against a local HTTP stand-in."""
+
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import threading
+
+import pytest
+
+from data.price_cache import CachedPriceProvider, PriceCacheStore
+
+PRICE_SHEET_CSV = """Category,Type / Material,Width,Length,Base cost
+Decals,Printed,10,14,$20.00
+,,22,24,$35.00
+,,55,22,$60.00
+,Plottered,10,14,$25.00
+,,22,24,$40.00
+Wallpapers,Peel-n-Stick/Non-Woven,8,10,$15.00
+,,50,75,$120.00
+,,100,144,"$1,200.00"
+,Peel-n-Stick: Canvas,8,10,$18.00
+,,100,144,"$1,500.00"
+,Non-Woven: Premium,8,10,$20.00
+,,100,144,"$1,600.00"
+"""
+
+
+class PriceSheetServer(ThreadingHTTPServer):
+    """Serve one price sheet and honour ``If-None-Match`` when asked to."""
+
+    def __init__(self) -> None:
+        """Bind to a free local port with the default sheet."""
+
+        super().__init__(("127.0.0.1", 0), PriceSheetHandler)
+        self.csv_text = PRICE_SHEET_CSV
+        self.etag: str | None = '"v1"'
+        self.request_headers: list[dict[str, str]] = []
+
+    @property
+    def url(self) -> str:
+        """Return the sheet URL."""
+
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}/prices.csv"
+
+
+class PriceSheetHandler(BaseHTTPRequestHandler):
+    """Answer sheet requests with 200 or, for a matching ETag, 304."""
+
+    server: PriceSheetServer
+
+    def do_GET(self) -> None:
+        """Record the request headers and send the current sheet."""
+
+        self.server.request_headers.append(dict(self.headers))
+        etag = self.server.etag
+        if etag is not None and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        body = self.server.csv_text.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv")
+        self.send_header("Content-Length", str(len(body)))
+        if etag is not None:
+            self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Keep the test output quiet."""
+
+
+@pytest.fixture
+def server() -> Iterator[PriceSheetServer]:
+    """Run the price sheet stand-in on a background thread."""
+
+    price_server = PriceSheetServer()
+    thread = threading.Thread(target=price_server.serve_forever, daemon=True)
+    thread.start()
+    yield price_server
+    price_server.shutdown()
+    price_server.server_close()
+
+
+@pytest.fixture
+def provider(server: PriceSheetServer, tmp_path: Path) -> CachedPriceProvider:
+    """Return a provider that has downloaded and cached the sheet once."""
+
+    price_provider = CachedPriceProvider(
+        server.url, PriceCacheStore(tmp_path / "price_cache.json")
+    )
+    price_provider.load_price_table()
+    return price_provider
+
+
+def test_not_modified_keeps_table(
+    server: PriceSheetServer, provider: CachedPriceProvider
+) -> None:
+    """A 304 answer keeps the active table and reports no change."""
+
+    table = provider.price_table
+    assert provider.revalidate() is False
+    assert provider.price_table is table
+    assert server.request_headers[-1]["If-None-Match"] == '"v1"'
+
+
+def test_changed_sheet_is_installed(
+    server: PriceSheetServer, provider: CachedPriceProvider, tmp_path: Path
+) -> None:
+    """A 200 answer with new prices swaps in and saves the new table."""
+
+    server.csv_text = PRICE_SHEET_CSV.replace("$20.00", "$21.00", 1)
+    server.etag = '"v2"'
+
+    assert provider.revalidate() is True
+    assert provider.get_decal_price(10, 14, "no") == 21.0
+    saved_entry = PriceCacheStore(tmp_path / "price_cache.json").load()
+    assert saved_entry is not None
+    assert saved_entry.etag == '"v2"'
+
+
+def test_unchanged_full_response_keeps_table(
+    server: PriceSheetServer, provider: CachedPriceProvider
+) -> None:
+    """A 200 answer with the same prices is not reported as a change."""
+
+    server.etag = None
+    table = provider.price_table
+    fetched_at = provider.fetched_at
+
+    assert provider.revalidate() is False
+    assert provider.price_table is table
+    assert provider.fetched_at is not None and fetched_at is not None
+    assert provider.fetched_at >= fetched_at
+
+
+def test_startup_uses_disk_copy(
+    server: PriceSheetServer, provider: CachedPriceProvider, tmp_path: Path
+) -> None:
+    """A new provider prices from the disk copy without a request."""
+
+    requests_before = len(server.request_headers)
+    restarted = CachedPriceProvider(
+        server.url, PriceCacheStore(tmp_path / "price_cache.json")
+    )
+
+    assert restarted.get_decal_price(10, 14, "no") == 20.0
+    assert restarted.loaded_from_disk is True
+    assert len(server.request_headers) == requests_before
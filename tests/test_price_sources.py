@@ -0,0 +1,93 @@
+"""Local price files, including ones caught in the middle of a save."""
+
+from collections.abc import Callable
+import csv
+from pathlib import Path
+import zipfile
+
+from openpyxl import Workbook
+import pytest
+
+from data.price_sources import FilePriceSource
+from data.pricing import PriceProvider, PriceSourceError
+
+PRICE_ROWS = [
+    ["Category", "Type / Material", "Width", "Length", "Base cost"],
+    ["Decals", "Printed", "10", "14", "$20.00"],
+    ["", "", "22", "24", "$35.00"],
+    ["", "Plottered", "10", "14", "$25.00"],
+    ["", "", "22", "24", "$40.00"],
+    ["Wallpapers", "Peel-n-Stick/Non-Woven", "8", "10", "$15.00"],
+    ["", "", "100", "144", "$1,200.00"],
+    ["", "Peel-n-Stick: Canvas", "8", "10", "$18.00"],
+    ["", "", "100", "144", "$1,500.00"],
+    ["", "Non-Woven: Premium", "8", "10", "$20.00"],
+    ["", "", "100", "144", "$1,600.00"],
+]
+
+
+def save_price_workbook(path: Path) -> None:
+    """Save the price rows as the first sheet of a workbook."""
+
+    wb = Workbook()
+    for row in PRICE_ROWS:
+        wb.active.append(row)
+    wb.save(path)
+
+
+def truncate_file(path: Path) -> None:
+    """Cut the workbook file in half, as a partly copied file would be."""
+
+    data = path.read_bytes()
+    path.write_bytes(data[: len(data) // 2])
+
+
+def truncate_sheet_xml(path: Path) -> None:
+    """Keep a valid zip but cut the worksheet XML in half."""
+
+    with zipfile.ZipFile(path) as source:
+        parts = [(info, source.read(info.filename)) for info in source.infolist()]
+    with zipfile.ZipFile(path, "w") as target:
+        for info, data in parts:
+            if info.filename == "xl/worksheets/sheet1.xml":
+                data = data[: len(data) // 2]
+            target.writestr(info, data)
+
+
+def test_workbook_is_read_as_csv(tmp_path: Path) -> None:
+    """A complete workbook yields the sheet as CSV rows."""
+
+    path = tmp_path / "prices.xlsx"
+    save_price_workbook(path)
+
+    rows = list(csv.reader(FilePriceSource(path).read_csv().splitlines()))
+    assert rows == PRICE_ROWS
+
+
+@pytest.mark.parametrize("corrupt", [truncate_file, truncate_sheet_xml])
+def test_corrupt_workbook_raises_price_source_error(
+    tmp_path: Path, corrupt: Callable[[Path], None]
+) -> None:
+    """Half-written workbooks are reported as a price source error."""
+
+    path = tmp_path / "prices.xlsx"
+    save_price_workbook(path)
+    corrupt(path)
+
+    with pytest.raises(PriceSourceError):
+        FilePriceSource(path).read_csv()
+
+
+def test_background_refresh_keeps_table_after_corrupt_save(tmp_path: Path) -> None:
+    """A corrupt save during a hot reload keeps the previous prices."""
+
+    path = tmp_path / "prices.xlsx"
+    save_price_workbook(path)
+    provider = PriceProvider(source=FilePriceSource(path))
+    table = provider.get_price_table()
+
+    truncate_sheet_xml(path)
+    provider.run_background_refresh()
+
+    assert provider.price_table is table
+    assert isinstance(provider.last_refresh_error, PriceSourceError)
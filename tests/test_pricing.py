@@ -0,0 +1,110 @@
+"""Batch price lookups against the one-size-at-a-time path."""
+
+from pathlib import Path
+
+import pytest
+
+from data.price_sources import FilePriceSource
+from data.pricing import (
+    WALLPAPER_TYPE_TO_PRICE_GROUP,
+    PriceGroupIndex,
+    PricePoint,
+    PriceProvider,
+    PriceSourceError,
+)
+
+POINTS = [
+    PricePoint("Printed", 10, 14, 20.0),
+    PricePoint("Printed", 22, 24, 35.37),
+    PricePoint("Printed", 24, 22, 36.0),
+    PricePoint("Printed", 12, 44, 41.5),
+    PricePoint("Printed", 55, 22, 60.125),
+    PricePoint("Printed", 11, 110, 61.0),
+    PricePoint("Printed", 100, 144, 1200.0),
+]
+PRICE_SHEET_CSV = """Category,Type / Material,Width,Length,Base cost
+Decals,Printed,10,14,$20.00
+,,22,24,$35.00
+,,55,22,$60.00
+,Plottered,10,14,$25.00
+,,22,24,$40.00
+Wallpapers,Peel-n-Stick/Non-Woven,8,10,$15.00
+,,50,75,$120.00
+,,100,144,"$1,200.00"
+,Peel-n-Stick: Canvas,8,10,$18.00
+,,100,144,"$1,500.00"
+,Non-Woven: Premium,8,10,$20.00
+,,100,144,"$1,600.00"
+"""
+
+
+def bits(prices: list[float]) -> list[str]:
+    """Return each price's exact binary value."""
+
+    return [price.hex() for price in prices]
+
+
+def assert_matches_single_lookups(
+    index: PriceGroupIndex, sizes: list[tuple[int, int]]
+) -> None:
+    """Check that the batch lookup equals ``price_for`` bit for bit."""
+
+    widths = [width for width, _ in sizes]
+    heights = [height for _, height in sizes]
+    expected = [index.price_for(width, height) for width, height in sizes]
+    assert bits(index.prices_for(widths, heights)) == bits(expected)
+
+
+def test_batch_matches_every_table_point() -> None:
+    """Sheet sizes, in both orientations, return their exact prices."""
+
+    index = PriceGroupIndex.from_points(POINTS)
+    sizes = [(point.width, point.height) for point in POINTS]
+    sizes += [(height, width) for width, height in sizes]
+    assert_matches_single_lookups(index, sizes)
+
+
+def test_batch_matches_interpolated_sizes() -> None:
+    """Sizes between, below, above and on tied areas match ``price_for``."""
+
+    index = PriceGroupIndex.from_points(POINTS)
+    sizes = [(width, height) for width in range(1, 160) for height in range(1, 160)]
+    assert_matches_single_lookups(index, sizes)
+
+
+def test_batch_with_single_price_point() -> None:
+    """A one-row group prices every size at that row's price."""
+
+    index = PriceGroupIndex.from_points([PricePoint("Printed", 10, 10, 19.999)])
+    assert_matches_single_lookups(index, [(1, 1), (10, 10), (5, 40), (30, 30)])
+
+
+def test_batch_rejects_bad_input() -> None:
+    """Mismatched lengths and empty groups raise like the single lookup."""
+
+    index = PriceGroupIndex.from_points(POINTS)
+    assert index.prices_for([], []) == []
+    with pytest.raises(ValueError):
+        index.prices_for([10, 20], [10])
+    with pytest.raises(PriceSourceError):
+        PriceGroupIndex.from_points([]).prices_for([10], [10])
+
+
+def test_wallpaper_price_matrix_matches_single_lookups(tmp_path: Path) -> None:
+    """The provider's price matrix equals one lookup per size and material."""
+
+    price_file = tmp_path / "prices.csv"
+    price_file.write_text(PRICE_SHEET_CSV, encoding="utf-8")
+    provider = PriceProvider(source=FilePriceSource(price_file))
+    sizes = [(width, height) for width in range(6, 150, 7) for height in (10, 75, 144)]
+
+    matrix = provider.get_wallpaper_price_matrix(
+        [width for width, _ in sizes], [height for _, height in sizes]
+    )
+    assert set(matrix) == set(WALLPAPER_TYPE_TO_PRICE_GROUP)
+    for material, prices in matrix.items():
+        expected = [
+            provider.get_wallpaper_prices(width, height)[material]
+            for width, height in sizes
+        ]
+        assert bits(prices) == bits(expected)
@@ -0,0 +1,488 @@
+"""Retry backoff, retryable errors, deadlines and token refill.
+
+The retry loop runs against scripted SDK errors and a local Gemini stand-in.
+"""
+
+import asyncio
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from pathlib import Path
+import threading
+from types import SimpleNamespace
+from typing import Any, cast
+
+from google import genai
+from google.genai import errors, types
+import httpx
+import pytest
+
+from app.gemini import GeminiClient, GeminiUserError
+from app.rate_limit import RetryPolicy, TokenBucket
+from app.response_cache import GeminiResponseCache
+from data.models import MarketingTexts
+
+MARKETING_TEXTS = {
+    "marketing_copy": "Bold botanical wall decal for calm living rooms.",
+    "feature_bullet_1": "Peels off cleanly",
+    "feature_bullet_2": "Printed on matte vinyl",
+    "feature_bullet_3": "Fits smooth walls",
+    "feature_bullet_4": "Cut to order",
+    "feature_bullet_5": "Ships rolled",
+}
+
+
+class FakeGeminiServer(ThreadingHTTPServer):
+    """Local Gemini stand-in that answers with a scripted list of statuses."""
+
+    def __init__(self, statuses: list[int]) -> None:
+        """Bind to a free local port; every status after the script is 200."""
+
+        super().__init__(("127.0.0.1", 0), FakeGeminiHandler)
+        self.statuses = statuses
+        self.response_delay = 0.0
+        self.released = threading.Event()
+        self.requests: list[tuple[str, dict[str, str]]] = []
+
+    @property
+    def url(self) -> str:
+        """Return the base URL to point the SDK at."""
+
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+
+class FakeGeminiHandler(BaseHTTPRequestHandler):
+    """Answer ``generateContent`` calls with errors or a marketing text reply."""
+
+    server: FakeGeminiServer
+
+    def do_POST(self) -> None:
+        """Record the request and send the next scripted answer."""
+
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.requests.append((self.path, dict(self.headers)))
+        if self.server.response_delay:
+            self.server.released.wait(self.server.response_delay)
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        if status == 200:
+            payload: dict[str, Any] = {
+                "candidates": [
+                    {
+                        "content": {
+                            "role": "model",
+                            "parts": [{"text": json.dumps(MARKETING_TEXTS)}],
+                        }
+                    }
+                ]
+            }
+        else:
+            payload = {
+                "error": {"code": status, "message": "Try later", "status": "BUSY"}
+            }
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Keep the test output quiet."""
+
+
+class FakeClock:
+    """Monotonic clock that only moves when a test advances it."""
+
+    def __init__(self) -> None:
+        """Start at time zero."""
+
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        """Return the current fake time."""
+
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        """Move the clock forward."""
+
+        self.now += seconds
+
+
+class RecordedSleep:
+    """Async sleep stand-in that records every requested delay."""
+
+    def __init__(self) -> None:
+        """Start with no recorded delays."""
+
+        self.delays: list[float] = []
+
+    async def __call__(self, seconds: float) -> None:
+        """Record the delay and return at once."""
+
+        self.delays.append(seconds)
+
+
+class ScriptedModels:
+    """Stand-in for ``client.aio.models`` that fails a set number of times."""
+
+    def __init__(self, failures: list[Exception]) -> None:
+        """Store the errors to raise before answering."""
+
+        self.failures = failures
+        self.calls = 0
+
+    async def generate_content(self, **kwargs: Any) -> str:
+        """Raise the next scripted error, then return a fixed response."""
+
+        self.calls += 1
+        if self.failures:
+            raise self.failures.pop(0)
+        return "response"
+
+
+def api_error(code: int) -> errors.APIError:
+    """Return a Gemini API error with the given HTTP status code."""
+
+    return errors.APIError(code, {"error": {"code": code, "message": "test"}})
+
+
+@pytest.fixture
+def gemini_server() -> Iterator[FakeGeminiServer]:
+    """Run the Gemini stand-in on a background thread."""
+
+    server = FakeGeminiServer([])
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.released.set()
+    server.shutdown()
+    server.server_close()
+
+
+def server_client(
+    server: FakeGeminiServer, tmp_path: Path, sleep: RecordedSleep
+) -> GeminiClient:
+    """Return a Gemini client that talks to the local stand-in."""
+
+    return GeminiClient(
+        api_key="test-key",
+        model="test-model",
+        response_cache=GeminiResponseCache(
+            tmp_path, ttl_seconds=60, max_bytes=1024 * 1024
+        ),
+        rate_limiter=TokenBucket(60, burst=10, clock=FakeClock()),
+        base_url=server.url,
+        sleep=sleep,
+    )
+
+
+@pytest.fixture
+def ceiling_jitter(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Make the jittered backoff return its ceiling."""
+
+    monkeypatch.setattr("app.rate_limit.random.uniform", lambda low, high: high)
+
+
+def generate(
+    models: ScriptedModels, max_attempts: int
+) -> tuple[RecordedSleep, TokenBucket, Any]:
+    """Run one request through the retry loop and return its waits and result.
+
+    The rate limiter has room for every attempt, so only backoff is recorded.
+    """
+
+    sleep = RecordedSleep()
+    rate_limiter = TokenBucket(60, burst=10, clock=FakeClock())
+    client = GeminiClient(
+        api_key="test",
+        rate_limiter=rate_limiter,
+        retry_policy=RetryPolicy(max_attempts=max_attempts),
+        sleep=sleep,
+    )
+    fake_client = cast(
+        genai.Client, SimpleNamespace(aio=SimpleNamespace(models=models))
+    )
+    try:
+        result: Any = asyncio.run(
+            client.generate_with_retries(
+                fake_client, "contents", types.GenerateContentConfig()
+            )
+        )
+    except Exception as exc:
+        result = exc
+    return sleep, rate_limiter, result
+
+
+@pytest.mark.usefixtures("ceiling_jitter")
+def test_backoff_doubles_up_to_max_delay() -> None:
+    """Each retry doubles the backoff ceiling until it reaches ``max_delay``."""
+
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    assert [policy.backoff_delay(attempt) for attempt in range(1, 6)] == [
+        1.0,
+        2.0,
+        4.0,
+        5.0,
+        5.0,
+    ]
+
+
+def test_backoff_jitter_stays_below_ceiling() -> None:
+    """The jittered backoff never exceeds the attempt's ceiling."""
+
+    policy = RetryPolicy(base_delay=0.5, max_delay=3.0)
+    for attempt, ceiling in [(1, 0.5), (2, 1.0), (3, 2.0), (4, 3.0), (8, 3.0)]:
+        for _ in range(50):
+            assert 0.0 <= policy.backoff_delay(attempt) <= ceiling
+
+
+@pytest.mark.parametrize(
+    ("exc", "retryable"),
+    [
+        (api_error(408), True),
+        (api_error(429), True),
+        (api_error(500), True),
+        (api_error(503), True),
+        (api_error(400), False),
+        (api_error(403), False),
+        (api_error(404), False),
+        (httpx.ConnectError("refused"), True),
+        (httpx.ReadTimeout("slow"), True),
+        (OSError("reset"), True),
+        (ValueError("bad"), False),
+    ],
+)
+def test_retryable_and_fatal_errors(exc: Exception, retryable: bool) -> None:
+    """Transient statuses and transport errors retry; the rest are fatal."""
+
+    assert RetryPolicy().is_retryable(exc) is retryable
+
+
+def test_custom_retryable_status_codes() -> None:
+    """A policy retries exactly the status codes it is configured with."""
+
+    policy = RetryPolicy(retryable_status_codes=frozenset({409}))
+    assert policy.is_retryable(api_error(409)) is True
+    assert policy.is_retryable(api_error(503)) is False
+
+
+@pytest.mark.usefixtures("ceiling_jitter")
+def test_transient_errors_are_retried_with_backoff() -> None:
+    """Transient failures are retried after growing backoff delays."""
+
+    models = ScriptedModels([api_error(503), httpx.ConnectError("refused")])
+    sleep, rate_limiter, result = generate(models, max_attempts=4)
+
+    assert result == "response"
+    assert models.calls == 3
+    assert sleep.delays == [1.0, 2.0]
+    assert rate_limiter.tokens == 7
+
+
+def test_fatal_error_is_not_retried() -> None:
+    """A non-retryable status fails on the first attempt without waiting."""
+
+    models = ScriptedModels([api_error(400)])
+    sleep, _, result = generate(models, max_attempts=4)
+
+    assert isinstance(result, errors.APIError)
+    assert result.code == 400
+    assert models.calls == 1
+    assert sleep.delays == []
+
+
+@pytest.mark.usefixtures("ceiling_jitter")
+def test_retries_stop_at_max_attempts() -> None:
+    """The last transient failure is raised once the attempts run out."""
+
+    models = ScriptedModels([api_error(429) for _ in range(5)])
+    sleep, _, result = generate(models, max_attempts=3)
+
+    assert isinstance(result, errors.APIError)
+    assert result.code == 429
+    assert models.calls == 3
+    assert sleep.delays == [1.0, 2.0]
+
+
+@pytest.mark.usefixtures("ceiling_jitter")
+def test_server_rate_limit_and_outage_are_retried(
+    gemini_server: FakeGeminiServer, tmp_path: Path
+) -> None:
+    """A 429 and a 503 from the server are retried until the 200 answer."""
+
+    gemini_server.statuses = [429, 503]
+    sleep = RecordedSleep()
+    client = server_client(gemini_server, tmp_path, sleep)
+
+    texts = asyncio.run(
+        client.generate_marketing_texts("Fern Decal", "fern wall decal", "decals")
+    )
+
+    assert isinstance(texts, MarketingTexts)
+    assert texts.feature_bullet_1 == "Peels off cleanly"
+    assert sleep.delays == [1.0, 2.0]
+    assert len(gemini_server.requests) == 3
+    path, headers = gemini_server.requests[-1]
+    assert path.endswith("/models/test-model:generateContent")
+    assert headers["x-goog-api-key"] == "test-key"
+
+
+@pytest.mark.usefixtures("ceiling_jitter")
+def test_server_errors_surface_after_last_attempt(
+    gemini_server: FakeGeminiServer, tmp_path: Path
+) -> None:
+    """A server that stays rate limited yields the quota message."""
+
+    gemini_server.statuses = [429] * 5
+    client = server_client(gemini_server, tmp_path, RecordedSleep())
+    client.retry_policy = RetryPolicy(max_attempts=2)
+
+    with pytest.raises(GeminiUserError) as exc_info:
+        asyncio.run(client.generate_marketing_texts("Fern", "fern decal", "decals"))
+
+    assert exc_info.value.user_message == "AI limit was reached. Try again later."
+    assert len(gemini_server.requests) == 2
+
+
+def test_server_fatal_status_is_not_retried(
+    gemini_server: FakeGeminiServer, tmp_path: Path
+) -> None:
+    """A 400 from the server fails at once with the configuration message."""
+
+    gemini_server.statuses = [400]
+    sleep = RecordedSleep()
+    client = server_client(gemini_server, tmp_path, sleep)
+
+    with pytest.raises(GeminiUserError) as exc_info:
+        asyncio.run(client.generate_marketing_texts("Fern", "fern decal", "decals"))
+
+    assert "not configured correctly" in exc_info.value.user_message
+    assert len(gemini_server.requests) == 1
+    assert sleep.delays == []
+
+
+def test_request_deadline_fires(
+    gemini_server: FakeGeminiServer, tmp_path: Path
+) -> None:
+    """A server slower than the deadline ends the call with a timeout message."""
+
+    gemini_server.response_delay = 10.0
+    client = server_client(gemini_server, tmp_path, RecordedSleep())
+    client.deadline_seconds = 0.2
+
+    with pytest.raises(GeminiUserError) as exc_info:
+        asyncio.run(client.generate_marketing_texts("Fern", "fern decal", "decals"))
+
+    assert (
+        exc_info.value.user_message == "AI took too long to respond. Try again later."
+    )
+    assert len(gemini_server.requests) == 1
+
+
+def test_response_cache_runs_off_the_event_loop(
+    gemini_server: FakeGeminiServer, tmp_path: Path
+) -> None:
+    """Cache reads and writes run in worker threads, and a hit skips the server."""
+
+    client = server_client(gemini_server, tmp_path, RecordedSleep())
+    cache = client.response_cache
+    assert cache is not None
+    cache_threads: list[threading.Thread] = []
+    cache_get, cache_put = cache.get, cache.put
+
+    def recorded_get(key: str) -> dict[str, Any] | None:
+        """Note the calling thread, then read the cache."""
+
+        cache_threads.append(threading.current_thread())
+        return cache_get(key)
+
+    def recorded_put(key: str, response: dict[str, Any]) -> None:
+        """Note the calling thread, then write the cache."""
+
+        cache_threads.append(threading.current_thread())
+        cache_put(key, response)
+
+    cache.get = recorded_get  # type: ignore[method-assign]
+    cache.put = recorded_put  # type: ignore[method-assign]
+
+    for _ in range(2):
+        asyncio.run(client.generate_marketing_texts("Fern", "fern decal", "decals"))
+
+    assert len(gemini_server.requests) == 1
+    assert len(cache_threads) == 3
+    assert threading.main_thread() not in cache_threads
+
+
+def test_bucket_allows_burst_then_spaces_requests() -> None:
+    """A full bucket serves ``burst`` requests, then queues by refill time."""
+
+    bucket = TokenBucket(60, burst=2, clock=FakeClock())
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 1.0, 2.0]
+
+
+def test_bucket_refills_with_time() -> None:
+    """Tokens come back at the configured rate."""
+
+    clock = FakeClock()
+    bucket = TokenBucket(120, burst=1, clock=clock)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+    clock.advance(1.0)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+
+
+def test_bucket_refill_is_capped_at_burst() -> None:
+    """An idle bucket holds at most ``burst`` tokens."""
+
+    clock = FakeClock()
+    bucket = TokenBucket(60, burst=3, clock=clock)
+    clock.advance(600.0)
+    assert [bucket.reserve() for _ in range(4)] == [0.0, 0.0, 0.0, 1.0]
+
+
+def test_bucket_acquire_waits_through_injected_sleep() -> None:
+    """``acquire`` sleeps only when the bucket is empty."""
+
+    sleep = RecordedSleep()
+    bucket = TokenBucket(30, burst=1, clock=FakeClock(), sleep=sleep)
+
+    asyncio.run(bucket.acquire())
+    asyncio.run(bucket.acquire())
+    assert sleep.delays == [2.0]
+
+
+def test_cancelled_acquire_returns_its_token() -> None:
+    """A caller cancelled while waiting does not delay the next caller."""
+
+    clock = FakeClock()
+
+    async def never_wake(seconds: float) -> None:
+        """Wait until cancelled."""
+
+        await asyncio.Event().wait()
+
+    bucket = TokenBucket(60, burst=1, clock=clock, sleep=never_wake)
+
+    async def cancel_waiting_acquire() -> None:
+        """Drain the bucket, then cancel a caller waiting for a refill."""
+
+        await bucket.acquire()
+        waiter = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+    asyncio.run(cancel_waiting_acquire())
+    assert bucket.reserve() == 1.0
+
+
+def test_non_positive_rate_disables_limiting() -> None:
+    """A zero rate never delays a request."""
+
+    bucket = TokenBucket(0, burst=1, clock=FakeClock())
+    assert [bucket.reserve() for _ in range(5)] == [0.0] * 5
@@ -0,0 +1,253 @@
+"""Equivalence checks between the XML-patching and openpyxl writer backends."""
+
+from functools import cache
+from pathlib import Path
+from typing import Any
+import zipfile
+
+from openpyxl import load_workbook
+from openpyxl.workbook.workbook import Workbook
+from openpyxl.worksheet.formula import ArrayFormula
+import pytest
+
+from data.excel_writer import (
+    ADDITIONAL_IMAGES_SHEET,
+    HEADER_ROW,
+    MAIN_SHEET_START_ROW,
+    SheetRows,
+)
+from data.factory import DataShaperFactory
+from data.models import PriceInput
+from data.writer_factory import (
+    OPENPYXL_WRITER_BACKEND,
+    XML_WRITER_BACKEND,
+    ExcelWriterFactory,
+)
+from data.xml_writer import (
+    DIMENSION_PATTERN,
+    ROW_PATTERN,
+    XmlPatchExcelWriter,
+    XmlTemplateCache,
+)
+
+DECAL_SHEET = "3757 - Wall Stickers"
+INFERRED_VALUES: list[Any] = [
+    "=1+2",
+    '=SUM(A1:A3) & "<b>"',
+    "=",
+    "#N/A",
+    "#DIV/0!",
+    "N/A",
+    "",
+    "x" * 40000,
+    0.1 + 0.2,
+    1 / 3,
+    1e17,
+    20.0,
+    12.5,
+    3,
+    True,
+]
+TEMPLATE_PATH = Path(__file__).resolve().parent.parent / "assets" / "template.xlsx"
+IMAGE_LINKS = [f"https://example.com/image-{index}.jpg" for index in range(1, 7)]
+WALLPAPER_PRICES = {
+    "Peel-n-Stick": 10.25,
+    "Non-Woven": 11.5,
+    "Peel-n-Stick: Canvas": 12.75,
+    "Non-Woven: Premium": 14.0,
+}
+SIZES = [(10, 14), (22, 24), (55, 22)]
+LONG_SIZES = [(width, 30) for width in range(10, 32)]
+LISTINGS: dict[str, tuple[str, str, PriceInput, list[tuple[int, int]]]] = {
+    "decal": ("decals", "no", 12.5, SIZES),
+    "color-decal": ("decals", "yes", 12.5, SIZES),
+    "wallpaper": ("wallpapers", "no", WALLPAPER_PRICES, SIZES),
+    "long-color-decal": ("decals", "yes", 12.5, LONG_SIZES),
+}
+
+
+def write_listing(listing: str, writer_backend: str, folder: Path) -> Path:
+    """Shape one fixed listing and save it with the given writer backend."""
+
+    print_type, color_choice, price, sizes = LISTINGS[listing]
+    shaper = DataShaperFactory.create_shaper(print_type, writer_backend=writer_backend)
+    for width, height in sizes:
+        shaper.add_record(
+            title='Title & <Quotes> "test"',
+            keyword="Keyword",
+            sku="SKU001",
+            image_links=IMAGE_LINKS,
+            height=height,
+            width=width,
+            price=price,
+            color_choice=color_choice,
+            personalization_choice="No",
+        )
+    return shaper.write_file("SKU001", folder)
+
+
+def write_values(values: list[Any], writer_backend: str, folder: Path) -> Path:
+    """Write one ``Brand`` cell per value to the decal sheet."""
+
+    writer = ExcelWriterFactory.create_writer(DECAL_SHEET, writer_backend)
+    sheet = SheetRows(
+        DECAL_SHEET,
+        start_row=MAIN_SHEET_START_ROW,
+        header_row=HEADER_ROW,
+        rows=[{"Brand": value} for value in values],
+    )
+    return writer.write_new_workbook([sheet], "SKU001", folder)
+
+
+def comparable_value(value: Any) -> Any:
+    """Return a cell value that compares by content, array formulas included."""
+
+    if isinstance(value, ArrayFormula):
+        return ("array formula", value.ref, value.text)
+    return value
+
+
+@cache
+def open_workbook(path: Path) -> Workbook:
+    """Load a saved workbook once; the tests only read from it."""
+
+    return load_workbook(path)
+
+
+@cache
+def read_cells(path: Path) -> dict[str, list[list[Any]]]:
+    """Return every sheet's cell values, formulas included, by sheet name."""
+
+    workbook = open_workbook(path)
+    return {
+        worksheet.title: [
+            [comparable_value(cell.value) for cell in row]
+            for row in worksheet.iter_rows()
+        ]
+        for worksheet in workbook.worksheets
+    }
+
+
+def written_sheet_names(path: Path) -> set[str]:
+    """Return the sheets whose cells differ from the template."""
+
+    template_cells = read_cells(TEMPLATE_PATH)
+    return {
+        name for name, rows in read_cells(path).items() if rows != template_cells[name]
+    }
+
+
+@pytest.fixture(scope="module", params=sorted(LISTINGS))
+def exports(
+    request: pytest.FixtureRequest,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> tuple[Path, Path]:
+    """Write one listing with the openpyxl and the XML backend."""
+
+    tmp_path = tmp_path_factory.mktemp(request.param)
+    return (
+        write_listing(request.param, OPENPYXL_WRITER_BACKEND, tmp_path / "openpyxl"),
+        write_listing(request.param, XML_WRITER_BACKEND, tmp_path / "xml"),
+    )
+
+
+def test_backends_write_identical_cells(exports: tuple[Path, Path]) -> None:
+    """Both backends produce the same values and formulas on every sheet."""
+
+    openpyxl_path, xml_path = exports
+    assert read_cells(xml_path) == read_cells(openpyxl_path)
+
+
+def test_backends_write_identical_dimensions(exports: tuple[Path, Path]) -> None:
+    """Both backends report the same used range for the written sheets."""
+
+    openpyxl_path, xml_path = exports
+    openpyxl_sheets = open_workbook(openpyxl_path).worksheets
+    xml_sheets = open_workbook(xml_path).worksheets
+    assert [sheet.dimensions for sheet in xml_sheets] == [
+        sheet.dimensions for sheet in openpyxl_sheets
+    ]
+
+
+def test_xml_backend_extends_sheet_dimension(exports: tuple[Path, Path]) -> None:
+    """Each written sheet's ``<dimension>`` covers its last row.
+
+    The template pre-formats rows up to 507, so only the long listing moves
+    the main sheet's dimension past the template's own.
+    """
+
+    _, xml_path = exports
+    workbook = open_workbook(xml_path)
+    template = XmlTemplateCache.read_template(xml_path, 0)
+    for sheet_name in written_sheet_names(xml_path):
+        sheet_xml = template.part_data(template.sheet_paths[sheet_name]).decode("utf-8")
+        match = DIMENSION_PATTERN.search(sheet_xml)
+        assert match is not None
+        assert int(match.group(4)) == workbook[sheet_name].max_row
+
+
+def test_xml_backend_copies_untouched_parts(exports: tuple[Path, Path]) -> None:
+    """Every part other than the written sheets matches the template byte for byte."""
+
+    _, xml_path = exports
+    template = XmlTemplateCache.read_template(TEMPLATE_PATH, 0)
+    written_sheets = written_sheet_names(xml_path)
+    assert len(written_sheets) == 2
+    assert ADDITIONAL_IMAGES_SHEET in written_sheets
+    patched_parts = {template.sheet_paths[name] for name in written_sheets}
+
+    with zipfile.ZipFile(xml_path) as archive:
+        assert archive.namelist() == [info.filename for info, _ in template.entries]
+        for info, data in template.entries:
+            if info.filename not in patched_parts:
+                assert archive.read(info.filename) == data, info.filename
+
+
+def test_backends_infer_cell_types_alike(tmp_path: Path) -> None:
+    """Formulas, error codes, long text and numbers read back the same."""
+
+    openpyxl_path = write_values(
+        INFERRED_VALUES, OPENPYXL_WRITER_BACKEND, tmp_path / "openpyxl"
+    )
+    xml_path = write_values(INFERRED_VALUES, XML_WRITER_BACKEND, tmp_path / "xml")
+
+    assert read_cells(xml_path) == read_cells(openpyxl_path)
+    sheet = open_workbook(xml_path)[DECAL_SHEET]
+    brand_column = next(
+        cell.column for cell in sheet[HEADER_ROW] if cell.value == "Brand"
+    )
+    data_types = [
+        sheet.cell(row, brand_column).data_type
+        for row in range(MAIN_SHEET_START_ROW, MAIN_SHEET_START_ROW + 5)
+    ]
+    assert data_types == ["f", "f", "s", "e", "e"]
+
+
+@pytest.mark.parametrize("value", [float("inf"), float("-inf"), float("nan")])
+def test_xml_backend_rejects_non_finite_numbers(tmp_path: Path, value: float) -> None:
+    """Infinite and NaN values raise instead of writing an invalid sheet."""
+
+    with pytest.raises(ValueError, match="cannot be saved"):
+        write_values([value], XML_WRITER_BACKEND, tmp_path)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_rows_and_cells_match_in_any_attribute_order() -> None:
+    """Rows and cells are found when ``r`` is not their first attribute."""
+
+    sheet_data = (
+        '<row spans="1:2" r="7" ht="15"><c s="3" r="A7" t="s"><v>0</v></c>'
+        '<c r="B7" s="4"/></row><row customHeight="1" r="8"/>'
+    )
+    rows = {
+        int(match.group(1)): match.group(0)
+        for match in ROW_PATTERN.finditer(sheet_data)
+    }
+    assert sorted(rows) == [7, 8]
+
+    merged = XmlPatchExcelWriter.merge_row(7, rows[7], [("A", "Fern"), ("C", 2)])
+    assert merged == (
+        '<row r="7" ht="15">'
+        '<c r="A7" s="3" t="inlineStr"><is><t xml:space="preserve">Fern</t></is></c>'
+        '<c r="B7" s="4"/><c r="C7"><v>2</v></c></row>'
+    )